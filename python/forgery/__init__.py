@@ -13,9 +13,12 @@ Supported Locales:
     - ja_JP: Japanese (Japan)
 
 Thread Safety:
-    Each Faker instance maintains its own RNG state and is NOT thread-safe.
-    The module-level convenience functions (name(), email(), etc.) use a shared
-    global Faker instance and should not be used concurrently from multiple threads.
+    Each Faker instance keeps its own RNG state behind a lock, so it can be
+    shared between threads, but concurrent calls run one at a time: a call that
+    reaches an instance while another thread is generating a batch on it waits
+    for that batch to finish. The module-level convenience functions (name(),
+    email(), etc.) share one global Faker instance, so threads using them take
+    turns, and seeded output depends on how the threads interleave.
 
     For multi-threaded applications, create a separate Faker instance per thread:
 
@@ -27,6 +30,10 @@ Thread Safety:
     ...         thread_local.faker = Faker()
     ...     return thread_local.faker
 
+    Batch methods (names(), emails(), records(), ...) release the GIL while
+    generating batches of 64 or more items, so per-thread instances scale
+    across cores, e.g. with ThreadPoolExecutor.
+
 Example:
     >>> from forgery import fake
     >>> fake.seed(42)
@@ -43,14 +50,8 @@ Example:
     >>> german_fake.names(10)  # German names
 """
 
-from collections.abc import Coroutine
-from typing import TYPE_CHECKING, Any
-
 from forgery._forgery import Faker
 
-if TYPE_CHECKING:
-    import pyarrow
-
 __all__ = [
     "Faker",
     "add_provider",
@@ -85,15 +86,18 @@ __all__ = [
     "domain_names",
     "email",
     "emails",
+    "emails_seeded",
     "fake",
     "first_name",
     "first_names",
     "float_",
     "floats",
+    "floats_arrow",
     "free_email",
     "free_emails",
     "generate",
     "generate_batch",
+    "get_state",
     "has_provider",
     "hex_color",
     "hex_colors",
@@ -101,6 +105,10 @@ __all__ = [
     "ibans",
     "integer",
     "integers",
+    "integers_array",
+    "integers_arrow",
+    "integers_iter",
+    "integers_seeded",
     "ipv4",
     "ipv4s",
     "ipv6",
@@ -116,6 +124,8 @@ __all__ = [
     "md5s",
     "name",
     "names",
+    "names_into",
+    "names_seeded",
     "paragraph",
     "paragraphs",
     "password",
@@ -136,6 +146,7 @@ __all__ = [
     "seed",
     "sentence",
     "sentences",
+    "set_state",
     "sha256",
     "sha256s",
     "sort_code",
@@ -155,6 +166,7 @@ __all__ = [
     "urls",
     "uuid",
     "uuids",
+    "uuids_seeded",
     "zip_code",
     "zip_codes",
 ]
@@ -162,1089 +174,175 @@ __all__ = [
 __version__ = "0.1.0"
 
 # Default Faker instance for convenient access.
-# WARNING: Not thread-safe. For multi-threaded use, create separate Faker instances.
+# Shared by every thread that uses it, so their calls take turns; for parallel
+# or reproducible multi-threaded use, create separate Faker instances.
 fake: Faker = Faker()
 
-
-def seed(value: int) -> None:
-    """Seed the default Faker instance for deterministic output.
-
-    Args:
-        value: The seed value.
-
-    Example:
-        >>> from forgery import seed, names
-        >>> seed(42)
-        >>> names1 = names(10)
-        >>> seed(42)
-        >>> names2 = names(10)
-        >>> assert names1 == names2
-    """
-    fake.seed(value)
-
-
-def name() -> str:
-    """Generate a single random full name.
-
-    Returns:
-        A full name (first + last).
-
-    Example:
-        >>> from forgery import name
-        >>> print(name())
-        John Smith
-    """
-    return fake.name()
-
-
-def names(n: int) -> list[str]:
-    """Generate a batch of random full names.
-
-    Args:
-        n: Number of names to generate.
-
-    Returns:
-        A list of full names.
-
-    Example:
-        >>> from forgery import names
-        >>> batch = names(1000)
-        >>> len(batch)
-        1000
-    """
-    return fake.names(n)
-
-
-def first_name() -> str:
-    """Generate a single random first name.
-
-    Returns:
-        A first name.
-    """
-    return fake.first_name()
-
-
-def first_names(n: int) -> list[str]:
-    """Generate a batch of random first names.
-
-    Args:
-        n: Number of first names to generate.
-
-    Returns:
-        A list of first names.
-    """
-    return fake.first_names(n)
-
-
-def last_name() -> str:
-    """Generate a single random last name.
-
-    Returns:
-        A last name.
-    """
-    return fake.last_name()
-
-
-def last_names(n: int) -> list[str]:
-    """Generate a batch of random last names.
-
-    Args:
-        n: Number of last names to generate.
-
-    Returns:
-        A list of last names.
-    """
-    return fake.last_names(n)
-
-
-def email() -> str:
-    """Generate a single random email address.
-
-    Returns:
-        An email address.
-
-    Example:
-        >>> from forgery import email
-        >>> print(email())
-        john123@gmail.com
-    """
-    return fake.email()
-
-
-def emails(n: int) -> list[str]:
-    """Generate a batch of random email addresses.
-
-    Args:
-        n: Number of emails to generate.
-
-    Returns:
-        A list of email addresses.
-    """
-    return fake.emails(n)
-
-
-def integer(min: int = 0, max: int = 100) -> int:
-    """Generate a single random integer within a range.
-
-    Args:
-        min: Minimum value (inclusive). Default: 0.
-        max: Maximum value (inclusive). Default: 100.
-
-    Returns:
-        A random integer.
-
-    Raises:
-        ValueError: If min > max.
-    """
-    return fake.integer(min, max)
-
-
-def integers(n: int, min: int = 0, max: int = 100) -> list[int]:
-    """Generate a batch of random integers within a range.
-
-    Args:
-        n: Number of integers to generate.
-        min: Minimum value (inclusive). Default: 0.
-        max: Maximum value (inclusive). Default: 100.
-
-    Returns:
-        A list of random integers.
-
-    Raises:
-        ValueError: If min > max or n exceeds the maximum batch size (10 million).
-    """
-    return fake.integers(n, min, max)
-
-
-def uuid() -> str:
-    """Generate a single random UUID (version 4).
-
-    Returns:
-        A UUID string.
-
-    Example:
-        >>> from forgery import uuid
-        >>> print(uuid())
-        a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d
-    """
-    return fake.uuid()
-
-
-def uuids(n: int) -> list[str]:
-    """Generate a batch of random UUIDs (version 4).
-
-    Args:
-        n: Number of UUIDs to generate.
-
-    Returns:
-        A list of UUID strings.
-    """
-    return fake.uuids(n)
-
-
-# === Float Generation ===
-
-
-def float_(min: float = 0.0, max: float = 1.0) -> float:
-    """Generate a single random float within a range.
-
-    Note: Named float_ to avoid shadowing builtin float.
-    """
-    return fake.float(min, max)
-
-
-def floats(n: int, min: float = 0.0, max: float = 1.0) -> list[float]:
-    """Generate a batch of random floats within a range."""
-    return fake.floats(n, min, max)
-
-
-# === Hash-like Identifier Generation ===
-
-
-def md5() -> str:
-    """Generate a single random MD5-like hex string.
-
-    Note: This generates a random 32-character lowercase hex string that
-    matches the format of an MD5 hash. It is NOT a cryptographic hash of
-    any input data.
-    """
-    return fake.md5()
-
-
-def md5s(n: int) -> list[str]:
-    """Generate a batch of random MD5-like hex strings.
-
-    Note: These are random 32-character hex strings, not cryptographic hashes.
-    """
-    return fake.md5s(n)
-
-
-def sha256() -> str:
-    """Generate a single random SHA256-like hex string.
-
-    Note: This generates a random 64-character lowercase hex string that
-    matches the format of a SHA256 hash. It is NOT a cryptographic hash of
-    any input data.
-    """
-    return fake.sha256()
-
-
-def sha256s(n: int) -> list[str]:
-    """Generate a batch of random SHA256-like hex strings.
-
-    Note: These are random 64-character hex strings, not cryptographic hashes.
-    """
-    return fake.sha256s(n)
-
-
-# === Color Generation ===
-
-
-def color() -> str:
-    """Generate a single random color name."""
-    return fake.color()
-
-
-def colors(n: int) -> list[str]:
-    """Generate a batch of random color names."""
-    return fake.colors(n)
-
-
-def hex_color() -> str:
-    """Generate a single random hex color (#RRGGBB)."""
-    return fake.hex_color()
-
-
-def hex_colors(n: int) -> list[str]:
-    """Generate a batch of random hex colors."""
-    return fake.hex_colors(n)
-
-
-def rgb_color() -> tuple[int, int, int]:
-    """Generate a single random RGB color tuple."""
-    return fake.rgb_color()
-
-
-def rgb_colors(n: int) -> list[tuple[int, int, int]]:
-    """Generate a batch of random RGB color tuples."""
-    return fake.rgb_colors(n)
-
-
-# === DateTime Generation ===
-
-
-def date(start: str = "2000-01-01", end: str = "2030-12-31") -> str:
-    """Generate a single random date (YYYY-MM-DD format)."""
-    return fake.date(start, end)
-
-
-def dates(n: int, start: str = "2000-01-01", end: str = "2030-12-31") -> list[str]:
-    """Generate a batch of random dates."""
-    return fake.dates(n, start, end)
-
-
-def date_of_birth(min_age: int = 18, max_age: int = 80) -> str:
-    """Generate a single random date of birth."""
-    return fake.date_of_birth(min_age, max_age)
-
-
-def dates_of_birth(n: int, min_age: int = 18, max_age: int = 80) -> list[str]:
-    """Generate a batch of random dates of birth."""
-    return fake.dates_of_birth(n, min_age, max_age)
-
-
-def datetime_(start: str = "2000-01-01", end: str = "2030-12-31") -> str:
-    """Generate a single random datetime (ISO 8601 format).
-
-    Note: Named datetime_ to avoid shadowing the datetime module.
-    """
-    return fake.datetime(start, end)
-
-
-def datetimes(n: int, start: str = "2000-01-01", end: str = "2030-12-31") -> list[str]:
-    """Generate a batch of random datetimes."""
-    return fake.datetimes(n, start, end)
-
-
-# === Text Generation ===
-
-
-def sentence(word_count: int = 10) -> str:
-    """Generate a single random sentence."""
-    return fake.sentence(word_count)
-
-
-def sentences(n: int, word_count: int = 10) -> list[str]:
-    """Generate a batch of random sentences."""
-    return fake.sentences(n, word_count)
-
-
-def paragraph(sentence_count: int = 5) -> str:
-    """Generate a single random paragraph."""
-    return fake.paragraph(sentence_count)
-
-
-def paragraphs(n: int, sentence_count: int = 5) -> list[str]:
-    """Generate a batch of random paragraphs."""
-    return fake.paragraphs(n, sentence_count)
-
-
-def text(min_chars: int = 50, max_chars: int = 200) -> str:
-    """Generate a single random text block."""
-    return fake.text(min_chars, max_chars)
-
-
-def texts(n: int, min_chars: int = 50, max_chars: int = 200) -> list[str]:
-    """Generate a batch of random text blocks."""
-    return fake.texts(n, min_chars, max_chars)
-
-
-# === Address Generation ===
-
-
-def street_address() -> str:
-    """Generate a single random street address."""
-    return fake.street_address()
-
-
-def street_addresses(n: int) -> list[str]:
-    """Generate a batch of random street addresses."""
-    return fake.street_addresses(n)
-
-
-def city() -> str:
-    """Generate a single random city name."""
-    return fake.city()
-
-
-def cities(n: int) -> list[str]:
-    """Generate a batch of random city names."""
-    return fake.cities(n)
-
-
-def state() -> str:
-    """Generate a single random state name."""
-    return fake.state()
-
-
-def states(n: int) -> list[str]:
-    """Generate a batch of random state names."""
-    return fake.states(n)
-
-
-def country() -> str:
-    """Generate a single random country name."""
-    return fake.country()
-
-
-def countries(n: int) -> list[str]:
-    """Generate a batch of random country names."""
-    return fake.countries(n)
-
-
-def zip_code() -> str:
-    """Generate a single random zip code."""
-    return fake.zip_code()
-
-
-def zip_codes(n: int) -> list[str]:
-    """Generate a batch of random zip codes."""
-    return fake.zip_codes(n)
-
-
-def address() -> str:
-    """Generate a single random full address."""
-    return fake.address()
-
-
-def addresses(n: int) -> list[str]:
-    """Generate a batch of random full addresses."""
-    return fake.addresses(n)
-
-
-# === Phone Generation ===
-
-
-def phone_number() -> str:
-    """Generate a single random phone number."""
-    return fake.phone_number()
-
-
-def phone_numbers(n: int) -> list[str]:
-    """Generate a batch of random phone numbers."""
-    return fake.phone_numbers(n)
-
-
-# === Company Generation ===
-
-
-def company() -> str:
-    """Generate a single random company name."""
-    return fake.company()
-
-
-def companies(n: int) -> list[str]:
-    """Generate a batch of random company names."""
-    return fake.companies(n)
-
-
-def job() -> str:
-    """Generate a single random job title."""
-    return fake.job()
-
-
-def jobs(n: int) -> list[str]:
-    """Generate a batch of random job titles."""
-    return fake.jobs(n)
-
-
-def catch_phrase() -> str:
-    """Generate a single random catch phrase."""
-    return fake.catch_phrase()
-
-
-def catch_phrases(n: int) -> list[str]:
-    """Generate a batch of random catch phrases."""
-    return fake.catch_phrases(n)
-
-
-# === Network Generation ===
-
-
-def url() -> str:
-    """Generate a single random URL."""
-    return fake.url()
-
-
-def urls(n: int) -> list[str]:
-    """Generate a batch of random URLs."""
-    return fake.urls(n)
-
-
-def domain_name() -> str:
-    """Generate a single random domain name."""
-    return fake.domain_name()
-
-
-def domain_names(n: int) -> list[str]:
-    """Generate a batch of random domain names."""
-    return fake.domain_names(n)
-
-
-def ipv4() -> str:
-    """Generate a single random IPv4 address."""
-    return fake.ipv4()
-
-
-def ipv4s(n: int) -> list[str]:
-    """Generate a batch of random IPv4 addresses."""
-    return fake.ipv4s(n)
-
-
-def ipv6() -> str:
-    """Generate a single random IPv6 address."""
-    return fake.ipv6()
-
-
-def ipv6s(n: int) -> list[str]:
-    """Generate a batch of random IPv6 addresses."""
-    return fake.ipv6s(n)
-
-
-def mac_address() -> str:
-    """Generate a single random MAC address."""
-    return fake.mac_address()
-
-
-def mac_addresses(n: int) -> list[str]:
-    """Generate a batch of random MAC addresses."""
-    return fake.mac_addresses(n)
-
-
-# === Email Variants ===
-
-
-def safe_email() -> str:
-    """Generate a single random safe email (example.com/org/net)."""
-    return fake.safe_email()
-
-
-def safe_emails(n: int) -> list[str]:
-    """Generate a batch of random safe emails."""
-    return fake.safe_emails(n)
-
-
-def free_email() -> str:
-    """Generate a single random free email (gmail.com, etc.)."""
-    return fake.free_email()
-
-
-def free_emails(n: int) -> list[str]:
-    """Generate a batch of random free emails."""
-    return fake.free_emails(n)
-
-
-# === Finance Generation ===
-
-
-def credit_card() -> str:
-    """Generate a single random credit card number with valid Luhn checksum."""
-    return fake.credit_card()
-
-
-def credit_cards(n: int) -> list[str]:
-    """Generate a batch of random credit card numbers."""
-    return fake.credit_cards(n)
-
-
-def iban() -> str:
-    """Generate a single random IBAN with valid checksum."""
-    return fake.iban()
-
-
-def ibans(n: int) -> list[str]:
-    """Generate a batch of random IBANs."""
-    return fake.ibans(n)
-
-
-def bic() -> str:
-    """Generate a single random BIC/SWIFT code."""
-    return fake.bic()
-
-
-def bics(n: int) -> list[str]:
-    """Generate a batch of random BIC/SWIFT codes."""
-    return fake.bics(n)
-
-
-def bank_account() -> str:
-    """Generate a single random bank account number (8-17 digits)."""
-    return fake.bank_account()
-
-
-def bank_accounts(n: int) -> list[str]:
-    """Generate a batch of random bank account numbers."""
-    return fake.bank_accounts(n)
-
-
-def bank_name() -> str:
-    """Generate a single random bank name (locale-specific)."""
-    return fake.bank_name()
-
-
-def bank_names(n: int) -> list[str]:
-    """Generate a batch of random bank names."""
-    return fake.bank_names(n)
-
-
-# === UK Banking Generation ===
-
-
-def sort_code() -> str:
-    """Generate a single UK sort code (format: XX-XX-XX)."""
-    return fake.sort_code()
-
-
-def sort_codes(n: int) -> list[str]:
-    """Generate a batch of UK sort codes."""
-    return fake.sort_codes(n)
-
-
-def uk_account_number() -> str:
-    """Generate a single UK bank account number (8 digits)."""
-    return fake.uk_account_number()
-
-
-def uk_account_numbers(n: int) -> list[str]:
-    """Generate a batch of UK bank account numbers (8 digits each)."""
-    return fake.uk_account_numbers(n)
-
-
-# === Transaction Generation ===
-
-
-def transactions(
-    n: int,
-    starting_balance: float,
-    start_date: str,
-    end_date: str,
-) -> list[dict[str, str | float]]:
-    """Generate a batch of financial transactions.
-
-    Each transaction is a dictionary with keys:
-    - reference: 8-character alphanumeric reference
-    - date: Transaction date in YYYY-MM-DD format
-    - amount: Transaction amount (negative for debits)
-    - transaction_type: e.g., "Direct Debit", "Card Payment", etc.
-    - description: Transaction description
-    - balance: Running balance after transaction
-
-    Args:
-        n: Number of transactions to generate.
-        starting_balance: Opening balance before first transaction.
-        start_date: Start date in YYYY-MM-DD format.
-        end_date: End date in YYYY-MM-DD format.
-
-    Returns:
-        List of transaction dictionaries, sorted chronologically.
-
-    Example:
-        >>> from forgery import transactions, seed
-        >>> seed(42)
-        >>> txns = transactions(5, 1000.0, "2024-01-01", "2024-01-31")
-        >>> len(txns)
-        5
-        >>> all(k in txns[0] for k in ["reference", "date", "amount", "balance"])
-        True
-    """
-    return fake.transactions(n, starting_balance, start_date, end_date)
-
-
-def transaction_amount(min: float, max: float) -> float:
-    """Generate a single transaction amount.
-
-    Args:
-        min: Minimum amount (inclusive).
-        max: Maximum amount (inclusive).
-
-    Returns:
-        A transaction amount rounded to 2 decimal places.
-    """
-    return fake.transaction_amount(min, max)
-
-
-def transaction_amounts(n: int, min: float, max: float) -> list[float]:
-    """Generate a batch of transaction amounts.
-
-    Args:
-        n: Number of amounts to generate.
-        min: Minimum amount (inclusive).
-        max: Maximum amount (inclusive).
-
-    Returns:
-        List of amounts rounded to 2 decimal places.
-    """
-    return fake.transaction_amounts(n, min, max)
-
-
-# === Password Generation ===
-
-
-def password(
-    length: int = 12,
-    uppercase: bool = True,
-    lowercase: bool = True,
-    digits: bool = True,
-    symbols: bool = True,
-) -> str:
-    """Generate a single random password.
-
-    Args:
-        length: Length of the password (default: 12).
-        uppercase: Include uppercase letters (default: True).
-        lowercase: Include lowercase letters (default: True).
-        digits: Include digits (default: True).
-        symbols: Include symbols (default: True).
-
-    Raises:
-        ValueError: If no character sets are enabled.
-    """
-    return fake.password(length, uppercase, lowercase, digits, symbols)
-
-
-def passwords(
-    n: int,
-    length: int = 12,
-    uppercase: bool = True,
-    lowercase: bool = True,
-    digits: bool = True,
-    symbols: bool = True,
-) -> list[str]:
-    """Generate a batch of random passwords.
-
-    Args:
-        n: Number of passwords to generate.
-        length: Length of each password (default: 12).
-        uppercase: Include uppercase letters (default: True).
-        lowercase: Include lowercase letters (default: True).
-        digits: Include digits (default: True).
-        symbols: Include symbols (default: True).
-
-    Raises:
-        ValueError: If no character sets are enabled or n exceeds batch limit.
-    """
-    return fake.passwords(n, length, uppercase, lowercase, digits, symbols)
-
-
-# === Records Generation ===
+# Module-level convenience functions are bound methods of the default instance.
+# Binding them directly (rather than wrapping them in Python functions) avoids an
+# extra Python frame and a global/attribute lookup on every call. Argument
+# defaults live in the Rust `#[pyo3(signature = ...)]` declarations.
+#
+# Note: these are bound to the `fake` instance created above. Rebinding
+# `forgery.fake` afterwards does not redirect the module-level functions.
+
+seed = fake.seed
+get_state = fake.get_state
+set_state = fake.set_state
+
+# === Names ===
+
+name = fake.name
+names = fake.names
+names_into = fake.names_into
+names_seeded = fake.names_seeded
+first_name = fake.first_name
+first_names = fake.first_names
+last_name = fake.last_name
+last_names = fake.last_names
+
+# === Internet ===
+
+email = fake.email
+emails = fake.emails
+emails_seeded = fake.emails_seeded
+safe_email = fake.safe_email
+safe_emails = fake.safe_emails
+free_email = fake.free_email
+free_emails = fake.free_emails
+
+# === Numbers and Identifiers ===
+
+integer = fake.integer
+integers = fake.integers
+integers_array = fake.integers_array
+integers_arrow = fake.integers_arrow
+integers_iter = fake.integers_iter
+integers_seeded = fake.integers_seeded
+float_ = fake.float
+floats = fake.floats
+floats_arrow = fake.floats_arrow
+uuid = fake.uuid
+uuids = fake.uuids
+uuids_seeded = fake.uuids_seeded
+md5 = fake.md5
+md5s = fake.md5s
+sha256 = fake.sha256
+sha256s = fake.sha256s
+
+# === Colors ===
+
+color = fake.color
+colors = fake.colors
+hex_color = fake.hex_color
+hex_colors = fake.hex_colors
+rgb_color = fake.rgb_color
+rgb_colors = fake.rgb_colors
+
+# === DateTime ===
+
+date = fake.date
+dates = fake.dates
+date_of_birth = fake.date_of_birth
+dates_of_birth = fake.dates_of_birth
+datetime_ = fake.datetime
+datetimes = fake.datetimes
+
+# === Text ===
+
+sentence = fake.sentence
+sentences = fake.sentences
+paragraph = fake.paragraph
+paragraphs = fake.paragraphs
+text = fake.text
+texts = fake.texts
+
+# === Address ===
+
+street_address = fake.street_address
+street_addresses = fake.street_addresses
+city = fake.city
+cities = fake.cities
+state = fake.state
+states = fake.states
+country = fake.country
+countries = fake.countries
+zip_code = fake.zip_code
+zip_codes = fake.zip_codes
+address = fake.address
+addresses = fake.addresses
+
+# === Phone ===
+
+phone_number = fake.phone_number
+phone_numbers = fake.phone_numbers
+
+# === Company ===
+
+company = fake.company
+companies = fake.companies
+job = fake.job
+jobs = fake.jobs
+catch_phrase = fake.catch_phrase
+catch_phrases = fake.catch_phrases
+
+# === Network ===
+
+url = fake.url
+urls = fake.urls
+domain_name = fake.domain_name
+domain_names = fake.domain_names
+ipv4 = fake.ipv4
+ipv4s = fake.ipv4s
+ipv6 = fake.ipv6
+ipv6s = fake.ipv6s
+mac_address = fake.mac_address
+mac_addresses = fake.mac_addresses
+
+# === Finance ===
+
+credit_card = fake.credit_card
+credit_cards = fake.credit_cards
+iban = fake.iban
+ibans = fake.ibans
+bic = fake.bic
+bics = fake.bics
+bank_account = fake.bank_account
+bank_accounts = fake.bank_accounts
+bank_name = fake.bank_name
+bank_names = fake.bank_names
+sort_code = fake.sort_code
+sort_codes = fake.sort_codes
+uk_account_number = fake.uk_account_number
+uk_account_numbers = fake.uk_account_numbers
+transactions = fake.transactions
+transaction_amount = fake.transaction_amount
+transaction_amounts = fake.transaction_amounts
+
+# === Passwords ===
+
+password = fake.password
+passwords = fake.passwords
+
+# === Records ===
 
 # Type alias for schema field specifications
 FieldSpec = str | tuple[str, ...]
 Schema = dict[str, FieldSpec]
 
-
-def records(n: int, schema: Schema) -> list[dict[str, object]]:
-    """Generate structured records based on a schema.
-
-    The schema is a dictionary mapping field names to type specifications:
-    - Simple types: "name", "email", "uuid", "int", "float", etc.
-    - Integer range: ("int", min, max)
-    - Float range: ("float", min, max)
-    - Text with limits: ("text", min_chars, max_chars)
-    - Date range: ("date", start, end)
-    - Choice: ("choice", ["option1", "option2", ...])
-
-    Args:
-        n: Number of records to generate.
-        schema: Dictionary mapping field names to type specifications.
-
-    Returns:
-        A list of dictionaries, each containing the generated fields.
-
-    Example:
-        >>> from forgery import records, seed
-        >>> seed(42)
-        >>> data = records(3, {
-        ...     "id": "uuid",
-        ...     "name": "name",
-        ...     "age": ("int", 18, 65),
-        ...     "status": ("choice", ["active", "inactive"]),
-        ... })
-        >>> len(data)
-        3
-        >>> "id" in data[0] and "name" in data[0]
-        True
-    """
-    return fake.records(n, schema)
-
-
-def records_tuples(n: int, schema: Schema) -> list[tuple[object, ...]]:
-    """Generate structured records as tuples based on a schema.
-
-    This is faster than records() since it avoids creating dictionaries.
-    Values are returned in alphabetical order of the schema keys.
-
-    The schema format is identical to records().
-
-    Args:
-        n: Number of records to generate.
-        schema: Dictionary mapping field names to type specifications.
-
-    Returns:
-        A list of tuples, each containing values in alphabetical key order.
-
-    Example:
-        >>> from forgery import records_tuples, seed
-        >>> seed(42)
-        >>> data = records_tuples(3, {
-        ...     "age": ("int", 18, 65),
-        ...     "name": "name",
-        ... })
-        >>> len(data)
-        3
-        >>> len(data[0])  # (age, name) - alphabetical order
-        2
-    """
-    return fake.records_tuples(n, schema)
-
-
-def records_arrow(n: int, schema: Schema) -> "pyarrow.RecordBatch":
-    """Generate structured records as a PyArrow RecordBatch.
-
-    This is the high-performance path for generating structured data,
-    suitable for use with PyArrow, Polars, and other Arrow-compatible tools.
-
-    The data is generated in columnar format and returned as a PyArrow
-    RecordBatch, which can be converted to pandas DataFrames, Polars
-    DataFrames, or used directly with Arrow-based processing tools.
-
-    The schema format is identical to records().
-
-    Note:
-        Requires pyarrow to be installed: pip install pyarrow
-
-        Columns are ordered alphabetically by field name (not by Python dict
-        insertion order), matching the behavior of records_tuples().
-
-    Args:
-        n: Number of records to generate.
-        schema: Dictionary mapping field names to type specifications.
-
-    Returns:
-        A pyarrow.RecordBatch with the generated data.
-
-    Example:
-        >>> import pyarrow as pa
-        >>> from forgery import records_arrow, seed
-        >>> seed(42)
-        >>> batch = records_arrow(1000, {
-        ...     "id": "uuid",
-        ...     "name": "name",
-        ...     "age": ("int", 18, 65),
-        ...     "salary": ("float", 30000.0, 150000.0),
-        ... })
-        >>> batch.num_rows
-        1000
-        >>> batch.num_columns
-        4
-        >>> # Convert to pandas
-        >>> df = batch.to_pandas()
-        >>> # Convert to polars
-        >>> import polars as pl
-        >>> df_polars = pl.from_arrow(batch)
-    """
-    return fake.records_arrow(n, schema)
-
-
-# === Async Records Generation ===
-
-
-def records_async(
-    n: int, schema: Schema, chunk_size: int | None = None
-) -> Coroutine[Any, Any, list[dict[str, object]]]:
-    """Generate structured records asynchronously for non-blocking batch generation.
-
-    This method generates records in chunks, yielding control between chunks
-    to allow other async tasks to run. Ideal for generating millions of records
-    without blocking the event loop.
-
-    The schema format is identical to records().
-
-    Note on RNG State:
-        The async methods use a snapshot of the RNG state at call time. The main
-        Faker instance's RNG is not advanced. For different results on each call,
-        create separate Faker instances or re-seed between calls.
-
-    Args:
-        n: Number of records to generate.
-        schema: Dictionary mapping field names to type specifications.
-        chunk_size: Number of records per chunk (default: 10,000).
-            Smaller chunks yield control more frequently.
-
-    Returns:
-        A coroutine that resolves to a list of dictionaries.
-
-    Example:
-        >>> import asyncio
-        >>> from forgery import records_async, seed
-        >>> async def main():
-        ...     seed(42)
-        ...     records = await records_async(1_000_000, {
-        ...         "name": "name",
-        ...         "email": "email",
-        ...     })
-        ...     return len(records)
-        >>> asyncio.run(main())
-        1000000
-    """
-    return fake.records_async(n, schema, chunk_size)
-
-
-def records_tuples_async(
-    n: int, schema: Schema, chunk_size: int | None = None
-) -> Coroutine[Any, Any, list[tuple[object, ...]]]:
-    """Generate structured records as tuples asynchronously.
-
-    Similar to records_async() but returns tuples instead of dictionaries,
-    which is faster for large datasets. Values are returned in alphabetical
-    order of the schema keys.
-
-    The schema format is identical to records().
-
-    Args:
-        n: Number of records to generate.
-        schema: Dictionary mapping field names to type specifications.
-        chunk_size: Number of records per chunk (default: 10,000).
-
-    Returns:
-        A coroutine that resolves to a list of tuples.
-
-    Example:
-        >>> import asyncio
-        >>> from forgery import records_tuples_async, seed
-        >>> async def main():
-        ...     seed(42)
-        ...     records = await records_tuples_async(100, {
-        ...         "age": ("int", 18, 65),
-        ...         "name": "name",
-        ...     })
-        ...     return len(records)
-        >>> asyncio.run(main())
-        100
-    """
-    return fake.records_tuples_async(n, schema, chunk_size)
-
-
-def records_arrow_async(
-    n: int, schema: Schema, chunk_size: int | None = None
-) -> Coroutine[Any, Any, "pyarrow.RecordBatch"]:
-    """Generate structured records as a PyArrow RecordBatch asynchronously.
-
-    This is the high-performance async path for generating structured data.
-    Generates data in chunks and concatenates them into a single RecordBatch.
-
-    The schema format is identical to records().
-
-    Important: Chunking Affects Output
-        When n > chunk_size, the output differs from records_arrow() due to
-        column-major RNG consumption within each chunk. For identical results
-        to the sync version, set chunk_size >= n.
-
-    Note:
-        Requires pyarrow to be installed: pip install pyarrow
-
-    Args:
-        n: Number of records to generate.
-        schema: Dictionary mapping field names to type specifications.
-        chunk_size: Number of records per chunk (default: 10,000).
-
-    Returns:
-        A coroutine that resolves to a PyArrow RecordBatch.
-
-    Example:
-        >>> import asyncio
-        >>> import pyarrow as pa
-        >>> from forgery import records_arrow_async, seed
-        >>> async def main():
-        ...     seed(42)
-        ...     batch = await records_arrow_async(100_000, {
-        ...         "id": "uuid",
-        ...         "name": "name",
-        ...     })
-        ...     return batch.num_rows
-        >>> asyncio.run(main())
-        100000
-    """
-    return fake.records_arrow_async(n, schema, chunk_size)
-
+records = fake.records
+records_tuples = fake.records_tuples
+records_arrow = fake.records_arrow
+records_async = fake.records_async
+records_tuples_async = fake.records_tuples_async
+records_arrow_async = fake.records_arrow_async
 
 # === Custom Providers ===
 
-
-def add_provider(name: str, options: list[str]) -> None:
-    """Register a custom provider on the default Faker instance.
-
-    Each option has equal probability of being selected.
-
-    Args:
-        name: The provider name (must not conflict with built-in types)
-        options: List of string options to choose from
-
-    Raises:
-        ValueError: If name conflicts with built-in type or options is empty
-
-    Example:
-        >>> from forgery import add_provider, generate, seed
-        >>> add_provider("department", ["Engineering", "Sales", "HR", "Marketing"])
-        >>> seed(42)
-        >>> dept = generate("department")
-        >>> dept in ["Engineering", "Sales", "HR", "Marketing"]
-        True
-    """
-    fake.add_provider(name, options)
-
-
-def add_weighted_provider(name: str, weighted_options: list[tuple[str, int]]) -> None:
-    """Register a weighted custom provider on the default Faker instance.
-
-    Options are selected based on their relative weights. Higher weights mean
-    the option is more likely to be selected.
-
-    Args:
-        name: The provider name (must not conflict with built-in types)
-        weighted_options: List of (value, weight) tuples (weights must be >= 0)
-
-    Raises:
-        ValueError: If name conflicts, options empty, weights negative, or weights invalid
-
-    Example:
-        >>> from forgery import add_weighted_provider, generate_batch, seed
-        >>> add_weighted_provider("status", [("active", 80), ("inactive", 20)])
-        >>> seed(42)
-        >>> statuses = generate_batch("status", 1000)
-        >>> # Expect ~800 "active", ~200 "inactive"
-    """
-    # Validate weights are non-negative before passing to Rust
-    for value, weight in weighted_options:
-        if weight < 0:
-            raise ValueError(f"Weight for '{value}' must be non-negative, got {weight}")
-    fake.add_weighted_provider(name, weighted_options)
-
-
-def remove_provider(name: str) -> bool:
-    """Remove a custom provider from the default Faker instance.
-
-    Args:
-        name: The provider name to remove
-
-    Returns:
-        True if provider was removed, False if it didn't exist
-    """
-    return fake.remove_provider(name)
-
-
-def has_provider(name: str) -> bool:
-    """Check if a custom provider exists on the default Faker instance.
-
-    Args:
-        name: The provider name to check
-
-    Returns:
-        True if provider exists, False otherwise
-    """
-    return fake.has_provider(name)
-
-
-def list_providers() -> list[str]:
-    """List all custom provider names on the default Faker instance.
-
-    Returns:
-        List of registered custom provider names
-    """
-    return fake.list_providers()
-
-
-def generate(name: str) -> str:
-    """Generate a single value from a custom provider.
-
-    Args:
-        name: The custom provider name
-
-    Returns:
-        A randomly selected string from the provider's options
-
-    Raises:
-        ValueError: If provider doesn't exist
-
-    Example:
-        >>> from forgery import add_provider, generate, seed
-        >>> add_provider("color_code", ["red", "green", "blue"])
-        >>> seed(42)
-        >>> generate("color_code")
-        'green'
-    """
-    return fake.generate(name)
-
-
-def generate_batch(name: str, n: int) -> list[str]:
-    """Generate a batch of values from a custom provider.
-
-    Args:
-        name: The custom provider name
-        n: Number of values to generate
-
-    Returns:
-        A list of randomly selected strings
-
-    Raises:
-        ValueError: If provider doesn't exist or n exceeds batch limit
-
-    Example:
-        >>> from forgery import add_provider, generate_batch, seed
-        >>> add_provider("size", ["small", "medium", "large"])
-        >>> seed(42)
-        >>> sizes = generate_batch("size", 100)
-        >>> len(sizes)
-        100
-    """
-    return fake.generate_batch(name, n)
+add_provider = fake.add_provider
+add_weighted_provider = fake.add_weighted_provider
+remove_provider = fake.remove_provider
+has_provider = fake.has_provider
+list_providers = fake.list_providers
+generate = fake.generate
+generate_batch = fake.generate_batch
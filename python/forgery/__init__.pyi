@@ -1,9 +1,11 @@
 """Type stubs for the forgery package."""
 
+from array import array
 from collections.abc import Coroutine
 from typing import Any
 
 from forgery._forgery import Faker as Faker
+from forgery._forgery import IntegersIter
 
 __all__: list[str]
 __version__: str
@@ -20,6 +22,27 @@ def seed(value: int) -> None:
     """
     ...
 
+def get_state() -> bytes:
+    """Snapshot the default Faker instance's random number generator state.
+
+    The snapshot format is not stable across forgery versions.
+
+    Returns:
+        An opaque state that can be passed to ``set_state()``.
+    """
+    ...
+
+def set_state(state: bytes) -> None:
+    """Restore the default Faker instance's random number generator state.
+
+    Args:
+        state: A state previously returned by ``get_state()``.
+
+    Raises:
+        ValueError: If state is not a state snapshot.
+    """
+    ...
+
 def name() -> str:
     """Generate a single random full name.
 
@@ -28,15 +51,46 @@ def name() -> str:
     """
     ...
 
-def names(n: int) -> list[str]:
+def names(n: int, *, workers: int = 1) -> list[str]:
     """Generate a batch of random full names.
 
     Args:
         n: Number of names to generate.
+        workers: Split the batch across this many independent RNG streams,
+            run on separate threads for large batches. Reproducible for a
+            given seed and worker count, but a different sequence from
+            workers=1. Must be between 1 and 256; values above n are
+            clamped to n.
 
     Returns:
         A list of full names.
 
+    Raises:
+        ValueError: If n exceeds the maximum batch size (10 million) or
+            workers is outside 1..256.
+    """
+    ...
+
+def names_seeded(n: int, seed: int) -> list[str]:
+    """Seed the default Faker and generate a batch of full names in one call.
+
+    Equivalent to ``seed(seed)`` followed by ``names(n)``.
+
+    Raises:
+        ValueError: If n exceeds the maximum batch size (10 million).
+    """
+    ...
+
+def names_into(n: int, out: list[str]) -> None:
+    """Fill an existing list with random full names.
+
+    The list is overwritten in place and resized to exactly n items, so it
+    can be reused across calls instead of allocating a new list each time.
+
+    Args:
+        n: Number of names to generate.
+        out: List to fill.
+
     Raises:
         ValueError: If n exceeds the maximum batch size (10 million).
     """
@@ -108,6 +162,16 @@ def emails(n: int) -> list[str]:
     """
     ...
 
+def emails_seeded(n: int, seed: int) -> list[str]:
+    """Seed the default Faker and generate a batch of emails in one call.
+
+    Equivalent to ``seed(seed)`` followed by ``emails(n)``.
+
+    Raises:
+        ValueError: If n exceeds the maximum batch size (10 million).
+    """
+    ...
+
 def integer(min: int = 0, max: int = 100) -> int:
     """Generate a single random integer within a range.
 
@@ -139,6 +203,63 @@ def integers(n: int, min: int = 0, max: int = 100) -> list[int]:
     """
     ...
 
+def integers_iter(n: int, min: int = 0, max: int = 100, chunk: int = 65536) -> IntegersIter:
+    """Stream random integers as lists of at most ``chunk`` values.
+
+    Only one chunk is held in memory at a time, so n is not limited by the
+    maximum batch size.
+
+    Args:
+        n: Total number of integers to generate.
+        min: Minimum value (inclusive). Default: 0.
+        max: Maximum value (inclusive). Default: 100.
+        chunk: Maximum number of integers per yielded list. Default: 65536.
+
+    Returns:
+        An iterator of integer lists.
+
+    Raises:
+        ValueError: If min > max, or chunk is zero or exceeds the maximum batch size.
+    """
+    ...
+
+def integers_array(n: int, min: int = 0, max: int = 100) -> array[int]:
+    """Generate a batch of random integers as a standard-library ``array('q')``.
+
+    Values are stored 8 bytes each in one buffer instead of as boxed ints.
+
+    Returns:
+        An ``array.array`` of typecode ``'q'``.
+
+    Raises:
+        ValueError: If min > max or n exceeds the maximum batch size (10 million).
+    """
+    ...
+
+def integers_arrow(n: int, min: int = 0, max: int = 100) -> Any:
+    """Generate a batch of random integers as a PyArrow Int64Array.
+
+    Note:
+        Requires pyarrow to be installed: pip install pyarrow
+
+    Returns:
+        A pyarrow.Int64Array; call ``.to_numpy()`` for a zero-copy NumPy view.
+
+    Raises:
+        ValueError: If min > max or n exceeds the maximum batch size (10 million).
+    """
+    ...
+
+def integers_seeded(n: int, seed: int, min: int = 0, max: int = 100) -> list[int]:
+    """Seed the default Faker and generate a batch of integers in one call.
+
+    Equivalent to ``seed(seed)`` followed by ``integers(n, min, max)``.
+
+    Raises:
+        ValueError: If min > max or n exceeds the maximum batch size (10 million).
+    """
+    ...
+
 def uuid() -> str:
     """Generate a single random UUID (version 4).
 
@@ -151,9 +272,14 @@ def uuids(n: int) -> list[str]:
     """Generate a batch of random UUIDs (version 4)."""
     ...
 
+def uuids_seeded(n: int, seed: int) -> list[str]:
+    """Seed the default Faker and generate a batch of UUIDs in one call."""
+    ...
+
 # Float generation
 def float_(min: float = 0.0, max: float = 1.0) -> float: ...
 def floats(n: int, min: float = 0.0, max: float = 1.0) -> list[float]: ...
+def floats_arrow(n: int, min: float = 0.0, max: float = 1.0) -> Any: ...
 
 # Hash generation
 def md5() -> str: ...
@@ -1,6 +1,7 @@
 """Type stubs for the Rust extension module."""
 
 import builtins
+from array import array
 from collections.abc import Coroutine
 from typing import Any
 
@@ -15,6 +16,12 @@ ChoiceSpec = tuple[str, list[str]]
 FieldSpec = SimpleType | IntRangeSpec | FloatRangeSpec | TextSpec | DateRangeSpec | ChoiceSpec
 Schema = dict[str, FieldSpec]
 
+class IntegersIter:
+    """Iterator yielding an integer batch in chunks; see Faker.integers_iter()."""
+
+    def __iter__(self) -> IntegersIter: ...
+    def __next__(self) -> list[int]: ...
+
 class Faker:
     """A fake data generator with its own random state.
 
@@ -60,21 +67,76 @@ class Faker:
         """
         ...
 
+    def get_state(self) -> bytes:
+        """Snapshot the random number generator state.
+
+        The snapshot format is not stable across forgery versions.
+
+        Returns:
+            An opaque state that can be passed to set_state() to replay
+            the same sequence from this point.
+        """
+        ...
+
+    def set_state(self, state: bytes) -> None:
+        """Restore a random number generator state.
+
+        Args:
+            state: A state previously returned by get_state().
+
+        Raises:
+            ValueError: If state is not a state snapshot.
+        """
+        ...
+
     # Name generators
     def name(self) -> str:
         """Generate a single random full name."""
         ...
 
-    def names(self, n: int, unique: bool = False) -> list[str]:
+    def names(self, n: int, unique: bool = False, *, workers: int = 1) -> list[str]:
         """Generate a batch of random full names.
 
         Args:
             n: Number of names to generate.
             unique: If True, ensure all generated values are unique.
+            workers: Split the batch across this many independent RNG streams,
+                     run on separate threads for large batches. Reproducible
+                     for a given seed and worker count, but a different
+                     sequence from workers=1. Must be between 1 and 256;
+                     values above n are clamped to n. Cannot be combined
+                     with unique=True.
 
         Raises:
-            ValueError: If n exceeds the maximum batch size (10 million) or
-                        unique generation cannot produce enough unique values.
+            ValueError: If n exceeds the maximum batch size (10 million),
+                        workers is outside 1..256, workers > 1 is combined
+                        with unique=True, or unique generation cannot
+                        produce enough unique values.
+        """
+        ...
+
+    def names_seeded(self, n: int, seed: int) -> list[str]:
+        """Seed the RNG and generate a batch of full names in one call.
+
+        Equivalent to seed(seed) followed by names(n).
+
+        Raises:
+            ValueError: If n exceeds the maximum batch size (10 million).
+        """
+        ...
+
+    def names_into(self, n: int, out: list[str]) -> None:
+        """Fill an existing list with random full names.
+
+        The list is overwritten in place and resized to exactly n items.
+        Produces the same names as names(n) for the same RNG state.
+
+        Args:
+            n: Number of names to generate.
+            out: List to fill.
+
+        Raises:
+            ValueError: If n exceeds the maximum batch size (10 million).
         """
         ...
 
@@ -130,6 +192,16 @@ class Faker:
         """
         ...
 
+    def emails_seeded(self, n: int, seed: int) -> list[str]:
+        """Seed the RNG and generate a batch of email addresses in one call.
+
+        Equivalent to seed(seed) followed by emails(n).
+
+        Raises:
+            ValueError: If n exceeds the maximum batch size (10 million).
+        """
+        ...
+
     # Number generators
     def integer(self, min: int = 0, max: int = 100) -> int:
         """Generate a single random integer within a range.
@@ -156,6 +228,74 @@ class Faker:
         """
         ...
 
+    def integers_iter(
+        self, n: int, min: int = 0, max: int = 100, chunk: int = 65536
+    ) -> IntegersIter:
+        """Stream random integers as lists of at most ``chunk`` values.
+
+        Only one chunk is held in memory at a time, so n is not limited by the
+        maximum batch size. Each chunk is drawn from this Faker's RNG when it
+        is requested; the concatenated chunks equal integers(n, min, max).
+
+        Args:
+            n: Total number of integers to generate.
+            min: Minimum value (inclusive).
+            max: Maximum value (inclusive).
+            chunk: Maximum number of integers per yielded list.
+
+        Raises:
+            ValueError: If min > max, or chunk is zero or exceeds the maximum
+                        batch size (10 million).
+        """
+        ...
+
+    def integers_array(self, n: int, min: int = 0, max: int = 100) -> array[int]:
+        """Generate a batch of random integers as a standard-library array('q').
+
+        Values are stored 8 bytes each in one buffer instead of as boxed ints.
+
+        Args:
+            n: Number of integers to generate.
+            min: Minimum value (inclusive).
+            max: Maximum value (inclusive).
+
+        Returns:
+            An array.array of typecode 'q'.
+
+        Raises:
+            ValueError: If min > max or n exceeds the maximum batch size (10 million).
+        """
+        ...
+
+    def integers_arrow(self, n: int, min: int = 0, max: int = 100) -> Any:
+        """Generate a batch of random integers as a PyArrow Int64Array.
+
+        Note:
+            Requires pyarrow to be installed: pip install pyarrow
+
+        Args:
+            n: Number of integers to generate.
+            min: Minimum value (inclusive).
+            max: Maximum value (inclusive).
+
+        Returns:
+            A pyarrow.Int64Array; call ``.to_numpy()`` for a zero-copy NumPy view.
+
+        Raises:
+            ValueError: If min > max or n exceeds the maximum batch size (10 million).
+        """
+        ...
+
+    def integers_seeded(self, n: int, seed: int, min: int = 0, max: int = 100) -> list[int]:
+        """Seed the RNG and generate a batch of integers in one call.
+
+        Equivalent to seed(seed) followed by integers(n, min, max).
+
+        Raises:
+            ValueError: If min > max or n exceeds the maximum batch size (10 million).
+        """
+        ...
+
     # Identifier generators
     def uuid(self) -> str:
         """Generate a single random UUID (version 4)."""
@@ -172,6 +312,16 @@ class Faker:
         """
         ...
 
+    def uuids_seeded(self, n: int, seed: int) -> list[str]:
+        """Seed the RNG and generate a batch of UUIDs in one call.
+
+        Equivalent to seed(seed) followed by uuids(n).
+
+        Raises:
+            ValueError: If n exceeds the maximum batch size (10 million).
+        """
+        ...
+
     def md5(self) -> str:
         """Generate a single random MD5 hash."""
         ...
@@ -199,6 +349,17 @@ class Faker:
         """Generate a batch of random floats within a range."""
         ...
 
+    def floats_arrow(self, n: int, min: builtins.float = 0.0, max: builtins.float = 1.0) -> Any:
+        """Generate a batch of random floats as a PyArrow DoubleArray.
+
+        Note:
+            Requires pyarrow to be installed: pip install pyarrow
+
+        Returns:
+            A pyarrow.DoubleArray; call ``.to_numpy()`` for a zero-copy NumPy view.
+        """
+        ...
+
     # Color generators
     def color(self) -> str:
         """Generate a single random color name."""
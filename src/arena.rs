@@ -0,0 +1,189 @@
+//! Contiguous storage for batches of generated strings.
+//!
+//! Building a batch as `Vec<String>` costs one heap allocation per element,
+//! only for each string to be copied again into a Python `str`. A
+//! [`StringArena`] instead appends every item to one shared buffer and
+//! records where each ends, so a batch is a handful of allocations and the
+//! bytes stay cache-hot while they are copied across to Python.
+
+/// A batch of strings stored back to back in a single buffer.
+#[derive(Debug, Clone, Default)]
+pub struct StringArena {
+    buf: String,
+    ends: Vec<usize>,
+}
+
+impl StringArena {
+    /// Create an empty arena sized for `n` items of roughly `avg_len` bytes.
+    pub fn with_capacity(n: usize, avg_len: usize) -> Self {
+        Self {
+            buf: String::with_capacity(n.saturating_mul(avg_len)),
+            ends: Vec::with_capacity(n),
+        }
+    }
+
+    /// Append one item, written by `write` directly into the shared buffer.
+    #[inline]
+    pub fn push_with(&mut self, write: impl FnOnce(&mut String)) {
+        write(&mut self.buf);
+        self.ends.push(self.buf.len());
+    }
+
+    /// Number of items in the arena.
+    pub fn len(&self) -> usize {
+        self.ends.len()
+    }
+
+    /// Whether the arena holds no items.
+    pub fn is_empty(&self) -> bool {
+        self.ends.is_empty()
+    }
+
+    /// Get the item at `index`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `index` is out of bounds.
+    pub fn get(&self, index: usize) -> &str {
+        let start = if index == 0 { 0 } else { self.ends[index - 1] };
+        &self.buf[start..self.ends[index]]
+    }
+
+    /// Iterate over the items in insertion order.
+    pub fn iter(&self) -> impl ExactSizeIterator<Item = &str> + '_ {
+        (0..self.len()).map(move |i| self.get(i))
+    }
+
+    /// Copy the items out into individually owned strings.
+    pub fn to_vec(&self) -> Vec<String> {
+        self.iter().map(str::to_string).collect()
+    }
+
+    /// Join several arenas into one, keeping their items in order.
+    pub fn concat(parts: &[StringArena]) -> Self {
+        let mut joined = Self {
+            buf: String::with_capacity(parts.iter().map(|part| part.buf.len()).sum()),
+            ends: Vec::with_capacity(parts.iter().map(StringArena::len).sum()),
+        };
+        for part in parts {
+            let offset = joined.buf.len();
+            joined.buf.push_str(&part.buf);
+            joined.ends.extend(part.ends.iter().map(|end| offset + end));
+        }
+        joined
+    }
+}
+
+/// A batch of equal-width ASCII strings stored back to back in one buffer.
+///
+/// Fixed-width generators (UUIDs, hashes, MAC addresses, ...) know every
+/// item's length up front, so the whole batch is one `n * width` byte slab
+/// with no per-item offsets, and disjoint slices of it can be filled in
+/// parallel.
+#[derive(Debug, Clone, Default)]
+pub struct FixedWidthArena {
+    buf: String,
+    width: usize,
+}
+
+impl FixedWidthArena {
+    /// Wrap a filled buffer of `width`-byte items.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `bytes` is not valid UTF-8 or its length is not a multiple
+    /// of `width`.
+    pub fn from_bytes(bytes: Vec<u8>, width: usize) -> Self {
+        assert!(width > 0, "item width must be positive");
+        assert!(
+            bytes.len() % width == 0,
+            "buffer length must be a multiple of the item width"
+        );
+        let buf = String::from_utf8(bytes).expect("fixed-width items must be UTF-8");
+        Self { buf, width }
+    }
+
+    /// Number of items in the arena.
+    pub fn len(&self) -> usize {
+        if self.width == 0 {
+            0
+        } else {
+            self.buf.len() / self.width
+        }
+    }
+
+    /// Whether the arena holds no items.
+    pub fn is_empty(&self) -> bool {
+        self.buf.is_empty()
+    }
+
+    /// Get the item at `index`.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `index` is out of bounds.
+    pub fn get(&self, index: usize) -> &str {
+        &self.buf[index * self.width..(index + 1) * self.width]
+    }
+
+    /// Iterate over the items in insertion order.
+    pub fn iter(&self) -> impl ExactSizeIterator<Item = &str> + '_ {
+        (0..self.len()).map(move |i| self.get(i))
+    }
+
+    /// Copy the items out into individually owned strings.
+    pub fn to_vec(&self) -> Vec<String> {
+        self.iter().map(str::to_string).collect()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_push_and_get() {
+        let mut arena = StringArena::with_capacity(3, 8);
+        arena.push_with(|out| out.push_str("alpha"));
+        arena.push_with(|_| {});
+        arena.push_with(|out| out.push_str("日本"));
+
+        assert_eq!(arena.len(), 3);
+        assert_eq!(arena.get(0), "alpha");
+        assert_eq!(arena.get(1), "");
+        assert_eq!(arena.get(2), "日本");
+        assert_eq!(arena.to_vec(), vec!["alpha", "", "日本"]);
+    }
+
+    #[test]
+    fn test_concat_keeps_order() {
+        let mut first = StringArena::default();
+        first.push_with(|out| out.push_str("a"));
+        first.push_with(|out| out.push_str("bc"));
+        let mut second = StringArena::default();
+        second.push_with(|out| out.push_str("def"));
+
+        let joined = StringArena::concat(&[first, StringArena::default(), second]);
+        assert_eq!(joined.to_vec(), vec!["a", "bc", "def"]);
+        assert!(StringArena::concat(&[]).is_empty());
+    }
+
+    #[test]
+    fn test_fixed_width_arena() {
+        let arena = FixedWidthArena::from_bytes(b"ab12cd34".to_vec(), 4);
+        assert_eq!(arena.len(), 2);
+        assert_eq!(arena.get(1), "cd34");
+        assert_eq!(arena.to_vec(), vec!["ab12", "cd34"]);
+
+        let empty = FixedWidthArena::from_bytes(Vec::new(), 36);
+        assert!(empty.is_empty());
+        assert_eq!(empty.iter().len(), 0);
+    }
+
+    #[test]
+    fn test_empty_arena() {
+        let arena = StringArena::with_capacity(0, 16);
+        assert!(arena.is_empty());
+        assert_eq!(arena.iter().len(), 0);
+    }
+}
@@ -1,7 +1,7 @@
 //! Bank name data for de_DE locale.
 
 /// German bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "Deutsche Bank",
     "Commerzbank",
     "DZ Bank",
@@ -1,7 +1,7 @@
 //! German federal states (Bundesländer).
 
 /// The 16 German federal states.
-pub const BUNDESLAENDER: &[&str] = &[
+pub static BUNDESLAENDER: &[&str] = &[
     "Baden-Württemberg",
     "Bayern",
     "Berlin",
@@ -21,6 +21,6 @@ pub const BUNDESLAENDER: &[&str] = &[
 ];
 
 /// German federal state abbreviations.
-pub const BUNDESLAENDER_ABBRS: &[&str] = &[
+pub static BUNDESLAENDER_ABBRS: &[&str] = &[
     "BW", "BY", "BE", "BB", "HB", "HH", "HE", "MV", "NI", "NW", "RP", "SL", "SN", "ST", "SH", "TH",
 ];
@@ -1,7 +1,7 @@
 //! German cities.
 
 /// Major German cities.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "Berlin",
     "Hamburg",
     "München",
@@ -1,7 +1,7 @@
 //! German color names.
 
 /// Color names in German.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "Rot",
     "Blau",
     "Grün",
@@ -1,7 +1,7 @@
 //! German first names.
 
 /// Common German first names.
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "Maximilian",
     "Alexander",
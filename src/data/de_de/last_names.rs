@@ -1,7 +1,7 @@
 //! German surnames.
 
 /// Common German surnames.
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "Müller",
     "Schmidt",
     "Schneider",
@@ -1,7 +1,7 @@
 //! German street names and suffixes.
 
 /// Common German street names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "Haupt",
     "Bahnhof",
     "Schiller",
@@ -55,7 +55,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// German street suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "straße",
     "weg",
     "allee",
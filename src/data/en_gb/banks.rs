@@ -1,7 +1,7 @@
 //! Bank name data for en_GB locale.
 
 /// UK bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "Barclays",
     "HSBC UK",
     "Lloyds Bank",
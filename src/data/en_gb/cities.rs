@@ -1,7 +1,7 @@
 //! British cities.
 
 /// Major British cities.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "London",
     "Birmingham",
     "Manchester",
@@ -1,7 +1,7 @@
 //! British English colour names.
 
 /// Colour names in British English.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "Red",
     "Blue",
     "Green",
@@ -1,7 +1,7 @@
 //! British counties and regions.
 
 /// British counties and regions.
-pub const COUNTIES: &[&str] = &[
+pub static COUNTIES: &[&str] = &[
     "Greater London",
     "West Midlands",
     "Greater Manchester",
@@ -55,7 +55,7 @@ pub const COUNTIES: &[&str] = &[
 ];
 
 /// County abbreviations (using common postal abbreviations).
-pub const COUNTY_ABBRS: &[&str] = &[
+pub static COUNTY_ABBRS: &[&str] = &[
     "LDN", "WMD", "MCR", "WYK", "KNT", "ESS", "LAN", "HAM", "SRY", "HRT", "SYK", "MER", "TWR",
     "NFK", "DEV", "STS", "NTT", "SFK", "LEC", "DBY", "NTH", "OXF", "CAM", "LIN", "SOM", "WAR",
     "DOR", "CON", "WIL", "BUC", "ESX", "WSX", "GLS", "WOR", "CUM", "NYK", "BRK", "CHS", "SHR",
@@ -1,7 +1,7 @@
 //! British first names.
 
 /// Common British first names.
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "Oliver",
     "George",
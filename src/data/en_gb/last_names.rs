@@ -1,7 +1,7 @@
 //! British surnames.
 
 /// Common British surnames.
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "Smith",
     "Jones",
     "Williams",
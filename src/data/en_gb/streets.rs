@@ -1,7 +1,7 @@
 //! British street names and suffixes.
 
 /// Common British street names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "High",
     "Station",
     "Church",
@@ -55,7 +55,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// Common British street suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "Street", "Road", "Lane", "Avenue", "Close", "Drive", "Way", "Gardens", "Place", "Crescent",
     "Court", "Terrace", "Grove", "Park", "Rise", "Hill", "Walk", "View", "Mews", "Square",
 ];
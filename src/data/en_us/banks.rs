@@ -1,7 +1,7 @@
 //! Bank name data for en_US locale.
 
 /// US bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "JPMorgan Chase",
     "Bank of America",
     "Wells Fargo",
@@ -1,7 +1,7 @@
 //! City name data for en_US locale.
 
 /// US city names.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "New York",
     "Los Angeles",
     "Chicago",
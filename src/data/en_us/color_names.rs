@@ -1,7 +1,7 @@
 //! Color name data for en_US locale.
 
 /// Common color names.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "Red",
     "Green",
     "Blue",
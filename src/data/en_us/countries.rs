@@ -1,7 +1,7 @@
 //! Country name data.
 
 /// Country names.
-pub const COUNTRIES: &[&str] = &[
+pub static COUNTRIES: &[&str] = &[
     "Afghanistan",
     "Albania",
     "Algeria",
@@ -4,7 +4,7 @@
 ///
 /// This list contains 200+ unique first names, evenly split between
 /// traditionally male and female names.
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "James",
     "Robert",
@@ -4,7 +4,7 @@
 ///
 /// This list contains 168 unique surnames representing the diversity
 /// of American family names.
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "Smith",
     "Johnson",
     "Williams",
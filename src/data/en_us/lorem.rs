@@ -1,7 +1,7 @@
 //! Lorem ipsum word data.
 
 /// Lorem ipsum words for text generation.
-pub const LOREM_WORDS: &[&str] = &[
+pub static LOREM_WORDS: &[&str] = &[
     "lorem",
     "ipsum",
     "dolor",
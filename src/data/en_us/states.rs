@@ -1,7 +1,7 @@
 //! US state data.
 
 /// US state names.
-pub const STATES: &[&str] = &[
+pub static STATES: &[&str] = &[
     "Alabama",
     "Alaska",
     "Arizona",
@@ -55,7 +55,7 @@ pub const STATES: &[&str] = &[
 ];
 
 /// US state abbreviations.
-pub const STATE_ABBRS: &[&str] = &[
+pub static STATE_ABBRS: &[&str] = &[
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS",
     "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY",
     "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV",
@@ -1,7 +1,7 @@
 //! Street name data for en_US locale.
 
 /// Common street names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "Main",
     "Oak",
     "Maple",
@@ -104,7 +104,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// Street suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "Street",
     "Avenue",
     "Boulevard",
@@ -1,7 +1,7 @@
 //! Bank name data for es_ES locale.
 
 /// Spanish bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "Banco Santander",
     "BBVA",
     "CaixaBank",
@@ -1,7 +1,7 @@
 //! Spanish cities.
 
 /// Major Spanish cities.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "Madrid",
     "Barcelona",
     "Valencia",
@@ -1,7 +1,7 @@
 //! Spanish color names.
 
 /// Color names in Spanish.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "Rojo",
     "Azul",
     "Verde",
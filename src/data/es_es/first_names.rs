@@ -1,7 +1,7 @@
 //! Spanish first names.
 
 /// Common Spanish first names.
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "Hugo",
     "Martín",
@@ -107,7 +107,7 @@ pub const FIRST_NAMES: &[&str] = &[
 ];
 
 /// ASCII-safe romanized Spanish first names for email generation.
-pub const ROMANIZED_FIRST_NAMES: &[&str] = &[
+pub static ROMANIZED_FIRST_NAMES: &[&str] = &[
     // Male names (ASCII only)
     "Hugo",
     "Martin",
@@ -1,7 +1,7 @@
 //! Spanish surnames.
 
 /// Common Spanish surnames.
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "García",
     "Rodríguez",
     "Martínez",
@@ -1,7 +1,7 @@
 //! Spanish provinces.
 
 /// Spanish provinces.
-pub const PROVINCES: &[&str] = &[
+pub static PROVINCES: &[&str] = &[
     "Álava",
     "Albacete",
     "Alicante",
@@ -55,7 +55,7 @@ pub const PROVINCES: &[&str] = &[
 ];
 
 /// Spanish province abbreviations.
-pub const PROVINCE_ABBRS: &[&str] = &[
+pub static PROVINCE_ABBRS: &[&str] = &[
     "VI", "AB", "A", "AL", "O", "AV", "BA", "B", "BU", "CC", "CA", "S", "CS", "CR", "CO", "CU",
     "GI", "GR", "GU", "SS", "H", "HU", "PM", "J", "C", "LO", "GC", "LE", "L", "LU", "M", "MA",
     "MU", "NA", "OR", "P", "PO", "SA", "TF", "SG", "SE", "SO", "T", "TE", "TO", "V", "VA", "BI",
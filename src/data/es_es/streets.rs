@@ -1,7 +1,7 @@
 //! Spanish street names and suffixes.
 
 /// Common Spanish street names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "Mayor",
     "Real",
     "de la Paz",
@@ -55,7 +55,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// Spanish street suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "Calle",
     "Avenida",
     "Plaza",
@@ -1,7 +1,7 @@
 //! Bank name data for fr_FR locale.
 
 /// French bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "BNP Paribas",
     "Crédit Agricole",
     "Société Générale",
@@ -1,7 +1,7 @@
 //! French cities.
 
 /// Major French cities.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "Paris",
     "Marseille",
     "Lyon",
@@ -1,7 +1,7 @@
 //! French color names.
 
 /// Color names in French.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "Rouge",
     "Bleu",
     "Vert",
@@ -1,7 +1,7 @@
 //! French first names.
 
 /// Common French first names (includes accented characters).
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "Gabriel",
     "Louis",
@@ -107,7 +107,7 @@ pub const FIRST_NAMES: &[&str] = &[
 ];
 
 /// ASCII-safe romanized French first names for email generation.
-pub const ROMANIZED_FIRST_NAMES: &[&str] = &[
+pub static ROMANIZED_FIRST_NAMES: &[&str] = &[
     // Male names (ASCII only)
     "Gabriel",
     "Louis",
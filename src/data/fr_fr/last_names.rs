@@ -1,7 +1,7 @@
 //! French surnames.
 
 /// Common French surnames.
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "Martin",
     "Bernard",
     "Thomas",
@@ -1,7 +1,7 @@
 //! French regions.
 
 /// French administrative regions.
-pub const REGIONS: &[&str] = &[
+pub static REGIONS: &[&str] = &[
     "Auvergne-Rhône-Alpes",
     "Bourgogne-Franche-Comté",
     "Bretagne",
@@ -23,7 +23,7 @@ pub const REGIONS: &[&str] = &[
 ];
 
 /// French region abbreviations.
-pub const REGION_ABBRS: &[&str] = &[
+pub static REGION_ABBRS: &[&str] = &[
     "ARA", "BFC", "BRE", "CVL", "COR", "GES", "HDF", "IDF", "NOR", "NAQ", "OCC", "PDL", "PAC",
     "GUA", "MTQ", "GUF", "REU", "MAY",
 ];
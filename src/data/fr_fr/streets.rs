@@ -1,7 +1,7 @@
 //! French street names and suffixes.
 
 /// Common French street names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "de la République",
     "de Paris",
     "de la Gare",
@@ -55,7 +55,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// French street suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "rue",
     "avenue",
     "boulevard",
@@ -1,7 +1,7 @@
 //! Bank name data for it_IT locale.
 
 /// Italian bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "Intesa Sanpaolo",
     "UniCredit",
     "Banco BPM",
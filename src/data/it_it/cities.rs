@@ -1,7 +1,7 @@
 //! Italian cities.
 
 /// Major Italian cities.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "Roma",
     "Milano",
     "Napoli",
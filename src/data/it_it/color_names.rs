@@ -1,7 +1,7 @@
 //! Italian color names.
 
 /// Color names in Italian.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "Rosso",
     "Blu",
     "Verde",
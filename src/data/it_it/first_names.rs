@@ -1,7 +1,7 @@
 //! Italian first names.
 
 /// Common Italian first names.
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "Leonardo",
     "Francesco",
@@ -107,7 +107,7 @@ pub const FIRST_NAMES: &[&str] = &[
 ];
 
 /// ASCII-safe romanized Italian first names for email generation.
-pub const ROMANIZED_FIRST_NAMES: &[&str] = &[
+pub static ROMANIZED_FIRST_NAMES: &[&str] = &[
     // Male names (ASCII only)
     "Leonardo",
     "Francesco",
@@ -1,7 +1,7 @@
 //! Italian surnames.
 
 /// Common Italian surnames.
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "Rossi",
     "Russo",
     "Ferrari",
@@ -1,7 +1,7 @@
 //! Italian regions.
 
 /// Italian administrative regions.
-pub const REGIONS: &[&str] = &[
+pub static REGIONS: &[&str] = &[
     "Abruzzo",
     "Basilicata",
     "Calabria",
@@ -25,7 +25,7 @@ pub const REGIONS: &[&str] = &[
 ];
 
 /// Italian region abbreviations.
-pub const REGION_ABBRS: &[&str] = &[
+pub static REGION_ABBRS: &[&str] = &[
     "ABR", "BAS", "CAL", "CAM", "EMR", "FVG", "LAZ", "LIG", "LOM", "MAR", "MOL", "PIE", "PUG",
     "SAR", "SIC", "TOS", "TAA", "UMB", "VDA", "VEN",
 ];
@@ -1,7 +1,7 @@
 //! Italian street names and suffixes.
 
 /// Common Italian street names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "Roma",
     "Milano",
     "Garibaldi",
@@ -55,7 +55,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// Italian street suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "Via",
     "Viale",
     "Piazza",
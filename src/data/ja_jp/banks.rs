@@ -1,7 +1,7 @@
 //! Bank name data for ja_JP locale.
 
 /// Japanese bank names.
-pub const BANK_NAMES: &[&str] = &[
+pub static BANK_NAMES: &[&str] = &[
     "三菱UFJ銀行",
     "三井住友銀行",
     "みずほ銀行",
@@ -1,7 +1,7 @@
 //! Japanese cities.
 
 /// Major Japanese cities.
-pub const CITIES: &[&str] = &[
+pub static CITIES: &[&str] = &[
     "東京",
     "横浜",
     "大阪",
@@ -1,7 +1,7 @@
 //! Japanese color names.
 
 /// Color names in Japanese.
-pub const COLOR_NAMES: &[&str] = &[
+pub static COLOR_NAMES: &[&str] = &[
     "赤",
     "青",
     "緑",
@@ -1,7 +1,7 @@
 //! Japanese first names.
 
 /// Common Japanese first names (in kanji/hiragana).
-pub const FIRST_NAMES: &[&str] = &[
+pub static FIRST_NAMES: &[&str] = &[
     // Male names
     "太郎",
     "一郎",
@@ -107,7 +107,7 @@ pub const FIRST_NAMES: &[&str] = &[
 ];
 
 /// Romanized versions of Japanese first names (for email generation).
-pub const FIRST_NAMES_ROMANIZED: &[&str] = &[
+pub static FIRST_NAMES_ROMANIZED: &[&str] = &[
     // Male names
     "Taro", "Ichiro", "Kenta", "Daiki", "Shota", "Ren", "Yuma", "Haruto", "Aoi", "Itsuki", "Yamato",
     "Yuto", "Riku", "Shun", "Sota", "Kazuki", "Kaito", "Hinata", "Arata", "Minato", "Hiroto",
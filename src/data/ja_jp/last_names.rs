@@ -1,7 +1,7 @@
 //! Japanese surnames.
 
 /// Common Japanese surnames (in kanji).
-pub const LAST_NAMES: &[&str] = &[
+pub static LAST_NAMES: &[&str] = &[
     "佐藤",
     "鈴木",
     "高橋",
@@ -104,7 +104,7 @@ pub const LAST_NAMES: &[&str] = &[
 ];
 
 /// Romanized versions of Japanese surnames (for email generation).
-pub const LAST_NAMES_ROMANIZED: &[&str] = &[
+pub static LAST_NAMES_ROMANIZED: &[&str] = &[
     "Sato",
     "Suzuki",
     "Takahashi",
@@ -1,7 +1,7 @@
 //! Japanese prefectures.
 
 /// The 47 Japanese prefectures.
-pub const PREFECTURES: &[&str] = &[
+pub static PREFECTURES: &[&str] = &[
     "北海道",
     "青森県",
     "岩手県",
@@ -52,7 +52,7 @@ pub const PREFECTURES: &[&str] = &[
 ];
 
 /// Japanese prefecture abbreviations (romanized).
-pub const PREFECTURE_ABBRS: &[&str] = &[
+pub static PREFECTURE_ABBRS: &[&str] = &[
     "HKD", "AOM", "IWT", "MYG", "AKT", "YGT", "FKS", "IBR", "TCG", "GNM", "STM", "CHB", "TKY",
     "KNG", "NGT", "TYM", "ISK", "FKI", "YNS", "NGN", "GIF", "SZO", "AIC", "MIE", "SIG", "KYT",
     "OSK", "HYG", "NAR", "WKY", "TTR", "SMN", "OKY", "HRS", "YGC", "TKS", "KGW", "EHM", "KOC",
@@ -1,7 +1,7 @@
 //! Japanese street/address components.
 
 /// Common Japanese street/address names.
-pub const STREET_NAMES: &[&str] = &[
+pub static STREET_NAMES: &[&str] = &[
     "中央",
     "本町",
     "東",
@@ -55,7 +55,7 @@ pub const STREET_NAMES: &[&str] = &[
 ];
 
 /// Japanese address suffixes.
-pub const STREET_SUFFIXES: &[&str] = &[
+pub static STREET_SUFFIXES: &[&str] = &[
     "丁目",
     "番地",
     "号",
@@ -30,19 +30,19 @@ macro_rules! define_company_data {
         nouns: [$($noun:literal),* $(,)?] $(,)?
     ) => {
         /// Company name prefixes.
-        pub const COMPANY_PREFIXES: &[&str] = &[$($prefix),*];
+        pub static COMPANY_PREFIXES: &[&str] = &[$($prefix),*];
 
         /// Company name suffixes.
-        pub const COMPANY_SUFFIXES: &[&str] = &[$($suffix),*];
+        pub static COMPANY_SUFFIXES: &[&str] = &[$($suffix),*];
 
         /// Job titles.
-        pub const JOB_TITLES: &[&str] = &[$($job),*];
+        pub static JOB_TITLES: &[&str] = &[$($job),*];
 
         /// Catch phrase adjectives.
-        pub const CATCH_PHRASE_ADJECTIVES: &[&str] = &[$($adj),*];
+        pub static CATCH_PHRASE_ADJECTIVES: &[&str] = &[$($adj),*];
 
         /// Catch phrase nouns.
-        pub const CATCH_PHRASE_NOUNS: &[&str] = &[$($noun),*];
+        pub static CATCH_PHRASE_NOUNS: &[&str] = &[$($noun),*];
     };
 }
 
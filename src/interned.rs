@@ -0,0 +1,64 @@
+//! Interned Python strings for closed-set generators.
+//!
+//! Generators such as `colors()` or `countries()` only ever return entries of
+//! a small static table. Rather than building a fresh `PyString` for every
+//! element, each table is interned once per process and batches are
+//! assembled from reference-count bumps on the cached objects.
+
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex, OnceLock};
+
+use pyo3::prelude::*;
+use pyo3::types::{PyList, PyString};
+
+use crate::rng::ForgeryRng;
+
+/// Interned tables keyed by the address and length of their static data.
+///
+/// Locale tables are `static` items, so every use of a table shares one
+/// address and maps to a single cache entry.
+type TableCache = HashMap<(usize, usize), Arc<[Py<PyString>]>>;
+
+static TABLES: OnceLock<Mutex<TableCache>> = OnceLock::new();
+
+/// Get (or build on first use) the interned copy of a static table.
+fn interned_table(py: Python<'_>, table: &'static [&'static str]) -> Arc<[Py<PyString>]> {
+    let cache = TABLES.get_or_init(|| Mutex::new(HashMap::new()));
+    let mut cache = cache
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner());
+    cache
+        .entry((table.as_ptr() as usize, table.len()))
+        .or_insert_with(|| {
+            table
+                .iter()
+                .map(|s| PyString::intern(py, s).unbind())
+                .collect()
+        })
+        .clone()
+}
+
+/// Pick `n` entries uniformly from `table` and return them as a Python list.
+///
+/// Consumes the RNG exactly like `n` calls to `rng.choose(table)`, so the
+/// output matches the `Vec<String>` generators for the same seed.
+///
+/// # Panics
+///
+/// Panics if `table` is empty.
+pub fn choose_list<'py>(
+    py: Python<'py>,
+    rng: &mut ForgeryRng,
+    table: &'static [&'static str],
+    n: usize,
+) -> PyResult<Bound<'py, PyList>> {
+    // Don't build (or lock) the interned table for an empty batch
+    if n == 0 {
+        return Ok(PyList::empty(py));
+    }
+    let strings = interned_table(py, table);
+    PyList::new(
+        py,
+        (0..n).map(|_| strings[rng.choose_index(table.len())].bind(py)),
+    )
+}
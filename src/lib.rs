@@ -13,23 +13,29 @@
 
 #![deny(missing_docs)]
 
+pub mod arena;
 /// Embedded locale data for generation.
 pub mod data;
 pub mod error;
+mod interned;
 /// Locale definitions and errors.
 pub mod locale;
 /// Data generation providers.
 pub mod providers;
 mod rng;
 
+use arrow_array::{ArrayRef, Float64Array, Int64Array};
 use pyo3::exceptions::PyValueError;
+use pyo3::marker::Ungil;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList, PyString, PyTuple};
+use pyo3::types::{PyBytes, PyDict, PyList, PyString, PyTuple};
 use pyo3::IntoPyObjectExt;
-use pyo3_arrow::PyRecordBatch;
-use rng::ForgeryRng;
+use pyo3_arrow::{PyArray, PyRecordBatch};
+use rng::{ForgeryRng, STATE_LEN};
 use std::collections::{BTreeMap, HashMap, HashSet};
+use std::sync::{Arc, Mutex, MutexGuard, TryLockError};
 
+use data::get_locale_data;
 use error::{ForgeryError, UniqueExhaustedError};
 use locale::{Locale, LocaleError};
 use providers::custom::{is_reserved_name, CustomProvider, CustomProviderError};
@@ -67,17 +73,30 @@ impl std::error::Error for BatchSizeError {}
 /// # Errors
 ///
 /// Returns `BatchSizeError` if `n` exceeds `MAX_BATCH_SIZE`.
+///
+/// Every batch entry point calls this exactly once before generating; the
+/// per-item loops never re-check the limit. `n` is unsigned, so the guard is
+/// a single comparison.
 #[inline]
 pub fn validate_batch_size(n: usize) -> Result<(), BatchSizeError> {
     if n > MAX_BATCH_SIZE {
-        return Err(BatchSizeError {
-            requested: n,
-            max: MAX_BATCH_SIZE,
-        });
+        return Err(batch_size_error(n));
     }
     Ok(())
 }
 
+/// Build the error for an oversized batch.
+///
+/// Kept out of line so the inlined guard stays a compare and branch.
+#[cold]
+#[inline(never)]
+fn batch_size_error(n: usize) -> BatchSizeError {
+    BatchSizeError {
+        requested: n,
+        max: MAX_BATCH_SIZE,
+    }
+}
+
 /// Maximum schema size (number of fields) to prevent resource exhaustion.
 ///
 /// This limit prevents DoS attacks via schemas with millions of columns.
@@ -144,11 +163,61 @@ pub fn validate_locale(locale: &str) -> Result<Locale, LocaleError> {
 /// - `it_IT` - Italian (Italy)
 /// - `ja_JP` - Japanese (Japan)
 /// - `en_GB` - English (United Kingdom)
-#[pyclass]
 pub struct Faker {
     rng: ForgeryRng,
     locale: Locale,
     custom_providers: HashMap<String, CustomProvider>,
+    /// Keys of `custom_providers`, kept sorted as providers are added and
+    /// removed so `list_providers()` never has to sort.
+    provider_names: Vec<String>,
+}
+
+/// The Python `Faker` class: a [`Faker`] behind a mutex.
+///
+/// The class is frozen so PyO3 never raises a borrow error when two threads
+/// share an instance; instead every method takes the mutex with
+/// [`PyFaker::lock`], and a call that finds it held waits for the other
+/// call to finish.
+#[pyclass(name = "Faker", frozen)]
+pub struct PyFaker {
+    inner: Mutex<Faker>,
+}
+
+/// Iterator over a large integer batch, produced one chunk at a time.
+///
+/// Returned by `Faker.integers_iter()`. Each step draws the next chunk from
+/// the owning `Faker`'s RNG, so only one chunk is resident at a time and the
+/// concatenated chunks equal `integers(n, min, max)` for the same RNG state.
+#[pyclass]
+pub struct IntegersIter {
+    faker: Py<PyFaker>,
+    remaining: usize,
+    chunk: usize,
+    min: i64,
+    max: i64,
+}
+
+#[pymethods]
+impl IntegersIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<Vec<i64>>> {
+        let take = self.remaining.min(self.chunk);
+        if take == 0 {
+            return Ok(None);
+        }
+        let mut faker = self.faker.get().lock(py);
+        let faker = &mut *faker;
+        let (min, max) = (self.min, self.max);
+        let values = detach_batch(py, take, || {
+            faker.integers(take, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
+        self.remaining -= take;
+        Ok(Some(values))
+    }
 }
 
 // Public Rust API - these methods are callable from Rust code (including benchmarks)
@@ -178,6 +247,7 @@ impl Faker {
             rng: ForgeryRng::new(),
             locale: parsed_locale,
             custom_providers: HashMap::new(),
+            provider_names: Vec::new(),
         })
     }
 
@@ -187,6 +257,7 @@ impl Faker {
             rng: ForgeryRng::new(),
             locale: Locale::default(),
             custom_providers: HashMap::new(),
+            provider_names: Vec::new(),
         }
     }
 
@@ -254,6 +325,16 @@ impl Faker {
         self.rng.seed(value);
     }
 
+    /// Snapshot the RNG state so the same sequence can be replayed later.
+    pub fn get_state(&self) -> [u8; STATE_LEN] {
+        self.rng.state()
+    }
+
+    /// Restore an RNG state previously returned by [`Faker::get_state`].
+    pub fn set_state(&mut self, state: &[u8; STATE_LEN]) {
+        self.rng.set_state(state);
+    }
+
     /// Generate a batch of random full names.
     ///
     /// # Arguments
@@ -1449,7 +1530,7 @@ impl Faker {
             return Err(CustomProviderError::NameCollision(name.to_string()));
         }
         let provider = CustomProvider::uniform(options)?;
-        self.custom_providers.insert(name.to_string(), provider);
+        self.insert_provider(name, provider);
         Ok(())
     }
 
@@ -1477,10 +1558,26 @@ impl Faker {
             return Err(CustomProviderError::NameCollision(name.to_string()));
         }
         let provider = CustomProvider::weighted(pairs)?;
-        self.custom_providers.insert(name.to_string(), provider);
+        self.insert_provider(name, provider);
         Ok(())
     }
 
+    /// Register `provider` under `name`, replacing any existing provider.
+    fn insert_provider(&mut self, name: &str, provider: CustomProvider) {
+        if self
+            .custom_providers
+            .insert(name.to_string(), provider)
+            .is_none()
+        {
+            if let Err(index) = self
+                .provider_names
+                .binary_search_by(|n| n.as_str().cmp(name))
+            {
+                self.provider_names.insert(index, name.to_string());
+            }
+        }
+    }
+
     /// Remove a custom provider.
     ///
     /// # Arguments
@@ -1491,7 +1588,16 @@ impl Faker {
     ///
     /// `true` if the provider was removed, `false` if it didn't exist.
     pub fn remove_provider(&mut self, name: &str) -> bool {
-        self.custom_providers.remove(name).is_some()
+        if self.custom_providers.remove(name).is_none() {
+            return false;
+        }
+        if let Ok(index) = self
+            .provider_names
+            .binary_search_by(|n| n.as_str().cmp(name))
+        {
+            self.provider_names.remove(index);
+        }
+        true
     }
 
     /// Check if a custom provider exists.
@@ -1513,16 +1619,7 @@ impl Faker {
     ///
     /// A sorted vector of provider names (for deterministic output).
     pub fn list_providers(&self) -> Vec<String> {
-        let mut names: Vec<String> = self.custom_providers.keys().cloned().collect();
-        names.sort();
-        names
-    }
-
-    /// Get a set of all custom provider names.
-    ///
-    /// Used internally for schema validation.
-    pub fn custom_provider_names(&self) -> HashSet<String> {
-        self.custom_providers.keys().cloned().collect()
+        self.provider_names.clone()
     }
 
     /// Generate a single value from a custom provider.
@@ -1570,7 +1667,7 @@ impl Faker {
 
 // Python API - these methods are exposed to Python via PyO3
 #[pymethods]
-impl Faker {
+impl PyFaker {
     /// Create a new Faker instance with the specified locale.
     ///
     /// # Arguments
@@ -1583,220 +1680,606 @@ impl Faker {
     #[new]
     #[pyo3(signature = (locale = "en_US"))]
     fn py_new(locale: &str) -> PyResult<Self> {
-        Self::new(locale).map_err(|e| PyValueError::new_err(e.to_string()))
+        let faker = Faker::new(locale).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(Self {
+            inner: Mutex::new(faker),
+        })
     }
 
     /// Seed the random number generator for deterministic output.
     #[pyo3(name = "seed")]
-    fn py_seed(&mut self, value: u64) {
-        self.seed(value);
+    fn py_seed(&self, py: Python<'_>, value: u64) {
+        self.lock(py).seed(value);
+    }
+
+    /// Snapshot the RNG state as an opaque bytes object.
+    ///
+    /// The format is internal and may change between versions.
+    #[pyo3(name = "get_state")]
+    fn py_get_state<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.lock(py).get_state())
+    }
+
+    /// Restore an RNG state previously returned by `get_state()`.
+    ///
+    /// # Errors
+    ///
+    /// Returns `ValueError` if `state` is not a state snapshot.
+    #[pyo3(name = "set_state")]
+    fn py_set_state(&self, py: Python<'_>, state: &[u8]) -> PyResult<()> {
+        let state = <&[u8; STATE_LEN]>::try_from(state).map_err(|_| {
+            PyValueError::new_err(format!(
+                "state must be {} bytes, got {}",
+                STATE_LEN,
+                state.len()
+            ))
+        })?;
+        self.lock(py).set_state(state);
+        Ok(())
     }
 
     /// Generate a batch of random full names.
-    #[pyo3(name = "names", signature = (n, unique=false))]
-    fn py_names(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.names(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    ///
+    /// With `workers > 1` the batch is split across that many independent
+    /// RNG streams, which run on separate threads for large batches. The
+    /// output is reproducible for a given seed and worker count but differs
+    /// from `workers=1`. `workers` must be between 1 and 256; counts above
+    /// `n` are clamped to `n`. Unique batches cannot be sharded, since each
+    /// stream would only check its own names for duplicates.
+    #[pyo3(name = "names", signature = (n, unique=false, *, workers=1))]
+    fn py_names<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+        workers: usize,
+    ) -> PyResult<Bound<'py, PyList>> {
+        if !(1..=providers::names::MAX_SHARD_WORKERS).contains(&workers) {
+            return Err(PyValueError::new_err(format!(
+                "workers must be between 1 and {}",
+                providers::names::MAX_SHARD_WORKERS
+            )));
+        }
+        if unique && workers > 1 {
+            return Err(PyValueError::new_err(
+                "workers cannot be combined with unique=True",
+            ));
+        }
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        if unique {
+            let names = detach_batch(py, n, || faker.names(n, true))
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            return PyList::new(py, names);
+        }
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if workers > 1 {
+            let arena = detach_batch(py, n, || {
+                providers::names::generate_names_sharded(&mut faker.rng, faker.locale, n, workers)
+            });
+            return PyList::new(py, arena.iter());
+        }
+        // Even small batches go through the arena: one buffer for all the
+        // names instead of a String per name, copied straight into the list
+        let arena = detach_batch(py, n, || {
+            providers::names::generate_names_arena(&mut faker.rng, faker.locale, n)
+        });
+        PyList::new(py, arena.iter())
+    }
+
+    /// Seed the RNG and generate a batch of full names in one call.
+    ///
+    /// Equivalent to `seed(seed)` followed by `names(n)`, without the second
+    /// Python-to-Rust crossing.
+    #[pyo3(name = "names_seeded")]
+    fn py_names_seeded<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        seed: u64,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        faker.seed(seed);
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let arena = detach_batch(py, n, || {
+            providers::names::generate_names_arena(&mut faker.rng, faker.locale, n)
+        });
+        PyList::new(py, arena.iter())
+    }
+
+    /// Fill a caller-provided list with `n` random full names.
+    ///
+    /// Existing slots are overwritten in place and the list is grown or
+    /// truncated to exactly `n` items, so a loop that repeatedly asks for a
+    /// small batch can reuse one list object instead of allocating a new one
+    /// per call. Produces the same names as `names(n)` for the same RNG state.
+    #[pyo3(name = "names_into")]
+    fn py_names_into(&self, py: Python<'_>, n: usize, out: &Bound<'_, PyList>) -> PyResult<()> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let arena = detach_batch(py, n, || {
+            providers::names::generate_names_arena(&mut faker.rng, faker.locale, n)
+        });
+
+        let reused = out.len().min(n);
+        let mut names = arena.iter();
+        for (i, name) in names.by_ref().take(reused).enumerate() {
+            out.set_item(i, name)?;
+        }
+        if out.len() > n {
+            out.del_slice(n, out.len())?;
+        }
+        for name in names {
+            out.append(name)?;
+        }
+        Ok(())
     }
 
     /// Generate a batch of random first names.
     #[pyo3(name = "first_names", signature = (n, unique=false))]
-    fn py_first_names(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.first_names(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_first_names(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.first_names(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a batch of random last names.
     #[pyo3(name = "last_names", signature = (n, unique=false))]
-    fn py_last_names(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.last_names(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_last_names(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.last_names(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random full name.
     #[pyo3(name = "name")]
-    fn py_name(&mut self) -> String {
-        self.name()
+    fn py_name(&self, py: Python<'_>) -> String {
+        self.lock(py).name()
     }
 
     /// Generate a single random first name.
     #[pyo3(name = "first_name")]
-    fn py_first_name(&mut self) -> String {
-        self.first_name()
+    fn py_first_name(&self, py: Python<'_>) -> String {
+        self.lock(py).first_name()
     }
 
     /// Generate a single random last name.
     #[pyo3(name = "last_name")]
-    fn py_last_name(&mut self) -> String {
-        self.last_name()
+    fn py_last_name(&self, py: Python<'_>) -> String {
+        self.lock(py).last_name()
     }
 
     /// Generate a batch of random email addresses.
     #[pyo3(name = "emails", signature = (n, unique=false))]
-    fn py_emails(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.emails(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_emails<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        if unique {
+            let emails = detach_batch(py, n, || faker.emails(n, true))
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            return PyList::new(py, emails);
+        }
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let arena = detach_batch(py, n, || {
+            providers::internet::generate_emails_arena(&mut faker.rng, faker.locale, n)
+        });
+        PyList::new(py, arena.iter())
+    }
+
+    /// Seed the RNG and generate a batch of email addresses in one call.
+    ///
+    /// Equivalent to `seed(seed)` followed by `emails(n)`.
+    #[pyo3(name = "emails_seeded")]
+    fn py_emails_seeded<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        seed: u64,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        faker.seed(seed);
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let arena = detach_batch(py, n, || {
+            providers::internet::generate_emails_arena(&mut faker.rng, faker.locale, n)
+        });
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random email address.
     #[pyo3(name = "email")]
-    fn py_email(&mut self) -> String {
-        self.email()
+    fn py_email(&self, py: Python<'_>) -> String {
+        self.lock(py).email()
     }
 
     /// Generate a batch of random integers within a range.
     #[pyo3(name = "integers", signature = (n, min = 0, max = 100))]
-    fn py_integers(&mut self, n: usize, min: i64, max: i64) -> PyResult<Vec<i64>> {
-        self.integers(n, min, max)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_integers(&self, py: Python<'_>, n: usize, min: i64, max: i64) -> PyResult<Vec<i64>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.integers(n, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
+    }
+
+    /// Seed the RNG and generate a batch of integers in one call.
+    ///
+    /// Equivalent to `seed(seed)` followed by `integers(n, min, max)`.
+    #[pyo3(name = "integers_seeded", signature = (n, seed, min = 0, max = 100))]
+    fn py_integers_seeded(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        seed: u64,
+        min: i64,
+        max: i64,
+    ) -> PyResult<Vec<i64>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        faker.seed(seed);
+        detach_batch(py, n, || {
+            faker.integers(n, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
+    }
+
+    /// Stream `n` random integers as lists of at most `chunk` values.
+    ///
+    /// Unlike `integers()`, `n` is not capped by the batch size limit: only
+    /// one chunk is materialized at a time, so memory stays bounded by
+    /// `chunk` however many values are requested.
+    #[pyo3(name = "integers_iter", signature = (n, min = 0, max = 100, chunk = 65_536))]
+    fn py_integers_iter(
+        slf: &Bound<'_, Self>,
+        n: usize,
+        min: i64,
+        max: i64,
+        chunk: usize,
+    ) -> PyResult<IntegersIter> {
+        if min > max {
+            return Err(PyValueError::new_err(
+                providers::numbers::RangeError { min, max }.to_string(),
+            ));
+        }
+        if chunk == 0 {
+            return Err(PyValueError::new_err("chunk must be at least 1"));
+        }
+        validate_batch_size(chunk).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(IntegersIter {
+            faker: slf.clone().unbind(),
+            remaining: n,
+            chunk,
+            min,
+            max,
+        })
     }
 
     /// Generate a single random integer within a range.
     #[pyo3(name = "integer", signature = (min = 0, max = 100))]
-    fn py_integer(&mut self, min: i64, max: i64) -> PyResult<i64> {
-        self.integer(min, max)
+    fn py_integer(&self, py: Python<'_>, min: i64, max: i64) -> PyResult<i64> {
+        self.lock(py)
+            .integer(min, max)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
+    /// Generate a batch of random integers as a PyArrow `Int64Array`.
+    ///
+    /// The values stay in a single contiguous buffer instead of being boxed
+    /// into `n` Python ints; call `.to_numpy()` on the result for a zero-copy
+    /// NumPy view.
+    #[pyo3(name = "integers_arrow", signature = (n, min = 0, max = 100))]
+    fn py_integers_arrow(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        min: i64,
+        max: i64,
+    ) -> PyResult<Py<PyAny>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let values = detach_batch(py, n, || {
+            faker.integers(n, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
+        let array: ArrayRef = Arc::new(Int64Array::from(values));
+        PyArray::from_array_ref(array)
+            .into_pyarrow(py)
+            .map(|bound| bound.unbind())
+    }
+
+    /// Generate a batch of random integers as an `array.array('q')`.
+    ///
+    /// Like `integers_arrow()` this keeps the values in one 8-bytes-per-item
+    /// buffer instead of boxing each into a Python int, but it needs only the
+    /// standard library.
+    #[pyo3(name = "integers_array", signature = (n, min = 0, max = 100))]
+    fn py_integers_array<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        min: i64,
+        max: i64,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let values = detach_batch(py, n, || {
+            faker.integers(n, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
+        // array('q') stores native-endian 64-bit ints
+        let bytes = PyBytes::new_with(py, values.len() * 8, |buf| {
+            for (slot, value) in buf.chunks_exact_mut(8).zip(&values) {
+                slot.copy_from_slice(&value.to_ne_bytes());
+            }
+            Ok(())
+        })?;
+        let array = py.import("array")?.getattr("array")?.call1(("q",))?;
+        array.call_method1("frombytes", (bytes,))?;
+        Ok(array)
+    }
+
     /// Generate a batch of random UUIDs (version 4).
     #[pyo3(name = "uuids")]
-    fn py_uuids(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.uuids(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_uuids<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        // Even small batches go through the arena: one RNG fill for all the
+        // bytes instead of one per UUID, and no intermediate Strings
+        let arena = detach_batch(py, n, || {
+            providers::identifiers::generate_uuids_arena(&mut faker.rng, n)
+        });
+        PyList::new(py, arena.iter())
+    }
+
+    /// Seed the RNG and generate a batch of UUIDs in one call.
+    ///
+    /// Equivalent to `seed(seed)` followed by `uuids(n)`.
+    #[pyo3(name = "uuids_seeded")]
+    fn py_uuids_seeded<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        seed: u64,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        faker.seed(seed);
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let arena = detach_batch(py, n, || {
+            providers::identifiers::generate_uuids_arena(&mut faker.rng, n)
+        });
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random UUID (version 4).
     #[pyo3(name = "uuid")]
-    fn py_uuid(&mut self) -> String {
-        self.uuid()
+    fn py_uuid<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
+        // Encoded on the stack and copied straight into the Python string
+        let uuid = providers::identifiers::generate_uuid_ascii(&mut self.lock(py).rng);
+        PyString::new(py, std::str::from_utf8(&uuid).expect("UUIDs are ASCII"))
     }
 
     // === Float Generation ===
 
     /// Generate a batch of random floats within a range.
     #[pyo3(name = "floats", signature = (n, min = 0.0, max = 1.0))]
-    fn py_floats(&mut self, n: usize, min: f64, max: f64) -> PyResult<Vec<f64>> {
-        self.floats(n, min, max)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_floats(&self, py: Python<'_>, n: usize, min: f64, max: f64) -> PyResult<Vec<f64>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.floats(n, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random float within a range.
     #[pyo3(name = "float", signature = (min = 0.0, max = 1.0))]
-    fn py_float(&mut self, min: f64, max: f64) -> PyResult<f64> {
-        self.float(min, max)
+    fn py_float(&self, py: Python<'_>, min: f64, max: f64) -> PyResult<f64> {
+        self.lock(py)
+            .float(min, max)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
+    /// Generate a batch of random floats as a PyArrow `DoubleArray`.
+    ///
+    /// The values stay in a single contiguous buffer instead of being boxed
+    /// into `n` Python floats; call `.to_numpy()` on the result for a
+    /// zero-copy NumPy view.
+    #[pyo3(name = "floats_arrow", signature = (n, min = 0.0, max = 1.0))]
+    fn py_floats_arrow(&self, py: Python<'_>, n: usize, min: f64, max: f64) -> PyResult<Py<PyAny>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let values = detach_batch(py, n, || {
+            faker.floats(n, min, max).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
+        let array: ArrayRef = Arc::new(Float64Array::from(values));
+        PyArray::from_array_ref(array)
+            .into_pyarrow(py)
+            .map(|bound| bound.unbind())
+    }
+
     // === Hash Generation ===
 
     /// Generate a batch of random MD5 hashes.
     #[pyo3(name = "md5s")]
-    fn py_md5s(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.md5s(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_md5s<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.md5()));
+        }
+        let arena = py.detach(|| providers::identifiers::generate_md5s_arena(&mut faker.rng, n));
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random MD5 hash.
     #[pyo3(name = "md5")]
-    fn py_md5(&mut self) -> String {
-        self.md5()
+    fn py_md5(&self, py: Python<'_>) -> String {
+        self.lock(py).md5()
     }
 
     /// Generate a batch of random SHA256 hashes.
     #[pyo3(name = "sha256s")]
-    fn py_sha256s(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.sha256s(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_sha256s<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.sha256()));
+        }
+        let arena = py.detach(|| providers::identifiers::generate_sha256s_arena(&mut faker.rng, n));
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random SHA256 hash.
     #[pyo3(name = "sha256")]
-    fn py_sha256(&mut self) -> String {
-        self.sha256()
+    fn py_sha256(&self, py: Python<'_>) -> String {
+        self.lock(py).sha256()
     }
 
     // === Color Generation ===
 
     /// Generate a batch of random color names.
     #[pyo3(name = "colors", signature = (n, unique=false))]
-    fn py_colors(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.colors(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_colors<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let table = get_locale_data(faker.locale).color_names().unwrap_or(&[]);
+        faker.interned_batch(py, n, unique, table, Faker::colors)
     }
 
     /// Generate a single random color name.
     #[pyo3(name = "color")]
-    fn py_color(&mut self) -> String {
-        self.color()
+    fn py_color(&self, py: Python<'_>) -> String {
+        self.lock(py).color()
     }
 
     /// Generate a batch of random hex colors.
     #[pyo3(name = "hex_colors")]
-    fn py_hex_colors(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.hex_colors(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_hex_colors<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.hex_color()));
+        }
+        let arena = py.detach(|| providers::colors::generate_hex_colors_arena(&mut faker.rng, n));
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random hex color.
     #[pyo3(name = "hex_color")]
-    fn py_hex_color(&mut self) -> String {
-        self.hex_color()
+    fn py_hex_color(&self, py: Python<'_>) -> String {
+        self.lock(py).hex_color()
     }
 
     /// Generate a batch of random RGB color tuples.
     #[pyo3(name = "rgb_colors")]
-    fn py_rgb_colors(&mut self, n: usize) -> PyResult<Vec<(u8, u8, u8)>> {
-        self.rgb_colors(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_rgb_colors(&self, py: Python<'_>, n: usize) -> PyResult<Vec<(u8, u8, u8)>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.rgb_colors(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random RGB color tuple.
     #[pyo3(name = "rgb_color")]
-    fn py_rgb_color(&mut self) -> (u8, u8, u8) {
-        self.rgb_color()
+    fn py_rgb_color(&self, py: Python<'_>) -> (u8, u8, u8) {
+        self.lock(py).rgb_color()
     }
 
     // === DateTime Generation ===
 
     /// Generate a batch of random dates within a range.
     #[pyo3(name = "dates", signature = (n, start = "2000-01-01", end = "2030-12-31"))]
-    fn py_dates(&mut self, n: usize, start: &str, end: &str) -> PyResult<Vec<String>> {
-        self.dates(n, start, end)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_dates(&self, py: Python<'_>, n: usize, start: &str, end: &str) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.dates(n, start, end).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random date within a range.
     #[pyo3(name = "date", signature = (start = "2000-01-01", end = "2030-12-31"))]
-    fn py_date(&mut self, start: &str, end: &str) -> PyResult<String> {
-        self.date(start, end)
+    fn py_date(&self, py: Python<'_>, start: &str, end: &str) -> PyResult<String> {
+        self.lock(py)
+            .date(start, end)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
     /// Generate a batch of random dates of birth.
     #[pyo3(name = "dates_of_birth", signature = (n, min_age = 18, max_age = 80))]
-    fn py_dates_of_birth(&mut self, n: usize, min_age: u32, max_age: u32) -> PyResult<Vec<String>> {
-        self.dates_of_birth(n, min_age, max_age)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_dates_of_birth(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        min_age: u32,
+        max_age: u32,
+    ) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker
+                .dates_of_birth(n, min_age, max_age)
+                .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random date of birth.
     #[pyo3(name = "date_of_birth", signature = (min_age = 18, max_age = 80))]
-    fn py_date_of_birth(&mut self, min_age: u32, max_age: u32) -> PyResult<String> {
-        self.date_of_birth(min_age, max_age)
+    fn py_date_of_birth(&self, py: Python<'_>, min_age: u32, max_age: u32) -> PyResult<String> {
+        self.lock(py)
+            .date_of_birth(min_age, max_age)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
     /// Generate a batch of random datetimes within a range.
     #[pyo3(name = "datetimes", signature = (n, start = "2000-01-01", end = "2030-12-31"))]
-    fn py_datetimes(&mut self, n: usize, start: &str, end: &str) -> PyResult<Vec<String>> {
-        self.datetimes(n, start, end)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_datetimes(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        start: &str,
+        end: &str,
+    ) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.datetimes(n, start, end).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random datetime within a range.
     #[pyo3(name = "datetime", signature = (start = "2000-01-01", end = "2030-12-31"))]
-    fn py_datetime(&mut self, start: &str, end: &str) -> PyResult<String> {
-        self.datetime(start, end)
+    fn py_datetime(&self, py: Python<'_>, start: &str, end: &str) -> PyResult<String> {
+        self.lock(py)
+            .datetime(start, end)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
@@ -1804,365 +2287,511 @@ impl Faker {
 
     /// Generate a batch of random sentences.
     #[pyo3(name = "sentences", signature = (n, word_count = 10))]
-    fn py_sentences(&mut self, n: usize, word_count: usize) -> PyResult<Vec<String>> {
-        self.sentences(n, word_count)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_sentences<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        word_count: usize,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.sentence(word_count)));
+        }
+        let arena = py.detach(|| {
+            providers::text::generate_sentences_arena(&mut faker.rng, faker.locale, n, word_count)
+        });
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random sentence.
     #[pyo3(name = "sentence", signature = (word_count = 10))]
-    fn py_sentence(&mut self, word_count: usize) -> String {
-        self.sentence(word_count)
+    fn py_sentence(&self, py: Python<'_>, word_count: usize) -> String {
+        self.lock(py).sentence(word_count)
     }
 
     /// Generate a batch of random paragraphs.
     #[pyo3(name = "paragraphs", signature = (n, sentence_count = 5))]
-    fn py_paragraphs(&mut self, n: usize, sentence_count: usize) -> PyResult<Vec<String>> {
-        self.paragraphs(n, sentence_count)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_paragraphs<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        sentence_count: usize,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.paragraph(sentence_count)));
+        }
+        let arena = py.detach(|| {
+            providers::text::generate_paragraphs_arena(
+                &mut faker.rng,
+                faker.locale,
+                n,
+                sentence_count,
+            )
+        });
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random paragraph.
     #[pyo3(name = "paragraph", signature = (sentence_count = 5))]
-    fn py_paragraph(&mut self, sentence_count: usize) -> String {
-        self.paragraph(sentence_count)
+    fn py_paragraph(&self, py: Python<'_>, sentence_count: usize) -> String {
+        self.lock(py).paragraph(sentence_count)
     }
 
     /// Generate a batch of random text blocks.
     #[pyo3(name = "texts", signature = (n, min_chars = 50, max_chars = 200))]
-    fn py_texts(&mut self, n: usize, min_chars: usize, max_chars: usize) -> PyResult<Vec<String>> {
-        self.texts(n, min_chars, max_chars)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_texts<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        min_chars: usize,
+        max_chars: usize,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.text(min_chars, max_chars)));
+        }
+        let arena = py.detach(|| {
+            providers::text::generate_texts_arena(
+                &mut faker.rng,
+                faker.locale,
+                n,
+                min_chars,
+                max_chars,
+            )
+        });
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random text block.
     #[pyo3(name = "text", signature = (min_chars = 50, max_chars = 200))]
-    fn py_text(&mut self, min_chars: usize, max_chars: usize) -> String {
-        self.text(min_chars, max_chars)
+    fn py_text(&self, py: Python<'_>, min_chars: usize, max_chars: usize) -> String {
+        self.lock(py).text(min_chars, max_chars)
     }
 
     // === Address Generation ===
 
     /// Generate a batch of random street addresses.
     #[pyo3(name = "street_addresses", signature = (n, unique=false))]
-    fn py_street_addresses(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.street_addresses(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_street_addresses(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.street_addresses(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random street address.
     #[pyo3(name = "street_address")]
-    fn py_street_address(&mut self) -> String {
-        self.street_address()
+    fn py_street_address(&self, py: Python<'_>) -> String {
+        self.lock(py).street_address()
     }
 
     /// Generate a batch of random cities.
     #[pyo3(name = "cities", signature = (n, unique=false))]
-    fn py_cities(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.cities(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_cities<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let table = get_locale_data(faker.locale).cities().unwrap_or(&[]);
+        faker.interned_batch(py, n, unique, table, Faker::cities)
     }
 
     /// Generate a single random city.
     #[pyo3(name = "city")]
-    fn py_city(&mut self) -> String {
-        self.city()
+    fn py_city(&self, py: Python<'_>) -> String {
+        self.lock(py).city()
     }
 
     /// Generate a batch of random states.
     #[pyo3(name = "states", signature = (n, unique=false))]
-    fn py_states(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.states(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_states<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let table = get_locale_data(faker.locale).regions().unwrap_or(&[]);
+        faker.interned_batch(py, n, unique, table, Faker::states)
     }
 
     /// Generate a single random state.
     #[pyo3(name = "state")]
-    fn py_state(&mut self) -> String {
-        self.state()
+    fn py_state(&self, py: Python<'_>) -> String {
+        self.lock(py).state()
     }
 
     /// Generate a batch of random countries.
     #[pyo3(name = "countries", signature = (n, unique=false))]
-    fn py_countries(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.countries(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_countries<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let table = data::en_us::COUNTRIES;
+        faker.interned_batch(py, n, unique, table, Faker::countries)
     }
 
     /// Generate a single random country.
     #[pyo3(name = "country")]
-    fn py_country(&mut self) -> String {
-        self.country()
+    fn py_country(&self, py: Python<'_>) -> String {
+        self.lock(py).country()
     }
 
     /// Generate a batch of random zip codes.
     #[pyo3(name = "zip_codes", signature = (n, unique=false))]
-    fn py_zip_codes(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.zip_codes(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_zip_codes(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.zip_codes(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random zip code.
     #[pyo3(name = "zip_code")]
-    fn py_zip_code(&mut self) -> String {
-        self.zip_code()
+    fn py_zip_code(&self, py: Python<'_>) -> String {
+        self.lock(py).zip_code()
     }
 
     /// Generate a batch of random full addresses.
     #[pyo3(name = "addresses", signature = (n, unique=false))]
-    fn py_addresses(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.addresses(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_addresses(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.addresses(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random full address.
     #[pyo3(name = "address")]
-    fn py_address(&mut self) -> String {
-        self.address()
+    fn py_address(&self, py: Python<'_>) -> String {
+        self.lock(py).address()
     }
 
     // === Phone Generation ===
 
     /// Generate a batch of random phone numbers.
     #[pyo3(name = "phone_numbers", signature = (n, unique=false))]
-    fn py_phone_numbers(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.phone_numbers(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_phone_numbers(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.phone_numbers(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random phone number.
     #[pyo3(name = "phone_number")]
-    fn py_phone_number(&mut self) -> String {
-        self.phone_number()
+    fn py_phone_number(&self, py: Python<'_>) -> String {
+        self.lock(py).phone_number()
     }
 
     // === Company Generation ===
 
     /// Generate a batch of random company names.
     #[pyo3(name = "companies", signature = (n, unique=false))]
-    fn py_companies(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.companies(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_companies(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.companies(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random company name.
     #[pyo3(name = "company")]
-    fn py_company(&mut self) -> String {
-        self.company()
+    fn py_company(&self, py: Python<'_>) -> String {
+        self.lock(py).company()
     }
 
     /// Generate a batch of random job titles.
     #[pyo3(name = "jobs", signature = (n, unique=false))]
-    fn py_jobs(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.jobs(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_jobs<'py>(
+        &self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let table = get_locale_data(faker.locale).job_titles().unwrap_or(&[]);
+        faker.interned_batch(py, n, unique, table, Faker::jobs)
     }
 
     /// Generate a single random job title.
     #[pyo3(name = "job")]
-    fn py_job(&mut self) -> String {
-        self.job()
+    fn py_job(&self, py: Python<'_>) -> String {
+        self.lock(py).job()
     }
 
     /// Generate a batch of random catch phrases.
     #[pyo3(name = "catch_phrases", signature = (n, unique=false))]
-    fn py_catch_phrases(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.catch_phrases(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_catch_phrases(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.catch_phrases(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random catch phrase.
     #[pyo3(name = "catch_phrase")]
-    fn py_catch_phrase(&mut self) -> String {
-        self.catch_phrase()
+    fn py_catch_phrase(&self, py: Python<'_>) -> String {
+        self.lock(py).catch_phrase()
     }
 
     // === Network Generation ===
 
     /// Generate a batch of random URLs.
     #[pyo3(name = "urls")]
-    fn py_urls(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.urls(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_urls(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.urls(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random URL.
     #[pyo3(name = "url")]
-    fn py_url(&mut self) -> String {
-        self.url()
+    fn py_url(&self, py: Python<'_>) -> String {
+        self.lock(py).url()
     }
 
     /// Generate a batch of random domain names.
     #[pyo3(name = "domain_names")]
-    fn py_domain_names(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.domain_names(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_domain_names(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.domain_names(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random domain name.
     #[pyo3(name = "domain_name")]
-    fn py_domain_name(&mut self) -> String {
-        self.domain_name()
+    fn py_domain_name(&self, py: Python<'_>) -> String {
+        self.lock(py).domain_name()
     }
 
     /// Generate a batch of random IPv4 addresses.
     #[pyo3(name = "ipv4s")]
-    fn py_ipv4s(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.ipv4s(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_ipv4s(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.ipv4s(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random IPv4 address.
     #[pyo3(name = "ipv4")]
-    fn py_ipv4(&mut self) -> String {
-        self.ipv4()
+    fn py_ipv4(&self, py: Python<'_>) -> String {
+        self.lock(py).ipv4()
     }
 
     /// Generate a batch of random IPv6 addresses.
     #[pyo3(name = "ipv6s")]
-    fn py_ipv6s(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.ipv6s(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_ipv6s<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.ipv6()));
+        }
+        let arena = py.detach(|| providers::network::generate_ipv6s_arena(&mut faker.rng, n));
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random IPv6 address.
     #[pyo3(name = "ipv6")]
-    fn py_ipv6(&mut self) -> String {
-        self.ipv6()
+    fn py_ipv6(&self, py: Python<'_>) -> String {
+        self.lock(py).ipv6()
     }
 
     /// Generate a batch of random MAC addresses.
     #[pyo3(name = "mac_addresses")]
-    fn py_mac_addresses(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.mac_addresses(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_mac_addresses<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        if n < DETACH_THRESHOLD {
+            return PyList::new(py, (0..n).map(|_| faker.mac_address()));
+        }
+        let arena =
+            py.detach(|| providers::network::generate_mac_addresses_arena(&mut faker.rng, n));
+        PyList::new(py, arena.iter())
     }
 
     /// Generate a single random MAC address.
     #[pyo3(name = "mac_address")]
-    fn py_mac_address(&mut self) -> String {
-        self.mac_address()
+    fn py_mac_address(&self, py: Python<'_>) -> String {
+        self.lock(py).mac_address()
     }
 
     // === Email Variants ===
 
     /// Generate a batch of random safe email addresses (example.com/org/net).
     #[pyo3(name = "safe_emails", signature = (n, unique=false))]
-    fn py_safe_emails(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.safe_emails(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_safe_emails(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.safe_emails(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random safe email address.
     #[pyo3(name = "safe_email")]
-    fn py_safe_email(&mut self) -> String {
-        self.safe_email()
+    fn py_safe_email(&self, py: Python<'_>) -> String {
+        self.lock(py).safe_email()
     }
 
     /// Generate a batch of random free email addresses (gmail.com, etc.).
     #[pyo3(name = "free_emails", signature = (n, unique=false))]
-    fn py_free_emails(&mut self, n: usize, unique: bool) -> PyResult<Vec<String>> {
-        self.free_emails(n, unique)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_free_emails(&self, py: Python<'_>, n: usize, unique: bool) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.free_emails(n, unique).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random free email address.
     #[pyo3(name = "free_email")]
-    fn py_free_email(&mut self) -> String {
-        self.free_email()
+    fn py_free_email(&self, py: Python<'_>) -> String {
+        self.lock(py).free_email()
     }
 
     // === Finance Generation ===
 
     /// Generate a batch of random credit card numbers with valid Luhn checksums.
     #[pyo3(name = "credit_cards")]
-    fn py_credit_cards(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.credit_cards(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_credit_cards(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.credit_cards(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random credit card number with valid Luhn checksum.
     #[pyo3(name = "credit_card")]
-    fn py_credit_card(&mut self) -> String {
-        self.credit_card()
+    fn py_credit_card(&self, py: Python<'_>) -> String {
+        self.lock(py).credit_card()
     }
 
     /// Generate a batch of random IBANs with valid checksums.
     #[pyo3(name = "ibans")]
-    fn py_ibans(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.ibans(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_ibans(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.ibans(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random IBAN with valid checksum.
     #[pyo3(name = "iban")]
-    fn py_iban(&mut self) -> String {
-        self.iban()
+    fn py_iban(&self, py: Python<'_>) -> String {
+        self.lock(py).iban()
     }
 
     /// Generate a batch of random BIC/SWIFT codes.
     #[pyo3(name = "bics")]
-    fn py_bics(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.bics(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_bics(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.bics(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random BIC/SWIFT code.
     #[pyo3(name = "bic")]
-    fn py_bic(&mut self) -> String {
-        self.bic()
+    fn py_bic(&self, py: Python<'_>) -> String {
+        self.lock(py).bic()
     }
 
     /// Generate a batch of random bank account numbers.
     #[pyo3(name = "bank_accounts")]
-    fn py_bank_accounts(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.bank_accounts(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_bank_accounts(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.bank_accounts(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random bank account number.
     #[pyo3(name = "bank_account")]
-    fn py_bank_account(&mut self) -> String {
-        self.bank_account()
+    fn py_bank_account(&self, py: Python<'_>) -> String {
+        self.lock(py).bank_account()
     }
 
     /// Generate a batch of random bank names.
     #[pyo3(name = "bank_names")]
-    fn py_bank_names(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.bank_names(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_bank_names<'py>(&self, py: Python<'py>, n: usize) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let table = get_locale_data(faker.locale).bank_names().unwrap_or(&[]);
+        faker.interned_batch(py, n, false, table, |faker, n, _| faker.bank_names(n))
     }
 
     /// Generate a single random bank name.
     #[pyo3(name = "bank_name")]
-    fn py_bank_name(&mut self) -> String {
-        self.bank_name()
+    fn py_bank_name(&self, py: Python<'_>) -> String {
+        self.lock(py).bank_name()
     }
 
     /// Generate a batch of UK sort codes.
     #[pyo3(name = "sort_codes")]
-    fn py_sort_codes(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.sort_codes(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_sort_codes(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || faker.sort_codes(n).map_err(|e| e.to_string()))
+            .map_err(PyValueError::new_err)
     }
 
     /// Generate a single UK sort code (format: XX-XX-XX).
     #[pyo3(name = "sort_code")]
-    fn py_sort_code(&mut self) -> String {
-        self.sort_code()
+    fn py_sort_code(&self, py: Python<'_>) -> String {
+        self.lock(py).sort_code()
     }
 
     /// Generate a batch of UK bank account numbers (8 digits).
     #[pyo3(name = "uk_account_numbers")]
-    fn py_uk_account_numbers(&mut self, n: usize) -> PyResult<Vec<String>> {
-        self.uk_account_numbers(n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_uk_account_numbers(&self, py: Python<'_>, n: usize) -> PyResult<Vec<String>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker.uk_account_numbers(n).map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single UK bank account number (8 digits).
     #[pyo3(name = "uk_account_number")]
-    fn py_uk_account_number(&mut self) -> String {
-        self.uk_account_number()
+    fn py_uk_account_number(&self, py: Python<'_>) -> String {
+        self.lock(py).uk_account_number()
     }
 
     /// Generate a batch of financial transactions.
@@ -2178,42 +2807,62 @@ impl Faker {
     ///     transaction_type, description, balance
     #[pyo3(name = "transactions")]
     fn py_transactions(
-        &mut self,
+        &self,
         py: Python<'_>,
         n: usize,
         starting_balance: f64,
         start_date: &str,
         end_date: &str,
     ) -> PyResult<Vec<Py<PyAny>>> {
-        let txns = self
-            .transactions(n, starting_balance, start_date, end_date)
-            .map_err(|e| PyValueError::new_err(e.to_string()))?;
-
-        txns.into_iter()
-            .map(|t| {
-                let dict = PyDict::new(py);
-                dict.set_item("reference", &t.reference)?;
-                dict.set_item("date", &t.date)?;
-                dict.set_item("amount", t.amount)?;
-                dict.set_item("transaction_type", &t.transaction_type)?;
-                dict.set_item("description", &t.description)?;
-                dict.set_item("balance", t.balance)?;
-                dict.into_py_any(py)
-            })
-            .collect()
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let txns = detach_batch(py, n, || {
+            faker
+                .transactions(n, starting_balance, start_date, end_date)
+                .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
+
+        // Collecting into PyResult<Vec<_>> cannot preallocate, so push into
+        // an exactly sized Vec instead
+        let mut dicts = Vec::with_capacity(txns.len());
+        for t in txns {
+            let dict = PyDict::new(py);
+            dict.set_item("reference", &t.reference)?;
+            dict.set_item("date", &t.date)?;
+            dict.set_item("amount", t.amount)?;
+            dict.set_item("transaction_type", &t.transaction_type)?;
+            dict.set_item("description", &t.description)?;
+            dict.set_item("balance", t.balance)?;
+            dicts.push(dict.into_py_any(py)?);
+        }
+        Ok(dicts)
     }
 
     /// Generate a batch of transaction amounts.
     #[pyo3(name = "transaction_amounts")]
-    fn py_transaction_amounts(&mut self, n: usize, min: f64, max: f64) -> PyResult<Vec<f64>> {
-        self.transaction_amounts(n, min, max)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_transaction_amounts(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        min: f64,
+        max: f64,
+    ) -> PyResult<Vec<f64>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker
+                .transaction_amounts(n, min, max)
+                .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single transaction amount.
     #[pyo3(name = "transaction_amount")]
-    fn py_transaction_amount(&mut self, min: f64, max: f64) -> PyResult<f64> {
-        self.transaction_amount(min, max)
+    fn py_transaction_amount(&self, py: Python<'_>, min: f64, max: f64) -> PyResult<f64> {
+        self.lock(py)
+            .transaction_amount(min, max)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
@@ -2236,7 +2885,8 @@ impl Faker {
     ///     ValueError: If no character sets are enabled or batch size exceeds limit
     #[pyo3(name = "passwords", signature = (n, length=12, uppercase=true, lowercase=true, digits=true, symbols=true))]
     fn py_passwords(
-        &mut self,
+        &self,
+        py: Python<'_>,
         n: usize,
         length: usize,
         uppercase: bool,
@@ -2244,8 +2894,14 @@ impl Faker {
         digits: bool,
         symbols: bool,
     ) -> PyResult<Vec<String>> {
-        self.passwords(n, length, uppercase, lowercase, digits, symbols)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        detach_batch(py, n, || {
+            faker
+                .passwords(n, length, uppercase, lowercase, digits, symbols)
+                .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)
     }
 
     /// Generate a single random password.
@@ -2264,14 +2920,16 @@ impl Faker {
     ///     ValueError: If no character sets are enabled
     #[pyo3(name = "password", signature = (length=12, uppercase=true, lowercase=true, digits=true, symbols=true))]
     fn py_password(
-        &mut self,
+        &self,
+        py: Python<'_>,
         length: usize,
         uppercase: bool,
         lowercase: bool,
         digits: bool,
         symbols: bool,
     ) -> PyResult<String> {
-        self.password(length, uppercase, lowercase, digits, symbols)
+        self.lock(py)
+            .password(length, uppercase, lowercase, digits, symbols)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
@@ -2292,8 +2950,9 @@ impl Faker {
     ///     >>> fake.generate("department")
     ///     'Sales'
     #[pyo3(name = "add_provider")]
-    fn py_add_provider(&mut self, name: &str, options: Vec<String>) -> PyResult<()> {
-        self.add_provider(name, options)
+    fn py_add_provider(&self, py: Python<'_>, name: &str, options: Vec<String>) -> PyResult<()> {
+        self.lock(py)
+            .add_provider(name, options)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
@@ -2313,11 +2972,30 @@ impl Faker {
     ///     'active'
     #[pyo3(name = "add_weighted_provider")]
     fn py_add_weighted_provider(
-        &mut self,
+        &self,
+        py: Python<'_>,
         name: &str,
-        weighted_options: Vec<(String, u64)>,
+        weighted_options: Vec<(String, i128)>,
     ) -> PyResult<()> {
-        self.add_weighted_provider(name, weighted_options)
+        // Extract weights as i128 so negative values get a ValueError here
+        // rather than an OverflowError from the u64 conversion
+        let pairs = weighted_options
+            .into_iter()
+            .map(|(value, weight)| {
+                if weight < 0 {
+                    return Err(PyValueError::new_err(format!(
+                        "Weight for '{}' must be non-negative, got {}",
+                        value, weight
+                    )));
+                }
+                let weight = u64::try_from(weight).map_err(|_| {
+                    PyValueError::new_err(format!("Weight for '{}' is too large", value))
+                })?;
+                Ok((value, weight))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        self.lock(py)
+            .add_weighted_provider(name, pairs)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
@@ -2329,8 +3007,8 @@ impl Faker {
     /// Returns:
     ///     True if provider was removed, False if it didn't exist
     #[pyo3(name = "remove_provider")]
-    fn py_remove_provider(&mut self, name: &str) -> bool {
-        self.remove_provider(name)
+    fn py_remove_provider(&self, py: Python<'_>, name: &str) -> bool {
+        self.lock(py).remove_provider(name)
     }
 
     /// Check if a custom provider exists.
@@ -2341,8 +3019,8 @@ impl Faker {
     /// Returns:
     ///     True if provider exists, False otherwise
     #[pyo3(name = "has_provider")]
-    fn py_has_provider(&self, name: &str) -> bool {
-        self.has_provider(name)
+    fn py_has_provider(&self, py: Python<'_>, name: &str) -> bool {
+        self.lock(py).has_provider(name)
     }
 
     /// List all registered custom provider names.
@@ -2350,8 +3028,8 @@ impl Faker {
     /// Returns:
     ///     List of registered custom provider names
     #[pyo3(name = "list_providers")]
-    fn py_list_providers(&self) -> Vec<String> {
-        self.list_providers()
+    fn py_list_providers(&self, py: Python<'_>) -> Vec<String> {
+        self.lock(py).list_providers()
     }
 
     /// Generate a single value from a custom provider.
@@ -2365,8 +3043,9 @@ impl Faker {
     /// Raises:
     ///     ValueError: If provider doesn't exist
     #[pyo3(name = "generate")]
-    fn py_generate(&mut self, name: &str) -> PyResult<String> {
-        self.generate(name)
+    fn py_generate(&self, py: Python<'_>, name: &str) -> PyResult<String> {
+        self.lock(py)
+            .generate(name)
             .map_err(|e| PyValueError::new_err(e.to_string()))
     }
 
@@ -2382,9 +3061,36 @@ impl Faker {
     /// Raises:
     ///     ValueError: If provider doesn't exist or n exceeds batch limit
     #[pyo3(name = "generate_batch")]
-    fn py_generate_batch(&mut self, name: &str, n: usize) -> PyResult<Vec<String>> {
-        self.generate_batch(name, n)
-            .map_err(|e| PyValueError::new_err(e.to_string()))
+    fn py_generate_batch<'py>(
+        &self,
+        py: Python<'py>,
+        name: &str,
+        n: usize,
+    ) -> PyResult<Bound<'py, PyList>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let provider = faker.custom_providers.get(name).ok_or_else(|| {
+            PyValueError::new_err(CustomProviderError::NotFound(name.to_string()).to_string())
+        })?;
+        let rng = &mut faker.rng;
+        let indices = detach_batch(py, n, || provider.sample_indices(rng, n));
+
+        // Custom values are a closed set: build each distinct value's
+        // PyString once and fill the list with reference-count bumps.
+        let values = provider.values();
+        if values.len() > n {
+            return PyList::new(py, indices.iter().map(|&i| values[i].as_str()));
+        }
+        let mut strings: Vec<Option<Bound<'py, PyString>>> = vec![None; values.len()];
+        PyList::new(
+            py,
+            indices.iter().map(|&i| {
+                strings[i]
+                    .get_or_insert_with(|| PyString::new(py, &values[i]))
+                    .clone()
+            }),
+        )
     }
 
     // === Records Generation ===
@@ -2400,31 +3106,35 @@ impl Faker {
     /// - Date range: ("date", start, end)
     /// - Choice: ("choice", ["option1", "option2", ...])
     #[pyo3(name = "records")]
-    fn py_records(&mut self, n: usize, schema: &Bound<'_, PyDict>) -> PyResult<Vec<Py<PyAny>>> {
-        let py = schema.py();
-        let custom_names = self.custom_provider_names();
-        let rust_schema = parse_py_schema_with_custom(schema, &custom_names)?;
+    fn py_records(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        schema: &Bound<'_, PyDict>,
+    ) -> PyResult<Vec<Py<PyAny>>> {
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let rust_schema = parse_py_schema_with_custom(schema, &faker.custom_providers)?;
         validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-        let records = providers::records::generate_records_with_custom(
-            &mut self.rng,
-            self.locale,
-            n,
-            &rust_schema,
-            &self.custom_providers,
-        )
-        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        // Generate rows as tuples (same RNG order as dicts, no per-row key
+        // clones) and attach the keys while converting
+        let field_order: Vec<String> = rust_schema.keys().cloned().collect();
 
-        records
-            .into_iter()
-            .map(|record| {
-                let dict = PyDict::new(py);
-                for (key, value) in record {
-                    dict.set_item(key, value_to_pyobject(py, value)?)?;
-                }
-                dict.into_py_any(py)
-            })
-            .collect()
+        let records = detach_batch(py, n, || {
+            providers::records::generate_records_tuples_with_custom(
+                &mut faker.rng,
+                faker.locale,
+                n,
+                &rust_schema,
+                &field_order,
+                &faker.custom_providers,
+            )
+            .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
+
+        rows_to_dicts(py, &field_order, records)
     }
 
     /// Generate records as tuples based on a schema.
@@ -2433,38 +3143,33 @@ impl Faker {
     /// This is faster than records() since it avoids creating dictionaries.
     #[pyo3(name = "records_tuples")]
     fn py_records_tuples(
-        &mut self,
+        &self,
+        py: Python<'_>,
         n: usize,
         schema: &Bound<'_, PyDict>,
     ) -> PyResult<Vec<Py<PyAny>>> {
-        let py = schema.py();
-        let custom_names = self.custom_provider_names();
-        let rust_schema = parse_py_schema_with_custom(schema, &custom_names)?;
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let rust_schema = parse_py_schema_with_custom(schema, &faker.custom_providers)?;
         validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
         // Get field order from BTreeMap (sorted alphabetically)
         let field_order: Vec<String> = rust_schema.keys().cloned().collect();
 
-        let records = providers::records::generate_records_tuples_with_custom(
-            &mut self.rng,
-            self.locale,
-            n,
-            &rust_schema,
-            &field_order,
-            &self.custom_providers,
-        )
-        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let records = detach_batch(py, n, || {
+            providers::records::generate_records_tuples_with_custom(
+                &mut faker.rng,
+                faker.locale,
+                n,
+                &rust_schema,
+                &field_order,
+                &faker.custom_providers,
+            )
+            .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
 
-        records
-            .into_iter()
-            .map(|record| {
-                let values: Vec<Py<PyAny>> = record
-                    .into_iter()
-                    .map(|v| value_to_pyobject(py, v))
-                    .collect::<PyResult<_>>()?;
-                PyTuple::new(py, values)?.into_py_any(py)
-            })
-            .collect()
+        rows_to_tuples(py, records)
     }
 
     /// Generate records as a PyArrow RecordBatch.
@@ -2502,23 +3207,27 @@ impl Faker {
     /// ```
     #[pyo3(name = "records_arrow")]
     fn py_records_arrow(
-        &mut self,
+        &self,
         py: Python<'_>,
         n: usize,
         schema: &Bound<'_, PyDict>,
     ) -> PyResult<Py<PyAny>> {
-        let custom_names = self.custom_provider_names();
-        let rust_schema = parse_py_schema_with_custom(schema, &custom_names)?;
+        let mut faker = self.lock(py);
+        let faker = &mut *faker;
+        let rust_schema = parse_py_schema_with_custom(schema, &faker.custom_providers)?;
         validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
 
-        let record_batch = providers::records::generate_records_arrow_with_custom(
-            &mut self.rng,
-            self.locale,
-            n,
-            &rust_schema,
-            &self.custom_providers,
-        )
-        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        let record_batch = detach_batch(py, n, || {
+            providers::records::generate_records_arrow_with_custom(
+                &mut faker.rng,
+                faker.locale,
+                n,
+                &rust_schema,
+                &faker.custom_providers,
+            )
+            .map_err(|e| e.to_string())
+        })
+        .map_err(PyValueError::new_err)?;
 
         // Convert to PyArrow RecordBatch via pyo3-arrow
         let py_batch = PyRecordBatch::new(record_batch);
@@ -2577,14 +3286,16 @@ impl Faker {
     ) -> PyResult<Bound<'py, PyAny>> {
         use pyo3_async_runtimes::tokio::future_into_py;
 
-        let mut state = self.prepare_async_state(n, schema, chunk_size)?;
+        let mut state = self.lock(py).prepare_async_state(n, schema, chunk_size)?;
 
         future_into_py(py, async move {
-            let records = providers::async_records::generate_records_async(
+            let field_order: Vec<String> = state.schema.keys().cloned().collect();
+            let records = providers::async_records::generate_records_tuples_async(
                 &mut state.rng,
                 state.locale,
                 n,
                 &state.schema,
+                &field_order,
                 state.chunk_size,
                 &state.custom_providers,
             )
@@ -2592,19 +3303,7 @@ impl Faker {
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
 
             // Convert to Python objects
-            Python::attach(|py| {
-                let py_records: PyResult<Vec<Py<PyAny>>> = records
-                    .into_iter()
-                    .map(|record| {
-                        let dict = PyDict::new(py);
-                        for (key, value) in record {
-                            dict.set_item(key, value_to_pyobject(py, value)?)?;
-                        }
-                        dict.into_py_any(py)
-                    })
-                    .collect();
-                py_records
-            })
+            Python::attach(|py| rows_to_dicts(py, &field_order, records))
         })
     }
 
@@ -2632,7 +3331,7 @@ impl Faker {
     ) -> PyResult<Bound<'py, PyAny>> {
         use pyo3_async_runtimes::tokio::future_into_py;
 
-        let mut state = self.prepare_async_state(n, schema, chunk_size)?;
+        let mut state = self.lock(py).prepare_async_state(n, schema, chunk_size)?;
         let field_order: Vec<String> = state.schema.keys().cloned().collect();
 
         future_into_py(py, async move {
@@ -2649,19 +3348,7 @@ impl Faker {
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
 
             // Convert to Python objects
-            Python::attach(|py| {
-                let py_records: PyResult<Vec<Py<PyAny>>> = records
-                    .into_iter()
-                    .map(|record| {
-                        let values: Vec<Py<PyAny>> = record
-                            .into_iter()
-                            .map(|v| value_to_pyobject(py, v))
-                            .collect::<PyResult<_>>()?;
-                        PyTuple::new(py, values)?.into_py_any(py)
-                    })
-                    .collect();
-                py_records
-            })
+            Python::attach(|py| rows_to_tuples(py, records))
         })
     }
 
@@ -2689,7 +3376,7 @@ impl Faker {
     ) -> PyResult<Bound<'py, PyAny>> {
         use pyo3_async_runtimes::tokio::future_into_py;
 
-        let mut state = self.prepare_async_state(n, schema, chunk_size)?;
+        let mut state = self.lock(py).prepare_async_state(n, schema, chunk_size)?;
 
         future_into_py(py, async move {
             let record_batch = providers::async_records::generate_records_arrow_async(
@@ -2725,6 +3412,24 @@ struct AsyncRecordState {
     custom_providers: HashMap<String, CustomProvider>,
 }
 
+impl PyFaker {
+    /// Lock the generator for the duration of one call.
+    ///
+    /// If another thread holds the lock, wait for it with the GIL released:
+    /// blocking while attached would deadlock against a holder that needs
+    /// the GIL back to finish its call. A poisoned lock is recovered, since
+    /// a panic mid-call leaves the RNG in a valid (if unpredictable) state.
+    fn lock(&self, py: Python<'_>) -> MutexGuard<'_, Faker> {
+        loop {
+            match self.inner.try_lock() {
+                Ok(guard) => return guard,
+                Err(TryLockError::Poisoned(poisoned)) => return poisoned.into_inner(),
+                Err(TryLockError::WouldBlock) => py.detach(|| drop(self.inner.lock())),
+            }
+        }
+    }
+}
+
 impl Faker {
     /// Prepare state for async record generation.
     ///
@@ -2736,8 +3441,7 @@ impl Faker {
         chunk_size: Option<usize>,
     ) -> PyResult<AsyncRecordState> {
         validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
-        let custom_names = self.custom_provider_names();
-        let rust_schema = parse_py_schema_with_custom(schema, &custom_names)?;
+        let rust_schema = parse_py_schema_with_custom(schema, &self.custom_providers)?;
 
         Ok(AsyncRecordState {
             rng: self.rng.clone(),
@@ -2747,12 +3451,57 @@ impl Faker {
             custom_providers: self.custom_providers.clone(),
         })
     }
+
+    /// Return a closed-set batch as a list of interned Python strings.
+    ///
+    /// `table` must be the table the non-unique generator draws from with
+    /// `rng.choose`, so the output is identical to `generate` for the same
+    /// seed. Unique batches and locales without the table fall back to
+    /// `generate` itself.
+    fn interned_batch<'py, E: std::fmt::Display>(
+        &mut self,
+        py: Python<'py>,
+        n: usize,
+        unique: bool,
+        table: &'static [&'static str],
+        generate: impl FnOnce(&mut Self, usize, bool) -> Result<Vec<String>, E>,
+    ) -> PyResult<Bound<'py, PyList>> {
+        if unique || table.is_empty() {
+            let values =
+                generate(self, n, unique).map_err(|e| PyValueError::new_err(e.to_string()))?;
+            return PyList::new(py, values);
+        }
+        validate_batch_size(n).map_err(|e| PyValueError::new_err(e.to_string()))?;
+        interned::choose_list(py, &mut self.rng, table, n)
+    }
+}
+
+/// Batches smaller than this are generated without releasing the GIL.
+///
+/// Detaching swaps the thread state out and back in, which costs more than
+/// generating a handful of values, and a small batch gives other threads no
+/// useful window to run in anyway.
+const DETACH_THRESHOLD: usize = 64;
+
+/// Run a batch generator, releasing the GIL only for batches of at least
+/// [`DETACH_THRESHOLD`] items.
+#[inline]
+fn detach_batch<T, F>(py: Python<'_>, n: usize, f: F) -> T
+where
+    F: Ungil + FnOnce() -> T,
+    T: Ungil,
+{
+    if n < DETACH_THRESHOLD {
+        f()
+    } else {
+        py.detach(f)
+    }
 }
 
 /// Parse a Python schema dictionary into a Rust BTreeMap, with custom provider support.
 fn parse_py_schema_with_custom(
     schema: &Bound<'_, PyDict>,
-    custom_provider_names: &HashSet<String>,
+    custom_providers: &HashMap<String, CustomProvider>,
 ) -> PyResult<BTreeMap<String, providers::records::FieldSpec>> {
     // Validate schema size to prevent DoS attacks via huge schemas
     validate_schema_size(schema.len()).map_err(|e| PyValueError::new_err(e.to_string()))?;
@@ -2761,7 +3510,7 @@ fn parse_py_schema_with_custom(
 
     for (key, value) in schema.iter() {
         let field_name: String = key.extract()?;
-        let field_spec = parse_field_spec_with_custom(&value, custom_provider_names)?;
+        let field_spec = parse_field_spec_with_custom(&value, custom_providers)?;
         rust_schema.insert(field_name, field_spec);
     }
 
@@ -2771,10 +3520,10 @@ fn parse_py_schema_with_custom(
 /// Parse a Python field specification into a Rust FieldSpec, with custom provider support.
 fn parse_field_spec_with_custom(
     value: &Bound<'_, PyAny>,
-    custom_provider_names: &HashSet<String>,
+    custom_providers: &HashMap<String, CustomProvider>,
 ) -> PyResult<providers::records::FieldSpec> {
     if value.is_instance_of::<PyString>() {
-        return parse_string_field_spec_with_custom(value, custom_provider_names);
+        return parse_string_field_spec_with_custom(value, custom_providers);
     }
     if value.is_instance_of::<PyTuple>() {
         return parse_tuple_field_spec(value);
@@ -2787,10 +3536,11 @@ fn parse_field_spec_with_custom(
 /// Parse a simple string type specification, with custom provider support.
 fn parse_string_field_spec_with_custom(
     value: &Bound<'_, PyAny>,
-    custom_provider_names: &HashSet<String>,
+    custom_providers: &HashMap<String, CustomProvider>,
 ) -> PyResult<providers::records::FieldSpec> {
-    let type_str: String = value.extract()?;
-    providers::records::parse_simple_type_with_custom(&type_str, custom_provider_names)
+    // Borrow the type name; schemas are re-parsed on every records() call
+    let type_str: &str = value.extract()?;
+    providers::records::parse_simple_type_with_custom(type_str, custom_providers)
         .map_err(|e| PyValueError::new_err(e.to_string()))
 }
 
@@ -2900,10 +3650,56 @@ fn value_to_pyobject(py: Python<'_>, value: providers::records::Value) -> PyResu
     }
 }
 
+/// Convert rows of values into dicts keyed by `keys`, in order.
+///
+/// The key strings are created once, and every row starts as a copy of a
+/// template dict that already holds all the keys, so filling a row never
+/// rehashes or resizes it.
+fn rows_to_dicts(
+    py: Python<'_>,
+    keys: &[String],
+    rows: Vec<Vec<providers::records::Value>>,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let keys: Vec<Bound<'_, PyString>> = keys.iter().map(|key| PyString::new(py, key)).collect();
+    let template = PyDict::new(py);
+    for key in &keys {
+        template.set_item(key, py.None())?;
+    }
+
+    // Collecting into PyResult<Vec<_>> cannot preallocate, so push into an
+    // exactly sized Vec instead
+    let mut dicts = Vec::with_capacity(rows.len());
+    for row in rows {
+        let dict = template.copy()?;
+        for (key, value) in keys.iter().zip(row) {
+            dict.set_item(key, value_to_pyobject(py, value)?)?;
+        }
+        dicts.push(dict.into_py_any(py)?);
+    }
+    Ok(dicts)
+}
+
+/// Convert rows of values into tuples.
+fn rows_to_tuples(
+    py: Python<'_>,
+    rows: Vec<Vec<providers::records::Value>>,
+) -> PyResult<Vec<Py<PyAny>>> {
+    let mut tuples = Vec::with_capacity(rows.len());
+    for row in rows {
+        let mut values = Vec::with_capacity(row.len());
+        for value in row {
+            values.push(value_to_pyobject(py, value)?);
+        }
+        tuples.push(PyTuple::new(py, values)?.into_py_any(py)?);
+    }
+    Ok(tuples)
+}
+
 /// The forgery Python module.
 #[pymodule]
 fn _forgery(m: &Bound<'_, PyModule>) -> PyResult<()> {
-    m.add_class::<Faker>()?;
+    m.add_class::<PyFaker>()?;
+    m.add_class::<IntegersIter>()?;
     Ok(())
 }
 
@@ -2947,6 +3743,20 @@ mod tests {
         assert_eq!(names1, names2);
     }
 
+    #[test]
+    fn test_state_restore_replays_output() {
+        let mut faker = Faker::new("en_US").unwrap();
+        faker.seed(42);
+        faker.names(3, false).unwrap();
+
+        let state = faker.get_state();
+        let names1 = faker.names(10, false).unwrap();
+        faker.set_state(&state);
+        let names2 = faker.names(10, false).unwrap();
+
+        assert_eq!(names1, names2);
+    }
+
     #[test]
     fn test_batch_generation() {
         let mut faker = Faker::new("en_US").unwrap();
@@ -3011,4 +3821,21 @@ mod tests {
         assert!(validate_locale("xx_YY").is_err());
         assert!(validate_locale("").is_err());
     }
+
+    #[test]
+    fn test_list_providers_stays_sorted() {
+        let mut faker = Faker::new_default();
+        for name in ["zeta", "alpha", "mid"] {
+            faker.add_provider(name, vec!["x".to_string()]).unwrap();
+        }
+        // Replacing an existing provider does not duplicate its name
+        faker
+            .add_weighted_provider("mid", vec![("y".to_string(), 1)])
+            .unwrap();
+        assert_eq!(faker.list_providers(), vec!["alpha", "mid", "zeta"]);
+
+        assert!(faker.remove_provider("alpha"));
+        assert!(!faker.remove_provider("alpha"));
+        assert_eq!(faker.list_providers(), vec!["mid", "zeta"]);
+    }
 }
@@ -6,6 +6,7 @@ use crate::data::en_us::COUNTRIES;
 use crate::data::get_locale_data;
 use crate::locale::Locale;
 use crate::rng::ForgeryRng;
+use std::fmt::Write;
 
 /// Generate a batch of random street addresses.
 ///
@@ -48,20 +49,24 @@ pub fn generate_street_address(rng: &mut ForgeryRng, locale: Locale) -> String {
         None => (true, " ", false), // Default to US-style (suffix)
     };
 
-    // Build the street name: either "type name" (prefix) or "name type" (suffix)
-    let street_name = if type_prefix {
-        // Prefix: "Calle Mayor", "Via Roma", "rue de la République"
-        format!("{}{}{}", street_type, separator, name)
+    // Build the street name: either "type name" (prefix, "Calle Mayor") or
+    // "name type" (suffix, "Main Street"), then place the number around it
+    let (first, second) = if type_prefix {
+        (street_type, name)
     } else {
-        // Suffix: "Main Street", "Hauptstraße"
-        format!("{}{}{}", name, separator, street_type)
+        (name, street_type)
     };
-
+    let mut address = String::with_capacity(first.len() + separator.len() + second.len() + 5);
     if number_before_street {
-        format!("{} {}", number, street_name)
-    } else {
-        format!("{} {}", street_name, number)
+        let _ = write!(address, "{} ", number);
+    }
+    address.push_str(first);
+    address.push_str(separator);
+    address.push_str(second);
+    if !number_before_street {
+        let _ = write!(address, " {}", number);
     }
+    address
 }
 
 /// Generate a batch of random city names.
@@ -264,6 +269,53 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_street_address_matches_format_layout() {
+        for &locale in Locale::ALL {
+            let data = get_locale_data(locale);
+            let names = data.street_names().unwrap_or(&[]);
+            let suffixes = data.street_suffixes().unwrap_or(&[]);
+            let (number_first, sep, prefix) =
+                data.address_format().map_or((true, " ", false), |f| {
+                    (
+                        f.number_before_street,
+                        f.street_name_separator,
+                        f.street_type_prefix,
+                    )
+                });
+
+            let mut rng = ForgeryRng::new();
+            let mut reference = ForgeryRng::new();
+            rng.seed(5);
+            reference.seed(5);
+
+            for _ in 0..20 {
+                let number: u32 = reference.gen_range(1, 9999);
+                let name = if names.is_empty() {
+                    "Main"
+                } else {
+                    reference.choose(names)
+                };
+                let kind = if suffixes.is_empty() {
+                    "Street"
+                } else {
+                    reference.choose(suffixes)
+                };
+                let street = if prefix {
+                    format!("{}{}{}", kind, sep, name)
+                } else {
+                    format!("{}{}{}", name, sep, kind)
+                };
+                let expected = if number_first {
+                    format!("{} {}", number, street)
+                } else {
+                    format!("{} {}", street, number)
+                };
+                assert_eq!(generate_street_address(&mut rng, locale), expected);
+            }
+        }
+    }
+
     #[test]
     fn test_street_address_deterministic() {
         let mut rng1 = ForgeryRng::new();
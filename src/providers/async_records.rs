@@ -37,7 +37,8 @@
 use crate::locale::Locale;
 use crate::providers::custom::CustomProvider;
 use crate::providers::records::{
-    generate_value_with_custom, validate_schema_with_custom, FieldSpec, SchemaError, Value,
+    resolve_schema, resolve_tuple_fields, validate_schema_with_custom, FieldSpec, SchemaError,
+    Value,
 };
 use crate::rng::ForgeryRng;
 use arrow_array::RecordBatch;
@@ -90,6 +91,7 @@ pub async fn generate_records_async(
     // Validate schema upfront (even when n=0)
     validate_schema_with_custom(schema, custom_providers)?;
 
+    let fields = resolve_schema(schema, custom_providers)?;
     let chunk_size = normalize_chunk_size(chunk_size);
     let mut records = Vec::with_capacity(n);
     let mut remaining = n;
@@ -100,9 +102,8 @@ pub async fn generate_records_async(
         // Generate chunk synchronously
         for _ in 0..this_chunk {
             let mut record = BTreeMap::new();
-            for (field_name, spec) in schema {
-                let value = generate_value_with_custom(rng, locale, spec, custom_providers)?;
-                record.insert(field_name.clone(), value);
+            for &(field_name, field) in &fields {
+                record.insert(field_name.clone(), field.generate(rng, locale)?);
             }
             records.push(record);
         }
@@ -149,35 +150,7 @@ pub async fn generate_records_tuples_async(
     // Validate schema upfront
     validate_schema_with_custom(schema, custom_providers)?;
 
-    // Validate field_order: check for duplicates
-    let mut seen = std::collections::HashSet::new();
-    for field in field_order {
-        if !seen.insert(field) {
-            return Err(SchemaError {
-                message: format!("Duplicate field in field_order: '{}'", field),
-            });
-        }
-    }
-
-    // Validate field_order: all fields must exist in schema
-    for field in field_order {
-        if !schema.contains_key(field) {
-            return Err(SchemaError {
-                message: format!("Field '{}' not in schema", field),
-            });
-        }
-    }
-
-    // Validate field_order: must cover all schema fields
-    if field_order.len() != schema.len() {
-        let missing: Vec<_> = schema.keys().filter(|k| !field_order.contains(k)).collect();
-        return Err(SchemaError {
-            message: format!(
-                "field_order must cover all schema fields. Missing: {:?}",
-                missing
-            ),
-        });
-    }
+    let fields = resolve_tuple_fields(schema, field_order, custom_providers)?;
 
     let chunk_size = normalize_chunk_size(chunk_size);
     let mut records = Vec::with_capacity(n);
@@ -188,13 +161,9 @@ pub async fn generate_records_tuples_async(
 
         // Generate chunk synchronously
         for _ in 0..this_chunk {
-            let mut record = Vec::with_capacity(field_order.len());
-            for field_name in field_order {
-                let spec = schema
-                    .get(field_name)
-                    .expect("field_name was validated to exist in schema");
-                let value = generate_value_with_custom(rng, locale, spec, custom_providers)?;
-                record.push(value);
+            let mut record = Vec::with_capacity(fields.len());
+            for &field in &fields {
+                record.push(field.generate(rng, locale)?);
             }
             records.push(record);
         }
@@ -266,7 +235,7 @@ pub async fn generate_records_arrow_async(
         return generate_records_arrow_with_custom(rng, locale, n, schema, custom_providers);
     }
 
-    let mut batches: Vec<RecordBatch> = Vec::new();
+    let mut batches: Vec<RecordBatch> = Vec::with_capacity(n.div_ceil(chunk_size));
     let mut remaining = n;
 
     while remaining > 0 {
@@ -2,8 +2,10 @@
 //!
 //! Generates color names, hex colors, and RGB tuples.
 
+use crate::arena::FixedWidthArena;
 use crate::data::get_locale_data;
 use crate::locale::Locale;
+use crate::providers::identifiers::{generate_fixed_width, generate_fixed_width_arena, hex_byte};
 use crate::rng::ForgeryRng;
 
 /// Generate a batch of random color names.
@@ -31,11 +33,16 @@ pub fn generate_color(rng: &mut ForgeryRng, locale: Locale) -> String {
 ///
 /// Returns colors in the format `#RRGGBB` (lowercase).
 pub fn generate_hex_colors(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-    let mut colors = Vec::with_capacity(n);
-    for _ in 0..n {
-        colors.push(generate_hex_color(rng));
-    }
-    colors
+    generate_fixed_width(rng, n, |bytes: &mut [u8; 4]| format_hex_color(bytes))
+}
+
+/// Generate a batch of random hex color codes into a [`FixedWidthArena`].
+///
+/// Produces the same colors as [`generate_hex_colors`] for the same RNG state.
+pub fn generate_hex_colors_arena(rng: &mut ForgeryRng, n: usize) -> FixedWidthArena {
+    generate_fixed_width_arena(rng, n, |bytes: &mut [u8; 4], out: &mut [u8; 7]| {
+        encode_hex_color(bytes, out)
+    })
 }
 
 /// Generate a single random hex color code.
@@ -43,21 +50,42 @@ pub fn generate_hex_colors(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
 /// Returns a color in the format `#RRGGBB` (lowercase).
 #[inline]
 pub fn generate_hex_color(rng: &mut ForgeryRng) -> String {
-    let r: u8 = rng.gen_range(0, 255);
-    let g: u8 = rng.gen_range(0, 255);
-    let b: u8 = rng.gen_range(0, 255);
-    format!("#{:02x}{:02x}{:02x}", r, g, b)
+    format_hex_color(&random_color_bytes(rng))
+}
+
+/// Draw one RNG word and use its first three bytes as a color.
+///
+/// Hex and RGB colors read the stream identically, so singles and batches
+/// of either kind produce the same color for the same RNG state.
+#[inline]
+fn random_color_bytes(rng: &mut ForgeryRng) -> [u8; 4] {
+    let mut bytes = [0u8; 4];
+    rng.fill_bytes(&mut bytes);
+    bytes
+}
+
+/// Format the first three bytes as `#RRGGBB`.
+#[inline]
+fn format_hex_color(bytes: &[u8; 4]) -> String {
+    let mut out = [0u8; 7];
+    encode_hex_color(bytes, &mut out);
+    String::from_utf8(out.to_vec()).expect("hex digits are ASCII")
+}
+
+/// Write the first three bytes as `#RRGGBB`.
+#[inline]
+fn encode_hex_color(bytes: &[u8; 4], out: &mut [u8; 7]) {
+    out[0] = b'#';
+    for (i, &byte) in bytes[..3].iter().enumerate() {
+        out[1 + i * 2..3 + i * 2].copy_from_slice(&hex_byte(byte));
+    }
 }
 
 /// Generate a batch of random RGB color tuples.
 ///
 /// Returns colors as `(r, g, b)` tuples where each component is 0-255.
 pub fn generate_rgb_colors(rng: &mut ForgeryRng, n: usize) -> Vec<(u8, u8, u8)> {
-    let mut colors = Vec::with_capacity(n);
-    for _ in 0..n {
-        colors.push(generate_rgb_color(rng));
-    }
-    colors
+    (0..n).map(|_| generate_rgb_color(rng)).collect()
 }
 
 /// Generate a single random RGB color tuple.
@@ -65,9 +93,7 @@ pub fn generate_rgb_colors(rng: &mut ForgeryRng, n: usize) -> Vec<(u8, u8, u8)>
 /// Returns a color as `(r, g, b)` where each component is 0-255.
 #[inline]
 pub fn generate_rgb_color(rng: &mut ForgeryRng) -> (u8, u8, u8) {
-    let r: u8 = rng.gen_range(0, 255);
-    let g: u8 = rng.gen_range(0, 255);
-    let b: u8 = rng.gen_range(0, 255);
+    let [r, g, b, _] = random_color_bytes(rng);
     (r, g, b)
 }
 
@@ -199,6 +225,27 @@ mod tests {
         assert!(color.starts_with('#'));
     }
 
+    #[test]
+    fn test_hex_and_rgb_colors_agree() {
+        let mut rng1 = ForgeryRng::new();
+        let mut rng2 = ForgeryRng::new();
+        rng1.seed(42);
+        rng2.seed(42);
+
+        // Large enough for the batch to take the multi-threaded path
+        let hex = generate_hex_colors(&mut rng1, 140_000);
+        let rgb = generate_rgb_colors(&mut rng2, 140_000);
+        for (color, (r, g, b)) in hex.iter().zip(&rgb) {
+            assert_eq!(*color, format!("#{:02x}{:02x}{:02x}", r, g, b));
+        }
+        let arena = generate_hex_colors_arena(&mut rng1, 1000);
+        assert_eq!(arena.to_vec(), generate_hex_colors(&mut rng2, 1000));
+        assert_eq!(generate_hex_color(&mut rng1), {
+            let (r, g, b) = generate_rgb_color(&mut rng2);
+            format!("#{:02x}{:02x}{:02x}", r, g, b)
+        });
+    }
+
     #[test]
     fn test_generate_rgb_colors_count() {
         let mut rng = ForgeryRng::new();
@@ -7,10 +7,17 @@ use crate::locale::Locale;
 use crate::rng::ForgeryRng;
 
 /// Generate a batch of random company names.
+///
+/// The locale's prefix and suffix tables are resolved once for the whole
+/// batch rather than once per company.
 pub fn generate_companies(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
+    let data = get_locale_data(locale);
+    let prefixes = data.company_prefixes().unwrap_or(&[]);
+    let suffixes = data.company_suffixes().unwrap_or(&[]);
+
     let mut companies = Vec::with_capacity(n);
     for _ in 0..n {
-        companies.push(generate_company(rng, locale));
+        companies.push(company_with(rng, prefixes, suffixes));
     }
     companies
 }
@@ -19,9 +26,16 @@ pub fn generate_companies(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec
 #[inline]
 pub fn generate_company(rng: &mut ForgeryRng, locale: Locale) -> String {
     let data = get_locale_data(locale);
-    let prefixes = data.company_prefixes().unwrap_or(&[]);
-    let suffixes = data.company_suffixes().unwrap_or(&[]);
+    company_with(
+        rng,
+        data.company_prefixes().unwrap_or(&[]),
+        data.company_suffixes().unwrap_or(&[]),
+    )
+}
 
+/// Build one company name from already-resolved locale tables.
+#[inline]
+fn company_with(rng: &mut ForgeryRng, prefixes: &[&str], suffixes: &[&str]) -> String {
     let prefix = if prefixes.is_empty() {
         "Acme"
     } else {
@@ -37,9 +51,11 @@ pub fn generate_company(rng: &mut ForgeryRng, locale: Locale) -> String {
 
 /// Generate a batch of random job titles.
 pub fn generate_jobs(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
+    let titles = get_locale_data(locale).job_titles().unwrap_or(&[]);
+
     let mut jobs = Vec::with_capacity(n);
     for _ in 0..n {
-        jobs.push(generate_job(rng, locale));
+        jobs.push(job_with(rng, titles));
     }
     jobs
 }
@@ -47,8 +63,12 @@ pub fn generate_jobs(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<Stri
 /// Generate a single random job title.
 #[inline]
 pub fn generate_job(rng: &mut ForgeryRng, locale: Locale) -> String {
-    let data = get_locale_data(locale);
-    let titles = data.job_titles().unwrap_or(&[]);
+    job_with(rng, get_locale_data(locale).job_titles().unwrap_or(&[]))
+}
+
+/// Pick one job title from an already-resolved locale table.
+#[inline]
+fn job_with(rng: &mut ForgeryRng, titles: &[&str]) -> String {
     if titles.is_empty() {
         "Manager".to_string()
     } else {
@@ -58,9 +78,13 @@ pub fn generate_job(rng: &mut ForgeryRng, locale: Locale) -> String {
 
 /// Generate a batch of random catch phrases.
 pub fn generate_catch_phrases(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
+    let data = get_locale_data(locale);
+    let adjectives = data.catch_phrase_adjectives().unwrap_or(&[]);
+    let nouns = data.catch_phrase_nouns().unwrap_or(&[]);
+
     let mut phrases = Vec::with_capacity(n);
     for _ in 0..n {
-        phrases.push(generate_catch_phrase(rng, locale));
+        phrases.push(catch_phrase_with(rng, adjectives, nouns));
     }
     phrases
 }
@@ -69,9 +93,16 @@ pub fn generate_catch_phrases(rng: &mut ForgeryRng, locale: Locale, n: usize) ->
 #[inline]
 pub fn generate_catch_phrase(rng: &mut ForgeryRng, locale: Locale) -> String {
     let data = get_locale_data(locale);
-    let adjectives = data.catch_phrase_adjectives().unwrap_or(&[]);
-    let nouns = data.catch_phrase_nouns().unwrap_or(&[]);
+    catch_phrase_with(
+        rng,
+        data.catch_phrase_adjectives().unwrap_or(&[]),
+        data.catch_phrase_nouns().unwrap_or(&[]),
+    )
+}
 
+/// Build one catch phrase from already-resolved locale tables.
+#[inline]
+fn catch_phrase_with(rng: &mut ForgeryRng, adjectives: &[&str], nouns: &[&str]) -> String {
     let adj = if adjectives.is_empty() {
         "Innovative"
     } else {
@@ -90,6 +121,30 @@ mod tests {
     use super::*;
     use crate::data::en_us::JOB_TITLES;
 
+    #[test]
+    fn test_batches_match_singles() {
+        for locale in [Locale::EnUS, Locale::JaJP] {
+            let mut batch_rng = ForgeryRng::new();
+            let mut single_rng = ForgeryRng::new();
+            batch_rng.seed(42);
+            single_rng.seed(42);
+
+            let companies = generate_companies(&mut batch_rng, locale, 20);
+            let jobs = generate_jobs(&mut batch_rng, locale, 20);
+            let phrases = generate_catch_phrases(&mut batch_rng, locale, 20);
+
+            for company in &companies {
+                assert_eq!(company, &generate_company(&mut single_rng, locale));
+            }
+            for job in &jobs {
+                assert_eq!(job, &generate_job(&mut single_rng, locale));
+            }
+            for phrase in &phrases {
+                assert_eq!(phrase, &generate_catch_phrase(&mut single_rng, locale));
+            }
+        }
+    }
+
     #[test]
     fn test_generate_companies_count() {
         let mut rng = ForgeryRng::new();
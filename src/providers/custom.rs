@@ -39,17 +39,29 @@ impl std::error::Error for CustomProviderError {}
 /// They support both uniform (equal probability) and weighted selection.
 #[derive(Debug, Clone)]
 pub enum CustomProvider {
+    /// A single possible value, returned without touching the RNG.
+    ///
+    /// Built by [`CustomProvider::uniform`] for one option and by
+    /// [`CustomProvider::weighted`] when only one value has non-zero weight.
+    Constant(String),
+
     /// Simple uniform random choice from options.
     /// Each option has equal probability of being selected.
     Uniform(Vec<String>),
 
     /// Weighted random choice.
     /// Options are selected based on their relative weights.
+    ///
+    /// Selection uses a Vose alias table for O(1) draws: pick a bucket
+    /// uniformly, then keep its own value if a coin in `0..total_weight`
+    /// lands below `thresholds[bucket]`, otherwise take `aliases[bucket]`.
     Weighted {
         /// The values to choose from.
         values: Vec<String>,
-        /// Precomputed cumulative weights for O(log n) selection via binary search.
-        cumulative_weights: Vec<u64>,
+        /// Per-bucket acceptance threshold, out of `total_weight`.
+        thresholds: Vec<u64>,
+        /// Per-bucket index of the value used when the coin is rejected.
+        aliases: Vec<usize>,
         /// Total sum of all weights.
         total_weight: u64,
     },
@@ -71,6 +83,11 @@ impl CustomProvider {
         if options.is_empty() {
             return Err(CustomProviderError::EmptyOptions);
         }
+        if options.len() == 1 {
+            return Ok(Self::Constant(
+                options.into_iter().next().expect("one option"),
+            ));
+        }
         Ok(Self::Uniform(options))
     }
 
@@ -97,7 +114,7 @@ impl CustomProvider {
         }
 
         let mut values = Vec::with_capacity(pairs.len());
-        let mut cumulative_weights = Vec::with_capacity(pairs.len());
+        let mut weights = Vec::with_capacity(pairs.len());
         let mut total: u64 = 0;
 
         for (value, weight) in pairs {
@@ -105,10 +122,10 @@ impl CustomProvider {
                 continue; // Skip zero-weight items
             }
             values.push(value);
+            weights.push(weight);
             total = total.checked_add(weight).ok_or_else(|| {
                 CustomProviderError::InvalidWeights("weight overflow".to_string())
             })?;
-            cumulative_weights.push(total);
         }
 
         if values.is_empty() {
@@ -116,14 +133,43 @@ impl CustomProvider {
                 "all weights are zero".to_string(),
             ));
         }
+        if values.len() == 1 {
+            return Ok(Self::Constant(values.pop().expect("one value")));
+        }
 
+        let (thresholds, aliases) = build_alias_table(&weights, total);
         Ok(Self::Weighted {
             values,
-            cumulative_weights,
+            thresholds,
+            aliases,
             total_weight: total,
         })
     }
 
+    /// The values this provider chooses from.
+    pub fn values(&self) -> &[String] {
+        match self {
+            Self::Constant(value) => std::slice::from_ref(value),
+            Self::Uniform(options) => options,
+            Self::Weighted { values, .. } => values,
+        }
+    }
+
+    /// Draw the index into [`CustomProvider::values`] of the next value.
+    #[inline]
+    pub fn sample_index(&self, rng: &mut ForgeryRng) -> usize {
+        match self {
+            Self::Constant(_) => 0,
+            Self::Uniform(options) => rng.choose_index(options.len()),
+            Self::Weighted {
+                values,
+                thresholds,
+                aliases,
+                total_weight,
+            } => alias_draw(rng, values.len(), thresholds, aliases, *total_weight),
+        }
+    }
+
     /// Generate a single value from this provider.
     ///
     /// # Arguments
@@ -134,20 +180,7 @@ impl CustomProvider {
     ///
     /// A randomly selected string from the provider's options.
     pub fn generate(&self, rng: &mut ForgeryRng) -> String {
-        match self {
-            Self::Uniform(options) => rng.choose(options).clone(),
-            Self::Weighted {
-                values,
-                cumulative_weights,
-                total_weight,
-            } => {
-                // Generate random value in range [1, total_weight] inclusive
-                let r = rng.gen_range(1u64, *total_weight);
-                // Binary search for the bucket where cumulative_weight >= r
-                let idx = cumulative_weights.partition_point(|&w| w < r);
-                values[idx].clone()
-            }
-        }
+        self.values()[self.sample_index(rng)].clone()
     }
 
     /// Generate a batch of values from this provider.
@@ -161,20 +194,97 @@ impl CustomProvider {
     ///
     /// A vector of `n` randomly selected strings.
     pub fn generate_batch(&self, rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-        let mut results = Vec::with_capacity(n);
-        for _ in 0..n {
-            results.push(self.generate(rng));
+        let values = self.values();
+        self.sample_indices(rng, n)
+            .into_iter()
+            .map(|index| values[index].clone())
+            .collect()
+    }
+
+    /// Draw the indices of a batch of `n` values.
+    ///
+    /// Consumes the RNG exactly like [`CustomProvider::generate_batch`], so
+    /// callers can gather the values themselves (e.g. into shared Python
+    /// strings) without cloning each one.
+    pub fn sample_indices(&self, rng: &mut ForgeryRng, n: usize) -> Vec<usize> {
+        // Dispatch on the variant once, so each inner loop is branch-free
+        match self {
+            Self::Constant(_) => vec![0; n],
+            Self::Uniform(options) => {
+                let len = options.len();
+                (0..n).map(|_| rng.choose_index(len)).collect()
+            }
+            Self::Weighted {
+                values,
+                thresholds,
+                aliases,
+                total_weight,
+            } => {
+                let len = values.len();
+                (0..n)
+                    .map(|_| alias_draw(rng, len, thresholds, aliases, *total_weight))
+                    .collect()
+            }
         }
-        results
     }
 }
 
+/// Draw one index from a Vose alias table with `len` buckets.
+#[inline(always)]
+fn alias_draw(
+    rng: &mut ForgeryRng,
+    len: usize,
+    thresholds: &[u64],
+    aliases: &[usize],
+    total_weight: u64,
+) -> usize {
+    let bucket = rng.choose_index(len);
+    let threshold = thresholds[bucket];
+    // Full buckets have no alias, so they need no coin
+    if threshold == total_weight || rng.gen_range(0, total_weight - 1) < threshold {
+        bucket
+    } else {
+        aliases[bucket]
+    }
+}
+
+/// Build a Vose alias table for `weights`, which sum to `total`.
+///
+/// Works in exact integer arithmetic: every weight is scaled by the number of
+/// buckets, so each bucket holds `total` units and the selection
+/// probabilities match the weights exactly, with no floating-point rounding.
+fn build_alias_table(weights: &[u64], total: u64) -> (Vec<u64>, Vec<usize>) {
+    let n = weights.len();
+    let capacity = u128::from(total);
+    let mut scaled: Vec<u128> = weights.iter().map(|&w| u128::from(w) * n as u128).collect();
+    let mut thresholds = vec![total; n];
+    let mut aliases: Vec<usize> = (0..n).collect();
+
+    let (mut small, mut large): (Vec<usize>, Vec<usize>) =
+        (0..n).partition(|&i| scaled[i] < capacity);
+    while let (Some(&s), Some(&l)) = (small.last(), large.last()) {
+        small.pop();
+        // scaled[s] < capacity = total, so it fits in a u64
+        thresholds[s] = scaled[s] as u64;
+        aliases[s] = l;
+        // Top up bucket `s` from `l`, which may then become small itself
+        scaled[l] -= capacity - scaled[s];
+        if scaled[l] < capacity {
+            large.pop();
+            small.push(l);
+        }
+    }
+    // Whatever is left (only ever `large` with exact arithmetic) fills its
+    // own bucket and keeps the default full threshold
+    (thresholds, aliases)
+}
+
 /// Reserved provider names that cannot be used for custom providers.
 ///
 /// This list includes both schema type names (used in `records()`) and
 /// API method names to prevent confusion. Name matching is case-sensitive,
 /// so "Name" is allowed even though "name" is reserved.
-pub const RESERVED_PROVIDER_NAMES: &[&str] = &[
+pub static RESERVED_PROVIDER_NAMES: &[&str] = &[
     // Names
     "name",
     "first_name",
@@ -365,6 +475,61 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_alias_table_matches_weights_exactly() {
+        // Each bucket holds `total` units; summing every value's share across
+        // buckets must give back weight * number of buckets
+        for weights in [
+            vec![90u64, 10],
+            vec![1, 2, 3, 4],
+            vec![5, 5, 5],
+            vec![1, 1_000_000, 7, 0x1234_5678_9abc],
+            vec![u64::MAX / 2, u64::MAX / 2],
+        ] {
+            let total: u64 = weights.iter().sum();
+            let (thresholds, aliases) = build_alias_table(&weights, total);
+            let n = weights.len() as u128;
+
+            let mut share = vec![0u128; weights.len()];
+            for (bucket, (&threshold, &alias)) in thresholds.iter().zip(&aliases).enumerate() {
+                assert!(threshold <= total);
+                share[bucket] += u128::from(threshold);
+                share[alias] += u128::from(total - threshold);
+            }
+            for (i, &w) in weights.iter().enumerate() {
+                assert_eq!(share[i], u128::from(w) * n, "weights {:?}", weights);
+            }
+        }
+    }
+
+    #[test]
+    fn test_sample_indices_match_generate_batch() {
+        let providers = [
+            CustomProvider::uniform(vec!["x".to_string(), "y".to_string(), "z".to_string()])
+                .unwrap(),
+            CustomProvider::weighted(vec![("a".to_string(), 3), ("b".to_string(), 1)]).unwrap(),
+            CustomProvider::uniform(vec!["only".to_string()]).unwrap(),
+        ];
+        for provider in providers {
+            let mut rng1 = ForgeryRng::new();
+            let mut rng2 = ForgeryRng::new();
+            let mut rng3 = ForgeryRng::new();
+            rng1.seed(9);
+            rng2.seed(9);
+            rng3.seed(9);
+
+            let indices = provider.sample_indices(&mut rng1, 200);
+            let singles: Vec<usize> = (0..200).map(|_| provider.sample_index(&mut rng2)).collect();
+            assert_eq!(indices, singles);
+
+            let gathered: Vec<String> = indices
+                .iter()
+                .map(|&i| provider.values()[i].clone())
+                .collect();
+            assert_eq!(gathered, provider.generate_batch(&mut rng3, 200));
+        }
+    }
+
     #[test]
     fn test_batch_generation() {
         let provider =
@@ -387,6 +552,26 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_single_value_providers_skip_rng() {
+        let providers = [
+            CustomProvider::uniform(vec!["only".to_string()]).unwrap(),
+            CustomProvider::weighted(vec![("zero".to_string(), 0), ("only".to_string(), 5)])
+                .unwrap(),
+        ];
+        for provider in providers {
+            assert!(matches!(provider, CustomProvider::Constant(_)));
+
+            let mut rng = ForgeryRng::new();
+            let mut reference = ForgeryRng::new();
+            rng.seed(42);
+            reference.seed(42);
+            assert_eq!(provider.generate(&mut rng), "only");
+            assert_eq!(provider.generate_batch(&mut rng, 10), vec!["only"; 10]);
+            assert_eq!(rng.next_u64(), reference.next_u64());
+        }
+    }
+
     #[test]
     fn test_reserved_name_check() {
         // Reserved names
@@ -40,10 +40,67 @@ pub const DEFAULT_END_DATE: &str = "2030-12-31";
 const REFERENCE_DATE: (i32, u32, u32) = (2024, 1, 1);
 
 /// Parse a date string in YYYY-MM-DD format.
+///
+/// The canonical zero-padded form is decoded directly; anything else
+/// (including invalid dates) goes through chrono so that accepted inputs
+/// and error messages are unchanged.
 fn parse_date(s: &str) -> Result<NaiveDate, String> {
+    if let Some(date) = parse_canonical_date(s.as_bytes()) {
+        return Ok(date);
+    }
     NaiveDate::parse_from_str(s, "%Y-%m-%d").map_err(|e| e.to_string())
 }
 
+/// Decode exactly `YYYY-MM-DD`, returning `None` for any other shape or an invalid date.
+#[inline]
+fn parse_canonical_date(bytes: &[u8]) -> Option<NaiveDate> {
+    if bytes.len() != 10 || bytes[4] != b'-' || bytes[7] != b'-' {
+        return None;
+    }
+    let digits = |range: std::ops::Range<usize>| {
+        bytes[range].iter().try_fold(0u32, |acc, &b| {
+            b.is_ascii_digit().then(|| acc * 10 + u32::from(b - b'0'))
+        })
+    };
+    let year = digits(0..4)? as i32;
+    NaiveDate::from_ymd_opt(year, digits(5..7)?, digits(8..10)?)
+}
+
+/// Append `value` (0-99) as two zero-padded digits.
+#[inline]
+fn push_two_digits(out: &mut String, value: u32) {
+    out.push(char::from(b'0' + (value / 10) as u8));
+    out.push(char::from(b'0' + (value % 10) as u8));
+}
+
+/// Append `date` in YYYY-MM-DD format.
+///
+/// Four-digit years are written digit by digit; other years fall back to
+/// chrono's formatter, which adds a sign or extra digits.
+#[inline]
+fn push_date(out: &mut String, date: NaiveDate) {
+    let year = date.year();
+    if !(0..=9999).contains(&year) {
+        out.push_str(&date.format("%Y-%m-%d").to_string());
+        return;
+    }
+    let year = year as u32;
+    push_two_digits(out, year / 100);
+    push_two_digits(out, year % 100);
+    out.push('-');
+    push_two_digits(out, date.month());
+    out.push('-');
+    push_two_digits(out, date.day());
+}
+
+/// Format `date` in YYYY-MM-DD format.
+#[inline]
+fn format_date(date: NaiveDate) -> String {
+    let mut result = String::with_capacity(10);
+    push_date(&mut result, date);
+    result
+}
+
 /// Validated date range with pre-computed day values.
 struct ValidatedDateRange {
     start_days: i32,
@@ -142,7 +199,7 @@ pub fn generate_dates(
     let mut dates = Vec::with_capacity(n);
     for _ in 0..n {
         let date = random_date_from_range(rng, &range, start, end)?;
-        dates.push(date.format("%Y-%m-%d").to_string());
+        dates.push(format_date(date));
     }
     Ok(dates)
 }
@@ -160,7 +217,7 @@ pub fn generate_date(
 ) -> Result<String, DateRangeError> {
     let range = validate_date_range(start, end)?;
     let date = random_date_from_range(rng, &range, start, end)?;
-    Ok(date.format("%Y-%m-%d").to_string())
+    Ok(format_date(date))
 }
 
 /// Generate a batch of random date-of-birth values.
@@ -212,26 +269,49 @@ pub fn generate_date_of_birth(
     generate_date(rng, &start_str, &end_str)
 }
 
-/// Generate a random time component (hour, minute, second).
+/// Number of seconds in a day.
+const SECONDS_PER_DAY: i64 = 86_400;
+
+/// Generate a random datetime from a validated range.
+///
+/// The whole range is treated as one span of seconds, so a single draw
+/// picks both the day and the time of day.
 #[inline]
-fn random_time(rng: &mut ForgeryRng) -> (u32, u32, u32) {
-    (
-        rng.gen_range(0u32, 23),
-        rng.gen_range(0u32, 59),
-        rng.gen_range(0u32, 59),
-    )
+fn random_datetime_from_range(
+    rng: &mut ForgeryRng,
+    range: &ValidatedDateRange,
+    start: &str,
+    end: &str,
+) -> Result<(NaiveDate, u32, u32, u32), DateRangeError> {
+    let span_days = i64::from(range.end_days) - i64::from(range.start_days) + 1;
+    let offset = rng.gen_range(0, span_days * SECONDS_PER_DAY - 1);
+    let days = range.start_days + (offset / SECONDS_PER_DAY) as i32;
+    let second_of_day = (offset % SECONDS_PER_DAY) as u32;
+    let date = NaiveDate::from_num_days_from_ce_opt(days).ok_or_else(|| DateRangeError {
+        start: start.to_string(),
+        end: end.to_string(),
+        reason: format!("internal error: invalid days from CE value {}", days),
+    })?;
+    Ok((
+        date,
+        second_of_day / 3600,
+        second_of_day / 60 % 60,
+        second_of_day % 60,
+    ))
 }
 
 /// Format a date and time as ISO 8601 datetime string.
 #[inline]
 fn format_datetime(date: NaiveDate, hour: u32, minute: u32, second: u32) -> String {
-    format!(
-        "{}T{:02}:{:02}:{:02}",
-        date.format("%Y-%m-%d"),
-        hour,
-        minute,
-        second
-    )
+    let mut result = String::with_capacity(19);
+    push_date(&mut result, date);
+    result.push('T');
+    push_two_digits(&mut result, hour);
+    result.push(':');
+    push_two_digits(&mut result, minute);
+    result.push(':');
+    push_two_digits(&mut result, second);
+    result
 }
 
 /// Generate a batch of random datetime strings in ISO 8601 format.
@@ -256,8 +336,7 @@ pub fn generate_datetimes(
 
     let mut datetimes = Vec::with_capacity(n);
     for _ in 0..n {
-        let date = random_date_from_range(rng, &range, start, end)?;
-        let (hour, minute, second) = random_time(rng);
+        let (date, hour, minute, second) = random_datetime_from_range(rng, &range, start, end)?;
         datetimes.push(format_datetime(date, hour, minute, second));
     }
     Ok(datetimes)
@@ -275,8 +354,7 @@ pub fn generate_datetime(
     end: &str,
 ) -> Result<String, DateRangeError> {
     let range = validate_date_range(start, end)?;
-    let date = random_date_from_range(rng, &range, start, end)?;
-    let (hour, minute, second) = random_time(rng);
+    let (date, hour, minute, second) = random_datetime_from_range(rng, &range, start, end)?;
     Ok(format_datetime(date, hour, minute, second))
 }
 
@@ -284,6 +362,43 @@ pub fn generate_datetime(
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_parse_date_matches_chrono() {
+        let inputs = [
+            "2024-02-29",
+            "2023-02-29",
+            "2020-13-01",
+            "0000-01-01",
+            "9999-12-31",
+            "2020-1-5",
+            "2020/01/05",
+            "20x0-01-05",
+            "",
+        ];
+        for input in inputs {
+            let expected = NaiveDate::parse_from_str(input, "%Y-%m-%d").map_err(|e| e.to_string());
+            assert_eq!(parse_date(input), expected, "input: {:?}", input);
+        }
+    }
+
+    #[test]
+    fn test_format_date_matches_chrono() {
+        for (y, m, d) in [
+            (2024, 2, 29),
+            (1, 1, 1),
+            (999, 12, 31),
+            (9999, 7, 4),
+            (-5, 3, 9),
+        ] {
+            let date = NaiveDate::from_ymd_opt(y, m, d).unwrap();
+            assert_eq!(format_date(date), date.format("%Y-%m-%d").to_string());
+            assert_eq!(
+                format_datetime(date, 7, 5, 59),
+                format!("{}T07:05:59", date.format("%Y-%m-%d"))
+            );
+        }
+    }
+
     // Date tests
     #[test]
     fn test_generate_dates_count() {
@@ -506,6 +621,25 @@ mod tests {
         assert!(dt.contains('T'));
     }
 
+    #[test]
+    fn test_datetime_covers_whole_range() {
+        let mut rng = ForgeryRng::new();
+        rng.seed(42);
+
+        // A two-day range must reach both days and every hour of the day
+        let datetimes = generate_datetimes(&mut rng, 2000, "2020-02-28", "2020-02-29").unwrap();
+        let mut days = std::collections::HashSet::new();
+        let mut hours = std::collections::HashSet::new();
+        for dt in &datetimes {
+            let parsed = chrono::NaiveDateTime::parse_from_str(dt, "%Y-%m-%dT%H:%M:%S")
+                .unwrap_or_else(|e| panic!("invalid datetime {}: {}", dt, e));
+            days.insert(parsed.date());
+            hours.insert(parsed.format("%H").to_string());
+        }
+        assert_eq!(days.len(), 2);
+        assert_eq!(hours.len(), 24);
+    }
+
     #[test]
     fn test_date_range_error_display() {
         let err = DateRangeError {
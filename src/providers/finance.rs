@@ -35,28 +35,61 @@ const IBAN_COUNTRIES: &[(&str, usize)] = &[
     ("PL", 24), // Poland
 ];
 
-/// Calculate Luhn checksum digit for a partial number string.
-/// The returned digit should be appended to make a valid Luhn number.
-fn luhn_checksum(number: &str) -> u8 {
-    let mut sum: u32 = 0;
-    // When calculating check digit, the rightmost digit of the partial number
-    // will be doubled (because the check digit we append won't be doubled).
-    let mut double = true;
+/// Powers of ten that fit in a `u32`, indexed by exponent.
+const POW10: [u32; 10] = [
+    1,
+    10,
+    100,
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+    100_000_000,
+    1_000_000_000,
+];
 
-    // Process digits from right to left
-    for c in number.chars().rev() {
-        if let Some(digit) = c.to_digit(10) {
-            let mut d = digit;
-            if double {
-                d *= 2;
-                if d > 9 {
-                    d -= 9;
-                }
-            }
-            sum += d;
-            double = !double;
+/// Longest BBAN in [`IBAN_COUNTRIES`].
+const MAX_BBAN_LEN: usize = 24;
+
+/// Fill `digits` with uniformly random decimal digit values (0-9).
+///
+/// Draws up to nine digits at a time as one uniform value below 10^k, so a
+/// 16-digit number costs two RNG draws instead of sixteen.
+fn fill_random_digits(rng: &mut ForgeryRng, digits: &mut [u8]) {
+    for block in digits.chunks_mut(9) {
+        let mut value = rng.bounded_u32(POW10[block.len()]);
+        for digit in block.iter_mut().rev() {
+            *digit = (value % 10) as u8;
+            value /= 10;
         }
     }
+}
+
+/// Calculate the Luhn check digit for a partial number packed one digit per nibble.
+///
+/// The rightmost digit of the partial number must be in the lowest nibble and
+/// unused high nibbles must be zero, so up to 16 digits fit. The returned digit
+/// should be appended to make a valid Luhn number.
+///
+/// Works on all digits at once with SWAR arithmetic instead of a digit loop
+/// with data-dependent branches.
+#[inline]
+fn luhn_check_digit(packed: u64) -> u8 {
+    const LOW_NIBBLES: u64 = 0x0F0F_0F0F_0F0F_0F0F;
+    const ONES: u64 = 0x0101_0101_0101_0101;
+
+    // The rightmost digit (the check digit's neighbour) and every second digit
+    // to its left are doubled; spread both halves to one digit per byte.
+    let doubled = (packed & LOW_NIBBLES) << 1;
+    let kept = (packed >> 4) & LOW_NIBBLES;
+
+    // Adding 118 sets bit 7 in exactly the bytes >= 10; subtract 9 from those.
+    let over_nine = ((doubled + 0x7676_7676_7676_7676) >> 7) & ONES;
+    let digits = doubled - over_nine * 9 + kept;
+
+    // Horizontal byte sum lands in the top byte (at most 8 * 18 = 144).
+    let sum = digits.wrapping_mul(ONES) >> 56;
 
     // Return the digit that makes the sum a multiple of 10
     ((10 - (sum % 10)) % 10) as u8
@@ -104,46 +137,48 @@ pub fn generate_credit_cards(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
 pub fn generate_credit_card(rng: &mut ForgeryRng) -> String {
     let (prefix, total_length) = rng.choose(CARD_PREFIXES);
 
-    // Generate random digits (excluding the check digit)
+    // Generate random digits (excluding the check digit), keeping a
+    // nibble-packed copy of the partial number for the checksum
     let random_length = total_length - prefix.len() - 1;
-    let mut number = prefix.to_string();
-
-    for _ in 0..random_length {
-        let digit: u8 = rng.gen_range(0, 9);
+    let mut number = String::with_capacity(*total_length);
+    number.push_str(prefix);
+    let mut packed = prefix
+        .bytes()
+        .fold(0u64, |acc, b| (acc << 4) | u64::from(b - b'0'));
+
+    let mut digits = [0u8; 16];
+    let digits = &mut digits[..random_length];
+    fill_random_digits(rng, digits);
+    for &digit in digits.iter() {
         number.push((b'0' + digit) as char);
+        packed = (packed << 4) | u64::from(digit);
     }
 
     // Calculate and append check digit
-    let check_digit = luhn_checksum(&number);
+    let check_digit = luhn_check_digit(packed);
     number.push((b'0' + check_digit) as char);
 
     number
 }
 
 /// Calculate IBAN check digits (ISO 7064 Mod 97-10).
-fn iban_check_digits(country_code: &str, bban: &str) -> String {
-    // Move country code to end and append "00"
-    let mut check_string = String::with_capacity(bban.len() + 6);
-    check_string.push_str(bban);
+///
+/// `bban` holds digit values (0-9). The check runs over the rearranged form
+/// (BBAN, country letters as two-digit numbers, then "00") without building
+/// it as a string.
+fn iban_check_digits(country_code: &str, bban: &[u8]) -> u8 {
+    let mut remainder = bban
+        .iter()
+        .fold(0u32, |r, &digit| (r * 10 + u32::from(digit)) % 97);
 
     // Convert country code letters to numbers (A=10, B=11, etc.)
-    for c in country_code.chars() {
-        let val = (c as u32) - ('A' as u32) + 10;
-        check_string.push_str(&val.to_string());
-    }
-    check_string.push_str("00");
-
-    // Calculate mod 97
-    let mut remainder: u64 = 0;
-    for c in check_string.chars() {
-        if let Some(digit) = c.to_digit(10) {
-            remainder = (remainder * 10 + digit as u64) % 97;
-        }
+    for letter in country_code.bytes() {
+        remainder = (remainder * 100 + u32::from(letter - b'A' + 10)) % 97;
     }
+    remainder = remainder * 100 % 97;
 
     // Check digits = 98 - remainder
-    let check = 98 - remainder;
-    format!("{:02}", check)
+    (98 - remainder) as u8
 }
 
 /// Validate an IBAN using ISO 7064 Mod 97-10.
@@ -204,16 +239,21 @@ pub fn generate_iban(rng: &mut ForgeryRng) -> String {
     let (country_code, bban_length) = rng.choose(IBAN_COUNTRIES);
 
     // Generate random BBAN (Basic Bank Account Number)
-    let mut bban = String::with_capacity(*bban_length);
-    for _ in 0..*bban_length {
-        let digit: u8 = rng.gen_range(0, 9);
-        bban.push((b'0' + digit) as char);
-    }
+    let mut bban = [0u8; MAX_BBAN_LEN];
+    let bban = &mut bban[..*bban_length];
+    fill_random_digits(rng, bban);
 
     // Calculate check digits
-    let check_digits = iban_check_digits(country_code, &bban);
+    let check_digits = iban_check_digits(country_code, bban);
 
-    format!("{}{}{}", country_code, check_digits, bban)
+    let mut iban = String::with_capacity(4 + bban.len());
+    iban.push_str(country_code);
+    iban.push((b'0' + check_digits / 10) as char);
+    iban.push((b'0' + check_digits % 10) as char);
+    for &digit in bban.iter() {
+        iban.push((b'0' + digit) as char);
+    }
+    iban
 }
 
 /// Generate a batch of BIC/SWIFT codes.
@@ -395,7 +435,7 @@ pub fn generate_uk_account_number(rng: &mut ForgeryRng) -> String {
 // === Financial Transaction Data ===
 
 /// Debit transaction types (money going out).
-pub const DEBIT_TYPES: &[&str] = &[
+pub static DEBIT_TYPES: &[&str] = &[
     "Direct Debit",
     "Standing Order",
     "Card Payment",
@@ -408,7 +448,7 @@ pub const DEBIT_TYPES: &[&str] = &[
 ];
 
 /// Credit transaction types (money coming in).
-pub const CREDIT_TYPES: &[&str] = &[
+pub static CREDIT_TYPES: &[&str] = &[
     "Faster Payment",
     "Bank Transfer",
     "BACS Payment",
@@ -419,7 +459,7 @@ pub const CREDIT_TYPES: &[&str] = &[
 ];
 
 /// Common merchant/payee names for transactions.
-pub const MERCHANTS: &[&str] = &[
+pub static MERCHANTS: &[&str] = &[
     "Tesco",
     "Sainsbury's",
     "Amazon UK",
@@ -708,6 +748,23 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_credit_card_digits_cover_all_values() {
+        let mut rng = ForgeryRng::new();
+        rng.seed(42);
+
+        // Every body position (after the longest prefix, before the check
+        // digit) should take all ten digit values across a batch
+        let cards = generate_credit_cards(&mut rng, 2000);
+        for pos in 4..14 {
+            let mut seen = [false; 10];
+            for card in &cards {
+                seen[(card.as_bytes()[pos] - b'0') as usize] = true;
+            }
+            assert!(seen.iter().all(|&s| s), "position {} missed a digit", pos);
+        }
+    }
+
     #[test]
     fn test_credit_card_length() {
         let mut rng = ForgeryRng::new();
@@ -824,12 +881,44 @@ mod tests {
         assert!(validate_luhn("4111111111111111")); // Visa test
     }
 
+    #[test]
+    fn test_luhn_check_digit_known_values() {
+        // 453201511283036 -> 6, 411111111111111 -> 1, 542523343010990 -> 3
+        assert_eq!(luhn_check_digit(0x453201511283036), 6);
+        assert_eq!(luhn_check_digit(0x411111111111111), 1);
+        assert_eq!(luhn_check_digit(0x542523343010990), 3);
+        assert_eq!(luhn_check_digit(0), 0);
+    }
+
+    #[test]
+    fn test_luhn_check_digit_all_nines() {
+        // Every doubled digit hits the subtract-9 path
+        for len in 1..=16 {
+            let packed = 0x9999_9999_9999_9999u64 >> (4 * (16 - len));
+            let digits = "9".repeat(len);
+            let check = luhn_check_digit(packed);
+            assert!(validate_luhn(&format!("{}{}", digits, check)));
+        }
+    }
+
     #[test]
     fn test_luhn_known_invalid() {
         assert!(!validate_luhn("4532015112830367")); // Changed last digit
         assert!(!validate_luhn("1234567890123456")); // Random number
     }
 
+    #[test]
+    fn test_iban_check_digits_known_values() {
+        // DE89370400440532013000
+        let bban: Vec<u8> = "370400440532013000".bytes().map(|b| b - b'0').collect();
+        assert_eq!(iban_check_digits("DE", &bban), 89);
+    }
+
+    #[test]
+    fn test_max_bban_len_covers_all_countries() {
+        assert!(IBAN_COUNTRIES.iter().all(|&(_, len)| len <= MAX_BBAN_LEN));
+    }
+
     // IBAN validation tests
     #[test]
     fn test_iban_known_valid() {
@@ -9,6 +9,7 @@
 //! They are NOT cryptographic hashes of any input data - they are simply
 //! random hex strings useful for generating fake data.
 
+use crate::arena::FixedWidthArena;
 use crate::rng::ForgeryRng;
 
 /// Lookup table for fast hex encoding.
@@ -31,6 +32,11 @@ d0d1d2d3d4d5d6d7d8d9dadbdcdddedf\
 e0e1e2e3e4e5e6e7e8e9eaebecedeeef\
 f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff";
 
+/// Batch size at which fixed-width generators start splitting work across threads.
+///
+/// Below this, thread spawn overhead outweighs the formatting work saved.
+const PARALLEL_THRESHOLD: usize = 65_536;
+
 /// Generate a batch of UUIDv4 strings.
 ///
 /// Note: These are pseudo-random UUIDs generated from our seeded RNG,
@@ -42,18 +48,17 @@ f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff";
 /// * `rng` - The random number generator to use
 /// * `n` - Number of UUIDs to generate
 pub fn generate_uuids(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-    let mut uuids = Vec::with_capacity(n);
-    for _ in 0..n {
-        let mut bytes = [0u8; 16];
-        rng.fill_bytes(&mut bytes);
-
-        // Set version (4) and variant (RFC 4122)
-        bytes[6] = (bytes[6] & 0x0f) | 0x40; // Version 4
-        bytes[8] = (bytes[8] & 0x3f) | 0x80; // Variant RFC 4122
+    generate_fixed_width(rng, n, uuid_from_bytes)
+}
 
-        uuids.push(format_uuid(&bytes));
-    }
-    uuids
+/// Generate a batch of UUIDv4 strings into a [`FixedWidthArena`].
+///
+/// Produces the same UUIDs as [`generate_uuids`] for the same RNG state.
+pub fn generate_uuids_arena(rng: &mut ForgeryRng, n: usize) -> FixedWidthArena {
+    generate_fixed_width_arena(rng, n, |bytes: &mut [u8; 16], out: &mut [u8; 36]| {
+        stamp_uuid_bits(bytes);
+        encode_uuid(bytes, out);
+    })
 }
 
 /// Generate a single UUIDv4 string.
@@ -63,58 +68,279 @@ pub fn generate_uuids(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
 pub fn generate_uuid(rng: &mut ForgeryRng) -> String {
     let mut bytes = [0u8; 16];
     rng.fill_bytes(&mut bytes);
+    uuid_from_bytes(&mut bytes)
+}
+
+/// Generate a single UUIDv4 as its 36 ASCII bytes.
+///
+/// Same RNG consumption and text as [`generate_uuid`], but returned on the
+/// stack so callers that copy it elsewhere skip the `String` allocation.
+#[inline]
+pub fn generate_uuid_ascii(rng: &mut ForgeryRng) -> [u8; 36] {
+    let mut bytes = [0u8; 16];
+    rng.fill_bytes(&mut bytes);
+    stamp_uuid_bits(&mut bytes);
+    let mut out = [0u8; 36];
+    encode_uuid(&bytes, &mut out);
+    out
+}
 
-    // Set version (4) and variant (RFC 4122)
+/// Stamp the version and variant bits onto 16 random bytes and format them.
+#[inline]
+fn uuid_from_bytes(bytes: &mut [u8; 16]) -> String {
+    stamp_uuid_bits(bytes);
+    format_uuid(bytes)
+}
+
+/// Set the UUIDv4 version and RFC 4122 variant bits.
+#[inline]
+fn stamp_uuid_bits(bytes: &mut [u8; 16]) {
     bytes[6] = (bytes[6] & 0x0f) | 0x40; // Version 4
     bytes[8] = (bytes[8] & 0x3f) | 0x80; // Variant RFC 4122
+}
+
+/// Generate `n` items, each built from `N` fresh random bytes.
+///
+/// Every item consumes exactly `N / 4` words of the RNG stream, so large
+/// batches are split into contiguous chunks that each jump a cloned RNG to
+/// their own offset and run on a scoped thread, writing straight into their
+/// slice of the output. The output and the final RNG state are identical to
+/// a sequential loop, so seeding stays reproducible regardless of the number
+/// of cores.
+pub(crate) fn generate_fixed_width<const N: usize, T, F>(
+    rng: &mut ForgeryRng,
+    n: usize,
+    format: F,
+) -> Vec<T>
+where
+    T: Send + Default + Clone,
+    F: Fn(&mut [u8; N]) -> T + Sync,
+{
+    debug_assert!(N % 4 == 0, "items must consume whole RNG words");
+
+    let mut results = vec![T::default(); n];
+    let threads = shard_count(n);
+    if threads <= 1 {
+        fill_fixed_width(rng, &mut results, &format);
+        return results;
+    }
+
+    let words_per_item = (N / 4) as u128;
+    let start = rng.word_pos();
+    let chunk_size = n.div_ceil(threads);
+
+    let format = &format;
+    std::thread::scope(|scope| {
+        for (i, out) in results.chunks_mut(chunk_size).enumerate() {
+            let mut chunk_rng = rng.clone();
+            chunk_rng.set_word_pos(start + (i * chunk_size) as u128 * words_per_item);
+            scope.spawn(move || fill_fixed_width(&mut chunk_rng, out, format));
+        }
+    });
+
+    rng.set_word_pos(start + n as u128 * words_per_item);
+    results
+}
+
+/// Number of threads to split a fixed-width batch of `n` items across.
+fn shard_count(n: usize) -> usize {
+    std::thread::available_parallelism()
+        .map_or(1, |p| p.get())
+        .min(n / PARALLEL_THRESHOLD)
+}
+
+/// Generate `n` strings of exactly `W` ASCII bytes into a [`FixedWidthArena`].
+///
+/// `encode` writes each item from `N` fresh random bytes straight into its
+/// slot of one shared buffer, so no per-item `String` is allocated. RNG
+/// consumption, sharding and output match [`generate_fixed_width`].
+pub(crate) fn generate_fixed_width_arena<const N: usize, const W: usize, F>(
+    rng: &mut ForgeryRng,
+    n: usize,
+    encode: F,
+) -> FixedWidthArena
+where
+    F: Fn(&mut [u8; N], &mut [u8; W]) + Sync,
+{
+    debug_assert!(N % 4 == 0, "items must consume whole RNG words");
+
+    let mut buf = vec![0u8; n * W];
+    let threads = shard_count(n);
+    if threads <= 1 {
+        fill_fixed_width_into(rng, &mut buf, &encode);
+        return FixedWidthArena::from_bytes(buf, W);
+    }
+
+    let words_per_item = (N / 4) as u128;
+    let start = rng.word_pos();
+    let chunk_size = n.div_ceil(threads);
+
+    let encode = &encode;
+    std::thread::scope(|scope| {
+        for (i, out) in buf.chunks_mut(chunk_size * W).enumerate() {
+            let mut chunk_rng = rng.clone();
+            chunk_rng.set_word_pos(start + (i * chunk_size) as u128 * words_per_item);
+            scope.spawn(move || fill_fixed_width_into(&mut chunk_rng, out, encode));
+        }
+    });
 
-    format_uuid(&bytes)
+    rng.set_word_pos(start + n as u128 * words_per_item);
+    FixedWidthArena::from_bytes(buf, W)
 }
 
-/// Format 16 bytes as a UUID string using lookup table for performance.
+/// Items whose random bytes [`fill_fixed_width`] draws in one RNG call.
+const SLAB_ITEMS: usize = 64;
+
+/// Sequential core of [`generate_fixed_width`]: fill every slot of `out`.
+///
+/// Random bytes are drawn a slab of [`SLAB_ITEMS`] items at a time. Since
+/// each item is a whole number of RNG words, the slab holds exactly the
+/// bytes that per-item draws would have produced.
+fn fill_fixed_width<const N: usize, T>(
+    rng: &mut ForgeryRng,
+    out: &mut [T],
+    format: &impl Fn(&mut [u8; N]) -> T,
+) {
+    let mut slab = vec![0u8; N * SLAB_ITEMS.min(out.len())];
+    for slots in out.chunks_mut(SLAB_ITEMS) {
+        let slab = &mut slab[..N * slots.len()];
+        rng.fill_bytes(slab);
+        for (bytes, slot) in slab.chunks_exact_mut(N).zip(slots) {
+            let bytes: &mut [u8; N] = bytes.try_into().expect("chunk is N bytes");
+            *slot = format(bytes);
+        }
+    }
+}
+
+/// Sequential core of [`generate_fixed_width_arena`]: fill every `W`-byte slot of `out`.
+fn fill_fixed_width_into<const N: usize, const W: usize>(
+    rng: &mut ForgeryRng,
+    out: &mut [u8],
+    encode: &impl Fn(&mut [u8; N], &mut [u8; W]),
+) {
+    let n = out.len() / W;
+    let mut slab = vec![0u8; N * SLAB_ITEMS.min(n)];
+    for slots in out.chunks_mut(W * SLAB_ITEMS) {
+        let slab = &mut slab[..N * (slots.len() / W)];
+        rng.fill_bytes(slab);
+        for (bytes, slot) in slab.chunks_exact_mut(N).zip(slots.chunks_exact_mut(W)) {
+            let bytes: &mut [u8; N] = bytes.try_into().expect("chunk is N bytes");
+            let slot: &mut [u8; W] = slot.try_into().expect("slot is W bytes");
+            encode(bytes, slot);
+        }
+    }
+}
+
+/// Format 16 bytes as a UUID string.
 fn format_uuid(bytes: &[u8; 16]) -> String {
-    // Pre-allocate exact size: 32 hex chars + 4 dashes = 36
-    let mut result = String::with_capacity(36);
+    // 32 hex chars + 4 dashes = 36
+    let mut out = [0u8; 36];
+    encode_uuid(bytes, &mut out);
+    String::from_utf8(out.to_vec()).expect("hex digits are ASCII")
+}
+
+/// Write 16 bytes in the 8-4-4-4-12 UUID layout.
+#[inline]
+fn encode_uuid(bytes: &[u8; 16], out: &mut [u8; 36]) {
+    let hex = encode_hex_16(bytes);
+    out[0..8].copy_from_slice(&hex[0..8]);
+    out[8] = b'-';
+    out[9..13].copy_from_slice(&hex[8..12]);
+    out[13] = b'-';
+    out[14..18].copy_from_slice(&hex[12..16]);
+    out[18] = b'-';
+    out[19..23].copy_from_slice(&hex[16..20]);
+    out[23] = b'-';
+    out[24..36].copy_from_slice(&hex[20..32]);
+}
 
-    // Helper to push a byte as two hex chars using the lookup table
-    #[inline(always)]
-    fn push_hex(s: &mut String, byte: u8) {
+/// Encode `byte` as two lowercase hex digits.
+#[inline]
+pub(crate) fn hex_byte(byte: u8) -> [u8; 2] {
+    let idx = (byte as usize) * 2;
+    [HEX_TABLE[idx], HEX_TABLE[idx + 1]]
+}
+
+/// Lowercase hex digits indexed by nibble value, used as a shuffle lookup table.
+#[cfg(any(target_arch = "x86_64", target_arch = "aarch64"))]
+const HEX_DIGITS: &[u8; 16] = b"0123456789abcdef";
+
+/// Encode 16 bytes as 32 lowercase hex digits.
+///
+/// All 32 nibbles are translated at once with a 16-byte shuffle lookup
+/// (SSSE3 on x86_64, NEON on aarch64); other targets use `HEX_TABLE`.
+#[inline]
+pub(crate) fn encode_hex_16(bytes: &[u8; 16]) -> [u8; 32] {
+    #[cfg(target_arch = "aarch64")]
+    {
+        // SAFETY: NEON is part of the aarch64 baseline.
+        unsafe { encode_hex_16_neon(bytes) }
+    }
+    #[cfg(not(target_arch = "aarch64"))]
+    {
+        #[cfg(target_arch = "x86_64")]
+        if is_x86_feature_detected!("ssse3") {
+            // SAFETY: SSSE3 support was checked at runtime above.
+            return unsafe { encode_hex_16_ssse3(bytes) };
+        }
+        encode_hex_16_scalar(bytes)
+    }
+}
+
+/// SSSE3 kernel for [`encode_hex_16`].
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "ssse3")]
+unsafe fn encode_hex_16_ssse3(bytes: &[u8; 16]) -> [u8; 32] {
+    use std::arch::x86_64::*;
+
+    let mut out = [0u8; 32];
+    let lut = _mm_loadu_si128(HEX_DIGITS.as_ptr() as *const __m128i);
+    let nibble_mask = _mm_set1_epi8(0x0f);
+
+    let input = _mm_loadu_si128(bytes.as_ptr() as *const __m128i);
+    let hi = _mm_and_si128(_mm_srli_epi16(input, 4), nibble_mask);
+    let lo = _mm_and_si128(input, nibble_mask);
+    let hi_digits = _mm_shuffle_epi8(lut, hi);
+    let lo_digits = _mm_shuffle_epi8(lut, lo);
+
+    // Interleave so each byte's high digit precedes its low digit
+    let first = _mm_unpacklo_epi8(hi_digits, lo_digits);
+    let second = _mm_unpackhi_epi8(hi_digits, lo_digits);
+    _mm_storeu_si128(out.as_mut_ptr() as *mut __m128i, first);
+    _mm_storeu_si128(out.as_mut_ptr().add(16) as *mut __m128i, second);
+    out
+}
+
+/// NEON kernel for [`encode_hex_16`].
+#[cfg(target_arch = "aarch64")]
+unsafe fn encode_hex_16_neon(bytes: &[u8; 16]) -> [u8; 32] {
+    use std::arch::aarch64::*;
+
+    let mut out = [0u8; 32];
+    let lut = vld1q_u8(HEX_DIGITS.as_ptr());
+
+    let input = vld1q_u8(bytes.as_ptr());
+    let hi = vshrq_n_u8::<4>(input);
+    let lo = vandq_u8(input, vdupq_n_u8(0x0f));
+    let hi_digits = vqtbl1q_u8(lut, hi);
+    let lo_digits = vqtbl1q_u8(lut, lo);
+
+    // Interleave so each byte's high digit precedes its low digit
+    vst1q_u8(out.as_mut_ptr(), vzip1q_u8(hi_digits, lo_digits));
+    vst1q_u8(out.as_mut_ptr().add(16), vzip2q_u8(hi_digits, lo_digits));
+    out
+}
+
+/// Portable fallback for [`encode_hex_16`].
+#[cfg_attr(target_arch = "aarch64", allow(dead_code))]
+fn encode_hex_16_scalar(bytes: &[u8; 16]) -> [u8; 32] {
+    let mut out = [0u8; 32];
+    for (i, &byte) in bytes.iter().enumerate() {
         let idx = (byte as usize) * 2;
-        s.push(HEX_TABLE[idx] as char);
-        s.push(HEX_TABLE[idx + 1] as char);
-    }
-
-    // xxxxxxxx-
-    push_hex(&mut result, bytes[0]);
-    push_hex(&mut result, bytes[1]);
-    push_hex(&mut result, bytes[2]);
-    push_hex(&mut result, bytes[3]);
-    result.push('-');
-
-    // xxxx-
-    push_hex(&mut result, bytes[4]);
-    push_hex(&mut result, bytes[5]);
-    result.push('-');
-
-    // xxxx-
-    push_hex(&mut result, bytes[6]);
-    push_hex(&mut result, bytes[7]);
-    result.push('-');
-
-    // xxxx-
-    push_hex(&mut result, bytes[8]);
-    push_hex(&mut result, bytes[9]);
-    result.push('-');
-
-    // xxxxxxxxxxxx
-    push_hex(&mut result, bytes[10]);
-    push_hex(&mut result, bytes[11]);
-    push_hex(&mut result, bytes[12]);
-    push_hex(&mut result, bytes[13]);
-    push_hex(&mut result, bytes[14]);
-    push_hex(&mut result, bytes[15]);
-
-    result
+        out[2 * i] = HEX_TABLE[idx];
+        out[2 * i + 1] = HEX_TABLE[idx + 1];
+    }
+    out
 }
 
 /// Generate a batch of MD5-like hash strings (32 lowercase hex characters).
@@ -127,11 +353,16 @@ fn format_uuid(bytes: &[u8; 16]) -> String {
 /// * `rng` - The random number generator to use
 /// * `n` - Number of hashes to generate
 pub fn generate_md5s(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-    let mut hashes = Vec::with_capacity(n);
-    for _ in 0..n {
-        hashes.push(generate_md5(rng));
-    }
-    hashes
+    generate_fixed_width(rng, n, |bytes: &mut [u8; 16]| format_hex(bytes))
+}
+
+/// Generate a batch of MD5-like hash strings into a [`FixedWidthArena`].
+///
+/// Produces the same hashes as [`generate_md5s`] for the same RNG state.
+pub fn generate_md5s_arena(rng: &mut ForgeryRng, n: usize) -> FixedWidthArena {
+    generate_fixed_width_arena(rng, n, |bytes: &mut [u8; 16], out: &mut [u8; 32]| {
+        *out = encode_hex_16(bytes);
+    })
 }
 
 /// Generate a single MD5-like hash string (32 lowercase hex characters).
@@ -154,11 +385,18 @@ pub fn generate_md5(rng: &mut ForgeryRng) -> String {
 /// * `rng` - The random number generator to use
 /// * `n` - Number of hashes to generate
 pub fn generate_sha256s(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-    let mut hashes = Vec::with_capacity(n);
-    for _ in 0..n {
-        hashes.push(generate_sha256(rng));
-    }
-    hashes
+    generate_fixed_width(rng, n, |bytes: &mut [u8; 32]| format_hex(bytes))
+}
+
+/// Generate a batch of SHA256-like hash strings into a [`FixedWidthArena`].
+///
+/// Produces the same hashes as [`generate_sha256s`] for the same RNG state.
+pub fn generate_sha256s_arena(rng: &mut ForgeryRng, n: usize) -> FixedWidthArena {
+    generate_fixed_width_arena(rng, n, |bytes: &mut [u8; 32], out: &mut [u8; 64]| {
+        let (low, high) = bytes.split_at(16);
+        out[..32].copy_from_slice(&encode_hex_16(low.try_into().expect("16 bytes")));
+        out[32..].copy_from_slice(&encode_hex_16(high.try_into().expect("16 bytes")));
+    })
 }
 
 /// Generate a single SHA256-like hash string (64 lowercase hex characters).
@@ -171,17 +409,24 @@ pub fn generate_sha256(rng: &mut ForgeryRng) -> String {
     format_hex(&bytes)
 }
 
-/// Format bytes as a lowercase hex string using a lookup table for performance.
+/// Format bytes as a lowercase hex string.
+///
+/// Whole 16-byte blocks go through [`encode_hex_16`]; any tail uses the
+/// lookup table.
 fn format_hex(bytes: &[u8]) -> String {
-    let mut result = String::with_capacity(bytes.len() * 2);
-    for &byte in bytes {
+    let mut result = Vec::with_capacity(bytes.len() * 2);
+    let mut blocks = bytes.chunks_exact(16);
+    for block in &mut blocks {
+        let block: &[u8; 16] = block.try_into().expect("chunk is 16 bytes");
+        result.extend_from_slice(&encode_hex_16(block));
+    }
+    for &byte in blocks.remainder() {
         let idx = (byte as usize) * 2;
-        // SAFETY: idx is always in range 0..512 since byte is u8 (0..256)
+        // idx is always in range 0..512 since byte is u8 (0..256)
         // and HEX_TABLE has exactly 512 bytes (256 entries * 2 chars each)
-        result.push(HEX_TABLE[idx] as char);
-        result.push(HEX_TABLE[idx + 1] as char);
+        result.extend_from_slice(&HEX_TABLE[idx..idx + 2]);
     }
-    result
+    String::from_utf8(result).expect("hex digits are ASCII")
 }
 
 #[cfg(test)]
@@ -561,12 +806,113 @@ mod tests {
         assert_eq!(hex, "0000000000000000");
     }
 
+    #[test]
+    fn test_format_hex_blocks_and_tail() {
+        // Two full SIMD blocks plus a table-encoded tail
+        let bytes: Vec<u8> = (0..37u8).map(|b| b.wrapping_mul(7)).collect();
+        let expected: String = bytes.iter().map(|b| format!("{:02x}", b)).collect();
+        assert_eq!(format_hex(&bytes), expected);
+    }
+
     #[test]
     fn test_format_hex_ones() {
         let bytes = [0xff; 4];
         let hex = format_hex(&bytes);
         assert_eq!(hex, "ffffffff");
     }
+
+    #[test]
+    fn test_encode_hex_16_matches_scalar() {
+        // Cover every byte value in every lane position
+        for offset in 0..16u8 {
+            for block in 0..16u8 {
+                let bytes: [u8; 16] = std::array::from_fn(|i| block * 16 + (i as u8 + offset) % 16);
+                assert_eq!(encode_hex_16(&bytes), encode_hex_16_scalar(&bytes));
+            }
+        }
+    }
+
+    #[test]
+    fn test_slab_fill_matches_per_item_draws() {
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(11);
+        reference.seed(11);
+
+        // Crosses several slab boundaries with a partial last slab
+        let n = SLAB_ITEMS * 3 + 5;
+        let mut batch = vec![String::new(); n];
+        fill_fixed_width(&mut rng, &mut batch, &|bytes: &mut [u8; 32]| {
+            format_hex(bytes)
+        });
+        let singles: Vec<String> = (0..n).map(|_| generate_sha256(&mut reference)).collect();
+
+        assert_eq!(batch, singles);
+        assert_eq!(rng.next_u64(), reference.next_u64());
+    }
+
+    #[test]
+    fn test_parallel_batches_match_sequential() {
+        // Large enough to be split across threads on multi-core machines
+        let n = PARALLEL_THRESHOLD * 4 + 7;
+
+        let mut parallel = ForgeryRng::new();
+        let mut sequential = ForgeryRng::new();
+        parallel.seed(42);
+        sequential.seed(42);
+
+        let uuids = generate_uuids(&mut parallel, n);
+        let expected: Vec<String> = (0..n).map(|_| generate_uuid(&mut sequential)).collect();
+        assert_eq!(uuids, expected);
+
+        let sha256s = generate_sha256s(&mut parallel, n);
+        let expected: Vec<String> = (0..n).map(|_| generate_sha256(&mut sequential)).collect();
+        assert_eq!(sha256s, expected);
+
+        // The RNG must be left exactly where a sequential loop would leave it
+        assert_eq!(generate_md5(&mut parallel), generate_md5(&mut sequential));
+    }
+
+    #[test]
+    fn test_uuid_ascii_matches_string() {
+        let mut rng1 = ForgeryRng::new();
+        let mut rng2 = ForgeryRng::new();
+        rng1.seed(5);
+        rng2.seed(5);
+
+        for _ in 0..100 {
+            let ascii = generate_uuid_ascii(&mut rng1);
+            assert_eq!(
+                std::str::from_utf8(&ascii).unwrap(),
+                generate_uuid(&mut rng2)
+            );
+        }
+    }
+
+    #[test]
+    fn test_arena_batches_match_vec() {
+        // One slab-sized batch, one with a partial slab, one split across threads
+        for n in [
+            0,
+            SLAB_ITEMS,
+            SLAB_ITEMS * 2 + 3,
+            PARALLEL_THRESHOLD * 2 + 7,
+        ] {
+            let mut arena_rng = ForgeryRng::new();
+            let mut vec_rng = ForgeryRng::new();
+            arena_rng.seed(7);
+            vec_rng.seed(7);
+
+            let uuids = generate_uuids_arena(&mut arena_rng, n);
+            assert_eq!(uuids.len(), n);
+            assert_eq!(uuids.to_vec(), generate_uuids(&mut vec_rng, n));
+            let md5s = generate_md5s_arena(&mut arena_rng, n);
+            assert_eq!(md5s.to_vec(), generate_md5s(&mut vec_rng, n));
+            let sha256s = generate_sha256s_arena(&mut arena_rng, n);
+            assert_eq!(sha256s.to_vec(), generate_sha256s(&mut vec_rng, n));
+            assert_eq!(arena_rng.next_u64(), vec_rng.next_u64());
+        }
+    }
 }
 
 #[cfg(test)]
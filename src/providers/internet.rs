@@ -2,6 +2,7 @@
 //!
 //! Generates email addresses, URLs, IP addresses, etc.
 
+use crate::arena::StringArena;
 use crate::data::en_us::{FREE_EMAIL_DOMAINS, SAFE_EMAIL_DOMAINS};
 use crate::data::get_locale_data;
 use crate::locale::Locale;
@@ -21,11 +22,24 @@ const EMAIL_DOMAINS: &[&str] = &[
 
 /// Generate a batch of email addresses.
 pub fn generate_emails(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
-    let mut emails = Vec::with_capacity(n);
+    generate_emails_with(rng, locale, EMAIL_DOMAINS, n)
+}
+
+/// Generate a batch of email addresses into a single [`StringArena`].
+///
+/// Produces the same addresses as [`generate_emails`] for the same RNG
+/// state, without allocating a separate `String` per address.
+pub fn generate_emails_arena(rng: &mut ForgeryRng, locale: Locale, n: usize) -> StringArena {
+    // Use romanized names for email (important for non-Latin scripts like Japanese)
+    let names = get_locale_data(locale)
+        .romanized_first_names()
+        .unwrap_or(&[]);
+
+    let mut arena = StringArena::with_capacity(n, 24);
     for _ in 0..n {
-        emails.push(generate_email(rng, locale));
+        arena.push_with(|out| push_email(rng, names, EMAIL_DOMAINS, out));
     }
-    emails
+    arena
 }
 
 /// Generate a single email address.
@@ -36,54 +50,91 @@ pub fn generate_email(rng: &mut ForgeryRng, locale: Locale) -> String {
     let data = get_locale_data(locale);
     // Use romanized names for email (important for non-Latin scripts like Japanese)
     let names = data.romanized_first_names().unwrap_or(&[]);
+    let mut email = String::with_capacity(24);
+    push_email(rng, names, EMAIL_DOMAINS, &mut email);
+    email
+}
+
+/// Append one `name###@domain` address to `out`.
+///
+/// The domain is drawn uniformly from `domains`, so each pick is a single
+/// bounded index draw regardless of the table size.
+#[inline]
+fn push_email(rng: &mut ForgeryRng, names: &[&str], domains: &[&str], out: &mut String) {
     let name = if names.is_empty() {
         "user"
     } else {
         rng.choose(names)
     };
     let num: u16 = rng.gen_range(1, 999);
-    let domain = rng.choose(EMAIL_DOMAINS);
-    format!("{}{:03}@{}", name.to_lowercase(), num, domain)
+    let domain = rng.choose(domains);
+
+    // Romanized names are ASCII, so lowercase them in place after one copy;
+    // anything else falls back to full Unicode lowercasing
+    let start = out.len();
+    if name.is_ascii() {
+        out.push_str(name);
+        out[start..].make_ascii_lowercase();
+    } else {
+        out.extend(name.chars().flat_map(char::to_lowercase));
+    }
+    // Zero-padded to three digits, without going through the formatter
+    for digit in [num / 100, num / 10 % 10, num % 10] {
+        out.push(char::from(b'0' + digit as u8));
+    }
+    out.push('@');
+    out.push_str(domain);
 }
 
-/// Generate a batch of safe email addresses.
+/// Generate a batch of addresses drawing domains from `domains`.
 ///
-/// Safe emails use example.com/org/net domains that are reserved for testing
-/// and documentation (RFC 2606).
-pub fn generate_safe_emails(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
+/// Resolves the locale's name table once for the whole batch instead of
+/// once per address.
+fn generate_emails_with(
+    rng: &mut ForgeryRng,
+    locale: Locale,
+    domains: &[&str],
+    n: usize,
+) -> Vec<String> {
+    let names = get_locale_data(locale)
+        .romanized_first_names()
+        .unwrap_or(&[]);
+
     let mut emails = Vec::with_capacity(n);
     for _ in 0..n {
-        emails.push(generate_safe_email(rng, locale));
+        let mut email = String::with_capacity(24);
+        push_email(rng, names, domains, &mut email);
+        emails.push(email);
     }
     emails
 }
 
+/// Generate a batch of safe email addresses.
+///
+/// Safe emails use example.com/org/net domains that are reserved for testing
+/// and documentation (RFC 2606).
+pub fn generate_safe_emails(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
+    generate_emails_with(rng, locale, SAFE_EMAIL_DOMAINS, n)
+}
+
 /// Generate a single safe email address.
 ///
 /// Uses example.com, example.org, or example.net (RFC 2606 reserved domains).
 #[inline]
 pub fn generate_safe_email(rng: &mut ForgeryRng, locale: Locale) -> String {
-    let data = get_locale_data(locale);
-    let names = data.romanized_first_names().unwrap_or(&[]);
-    let name = if names.is_empty() {
-        "user"
-    } else {
-        rng.choose(names)
-    };
-    let num: u16 = rng.gen_range(1, 999);
-    let domain = rng.choose(SAFE_EMAIL_DOMAINS);
-    format!("{}{:03}@{}", name.to_lowercase(), num, domain)
+    let names = get_locale_data(locale)
+        .romanized_first_names()
+        .unwrap_or(&[]);
+    let mut email = String::with_capacity(24);
+    push_email(rng, names, SAFE_EMAIL_DOMAINS, &mut email);
+    email
 }
 
 /// Generate a batch of free email addresses.
 ///
 /// Free emails use common free email provider domains (gmail.com, yahoo.com, etc.).
 pub fn generate_free_emails(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<String> {
-    let mut emails = Vec::with_capacity(n);
-    for _ in 0..n {
-        emails.push(generate_free_email(rng, locale));
-    }
-    emails
+    generate_emails_with(rng, locale, FREE_EMAIL_DOMAINS, n)
 }
 
 /// Generate a single free email address.
@@ -91,22 +142,53 @@ pub fn generate_free_emails(rng: &mut ForgeryRng, locale: Locale, n: usize) -> V
 /// Uses common free email providers like gmail.com, yahoo.com, etc.
 #[inline]
 pub fn generate_free_email(rng: &mut ForgeryRng, locale: Locale) -> String {
-    let data = get_locale_data(locale);
-    let names = data.romanized_first_names().unwrap_or(&[]);
-    let name = if names.is_empty() {
-        "user"
-    } else {
-        rng.choose(names)
-    };
-    let num: u16 = rng.gen_range(1, 999);
-    let domain = rng.choose(FREE_EMAIL_DOMAINS);
-    format!("{}{:03}@{}", name.to_lowercase(), num, domain)
+    let names = get_locale_data(locale)
+        .romanized_first_names()
+        .unwrap_or(&[]);
+    let mut email = String::with_capacity(24);
+    push_email(rng, names, FREE_EMAIL_DOMAINS, &mut email);
+    email
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_generate_emails_arena_matches_vec() {
+        for locale in [Locale::EnUS, Locale::JaJP] {
+            let mut rng1 = ForgeryRng::new();
+            let mut rng2 = ForgeryRng::new();
+            rng1.seed(42);
+            rng2.seed(42);
+
+            let arena = generate_emails_arena(&mut rng1, locale, 100);
+            assert_eq!(arena.to_vec(), generate_emails(&mut rng2, locale, 100));
+        }
+    }
+
+    #[test]
+    fn test_email_batches_match_singles() {
+        for locale in [Locale::EnUS, Locale::DeDE, Locale::JaJP] {
+            let mut rng1 = ForgeryRng::new();
+            let mut rng2 = ForgeryRng::new();
+            rng1.seed(7);
+            rng2.seed(7);
+
+            let batch = generate_safe_emails(&mut rng1, locale, 50);
+            let singles: Vec<String> = (0..50)
+                .map(|_| generate_safe_email(&mut rng2, locale))
+                .collect();
+            assert_eq!(batch, singles);
+
+            let batch = generate_free_emails(&mut rng1, locale, 50);
+            let singles: Vec<String> = (0..50)
+                .map(|_| generate_free_email(&mut rng2, locale))
+                .collect();
+            assert_eq!(batch, singles);
+        }
+    }
+
     #[test]
     fn test_generate_emails_count() {
         let mut rng = ForgeryRng::new();
@@ -182,6 +264,28 @@ mod tests {
         assert!(emails[0].contains('@'));
     }
 
+    #[test]
+    fn test_push_email_matches_format() {
+        let names = ["Bob", "ÉLODIE", "Zoë"];
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(42);
+        reference.seed(42);
+
+        for _ in 0..500 {
+            let mut email = String::new();
+            push_email(&mut rng, &names, EMAIL_DOMAINS, &mut email);
+
+            let name = reference.choose(&names);
+            let num: u16 = reference.gen_range(1, 999);
+            let domain = reference.choose(EMAIL_DOMAINS);
+            assert_eq!(
+                email,
+                format!("{}{:03}@{}", name.to_lowercase(), num, domain)
+            );
+        }
+    }
+
     #[test]
     fn test_email_number_format() {
         let mut rng = ForgeryRng::new();
@@ -2,6 +2,7 @@
 //!
 //! Generates first names, last names, and full names using locale-specific data.
 
+use crate::arena::StringArena;
 use crate::data::get_locale_data;
 use crate::locale::Locale;
 use crate::rng::ForgeryRng;
@@ -25,25 +26,129 @@ pub fn generate_names(rng: &mut ForgeryRng, locale: Locale, n: usize) -> Vec<Str
 
     let mut names = Vec::with_capacity(n);
     for _ in 0..n {
-        let first = if first_names.is_empty() {
-            "Unknown"
-        } else {
-            rng.choose(first_names)
-        };
-        let last = if last_names.is_empty() {
-            "Unknown"
-        } else {
-            rng.choose(last_names)
-        };
-        if family_first {
-            names.push(format!("{} {}", last, first));
-        } else {
-            names.push(format!("{} {}", first, last));
-        }
+        let mut name = String::with_capacity(16);
+        push_name(rng, first_names, last_names, family_first, &mut name);
+        names.push(name);
     }
     names
 }
 
+/// Generate a batch of full names into a single [`StringArena`].
+///
+/// Produces the same names as [`generate_names`] for the same RNG state,
+/// without allocating a separate `String` per name.
+pub fn generate_names_arena(rng: &mut ForgeryRng, locale: Locale, n: usize) -> StringArena {
+    let data = get_locale_data(locale);
+    let first_names = data.first_names().unwrap_or(&[]);
+    let last_names = data.last_names().unwrap_or(&[]);
+    let family_first = locale.family_name_first();
+
+    let mut arena = StringArena::with_capacity(n, 16);
+    for _ in 0..n {
+        arena.push_with(|out| push_name(rng, first_names, last_names, family_first, out));
+    }
+    arena
+}
+
+/// Batches smaller than this run their shards on the calling thread.
+const SHARD_THREAD_THRESHOLD: usize = 65_536;
+
+/// Largest worker count accepted by [`generate_names_sharded`].
+pub const MAX_SHARD_WORKERS: usize = 256;
+
+/// Generate a batch of full names across `workers` independent RNG streams.
+///
+/// Shard `i` is seeded from the `i`-th `u64` drawn from `rng` and produces
+/// the `i`-th contiguous run of the batch, so the output depends only on the
+/// RNG state and `workers`, never on the number of cores. It differs from
+/// [`generate_names_arena`] whenever `workers > 1`. Large batches run the
+/// shards on scoped threads.
+///
+/// `workers` is clamped to [`MAX_SHARD_WORKERS`] and to `n`. Each shard gets
+/// `n / workers` names and the first `n % workers` shards one more, so no
+/// shard is empty and no RNG draw is spent on one.
+pub fn generate_names_sharded(
+    rng: &mut ForgeryRng,
+    locale: Locale,
+    n: usize,
+    workers: usize,
+) -> StringArena {
+    let workers = workers.min(MAX_SHARD_WORKERS).min(n.max(1));
+    if workers <= 1 {
+        return generate_names_arena(rng, locale, n);
+    }
+
+    let (base, extra) = (n / workers, n % workers);
+    let mut shards: Vec<(ForgeryRng, usize)> = (0..workers)
+        .map(|i| {
+            let mut shard_rng = ForgeryRng::new();
+            shard_rng.seed(rng.next_u64());
+            (shard_rng, base + usize::from(i < extra))
+        })
+        .collect();
+
+    let build = |group: &mut [(ForgeryRng, usize)]| -> Vec<StringArena> {
+        group
+            .iter_mut()
+            .map(|(shard_rng, len)| generate_names_arena(shard_rng, locale, *len))
+            .collect()
+    };
+
+    let threads = if n < SHARD_THREAD_THRESHOLD {
+        1
+    } else {
+        std::thread::available_parallelism()
+            .map_or(1, |p| p.get())
+            .min(workers)
+    };
+    let parts = if threads <= 1 {
+        build(&mut shards)
+    } else {
+        let build = &build;
+        std::thread::scope(|scope| {
+            let handles: Vec<_> = shards
+                .chunks_mut(workers.div_ceil(threads))
+                .map(|group| scope.spawn(move || build(group)))
+                .collect();
+            handles
+                .into_iter()
+                .flat_map(|handle| handle.join().expect("generator thread panicked"))
+                .collect()
+        })
+    };
+    StringArena::concat(&parts)
+}
+
+/// Append one full name to `out`, in the locale's name order.
+#[inline]
+fn push_name(
+    rng: &mut ForgeryRng,
+    first_names: &[&str],
+    last_names: &[&str],
+    family_first: bool,
+    out: &mut String,
+) {
+    let first = if first_names.is_empty() {
+        "Unknown"
+    } else {
+        rng.choose(first_names)
+    };
+    let last = if last_names.is_empty() {
+        "Unknown"
+    } else {
+        rng.choose(last_names)
+    };
+    let (head, tail) = if family_first {
+        (last, first)
+    } else {
+        (first, last)
+    };
+    out.reserve(head.len() + 1 + tail.len());
+    out.push_str(head);
+    out.push(' ');
+    out.push_str(tail);
+}
+
 /// Generate a batch of first names.
 ///
 /// # Arguments
@@ -97,22 +202,15 @@ pub fn generate_name(rng: &mut ForgeryRng, locale: Locale) -> String {
     let first_names = data.first_names().unwrap_or(&[]);
     let last_names = data.last_names().unwrap_or(&[]);
 
-    let first = if first_names.is_empty() {
-        "Unknown"
-    } else {
-        rng.choose(first_names)
-    };
-    let last = if last_names.is_empty() {
-        "Unknown"
-    } else {
-        rng.choose(last_names)
-    };
-
-    if locale.family_name_first() {
-        format!("{} {}", last, first)
-    } else {
-        format!("{} {}", first, last)
-    }
+    let mut name = String::with_capacity(16);
+    push_name(
+        rng,
+        first_names,
+        last_names,
+        locale.family_name_first(),
+        &mut name,
+    );
+    name
 }
 
 /// Generate a single first name.
@@ -148,6 +246,91 @@ mod tests {
     use super::*;
     use crate::data::en_us::{FIRST_NAMES, LAST_NAMES};
 
+    #[test]
+    fn test_generate_names_arena_matches_vec() {
+        for locale in [Locale::EnUS, Locale::JaJP] {
+            let mut rng1 = ForgeryRng::new();
+            let mut rng2 = ForgeryRng::new();
+            rng1.seed(42);
+            rng2.seed(42);
+
+            let arena = generate_names_arena(&mut rng1, locale, 100);
+            assert_eq!(arena.to_vec(), generate_names(&mut rng2, locale, 100));
+        }
+    }
+
+    #[test]
+    fn test_sharded_names_follow_worker_streams() {
+        // Large enough for the shards to run on threads
+        let n = SHARD_THREAD_THRESHOLD + 5;
+        let workers = 3;
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(42);
+        reference.seed(42);
+
+        let sharded = generate_names_sharded(&mut rng, Locale::EnUS, n, workers);
+        let mut expected = Vec::with_capacity(n);
+        for i in 0..workers {
+            let mut shard_rng = ForgeryRng::new();
+            shard_rng.seed(reference.next_u64());
+            let len = n / workers + usize::from(i < n % workers);
+            expected.extend(generate_names(&mut shard_rng, Locale::EnUS, len));
+        }
+        assert_eq!(sharded.to_vec(), expected);
+        assert_eq!(rng.next_u64(), reference.next_u64());
+
+        // One worker is the plain batch
+        rng.seed(7);
+        reference.seed(7);
+        assert_eq!(
+            generate_names_sharded(&mut rng, Locale::EnUS, 10, 1).to_vec(),
+            generate_names(&mut reference, Locale::EnUS, 10)
+        );
+    }
+
+    #[test]
+    fn test_sharded_names_clamp_workers_to_batch_size() {
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(3);
+        reference.seed(3);
+
+        let clamped = generate_names_sharded(&mut rng, Locale::EnUS, 10, usize::MAX);
+        let exact = generate_names_sharded(&mut reference, Locale::EnUS, 10, 10);
+        assert_eq!(clamped.to_vec(), exact.to_vec());
+        assert_eq!(rng.next_u64(), reference.next_u64());
+
+        // Above the cap, the cap applies even when n is larger
+        let n = MAX_SHARD_WORKERS * 4;
+        rng.seed(3);
+        reference.seed(3);
+        let capped = generate_names_sharded(&mut rng, Locale::EnUS, n, usize::MAX);
+        let exact = generate_names_sharded(&mut reference, Locale::EnUS, n, MAX_SHARD_WORKERS);
+        assert_eq!(capped.to_vec(), exact.to_vec());
+        assert_eq!(rng.next_u64(), reference.next_u64());
+    }
+
+    #[test]
+    fn test_sharded_names_never_leave_a_shard_empty() {
+        // div_ceil sizing would give 2, 2, 2, 2, 2, 0 here
+        let (n, workers) = (10, 6);
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(5);
+        reference.seed(5);
+
+        let sharded = generate_names_sharded(&mut rng, Locale::EnUS, n, workers);
+        let mut expected = Vec::with_capacity(n);
+        for len in [2, 2, 2, 2, 1, 1] {
+            let mut shard_rng = ForgeryRng::new();
+            shard_rng.seed(reference.next_u64());
+            expected.extend(generate_names(&mut shard_rng, Locale::EnUS, len));
+        }
+        assert_eq!(sharded.to_vec(), expected);
+        assert_eq!(rng.next_u64(), reference.next_u64());
+    }
+
     #[test]
     fn test_generate_names_count() {
         let mut rng = ForgeryRng::new();
@@ -2,9 +2,52 @@
 //!
 //! Generates URLs, domain names, IP addresses, and MAC addresses.
 
+use crate::arena::FixedWidthArena;
 use crate::data::en_us::TLDS;
+use crate::providers::identifiers::{
+    encode_hex_16, generate_fixed_width, generate_fixed_width_arena, hex_byte,
+};
 use crate::rng::ForgeryRng;
 
+/// Decimal text of every `u8`, as `(digit count, digits...)`.
+///
+/// Lets IPv4 octets be written with one table load and a slice copy instead
+/// of going through the `Display` machinery.
+const OCTET_DIGITS: [[u8; 4]; 256] = {
+    let mut table = [[0u8; 4]; 256];
+    let mut i = 0;
+    while i < 256 {
+        let value = i as u8;
+        table[i] = if value >= 100 {
+            [
+                3,
+                b'0' + value / 100,
+                b'0' + value / 10 % 10,
+                b'0' + value % 10,
+            ]
+        } else if value >= 10 {
+            [2, b'0' + value / 10, b'0' + value % 10, 0]
+        } else {
+            [1, b'0' + value, 0, 0]
+        };
+        i += 1;
+    }
+    table
+};
+
+/// Append `octet` to `out` in decimal.
+#[inline]
+fn push_octet(out: &mut String, octet: u8) {
+    let [len, d0, d1, d2] = OCTET_DIGITS[octet as usize];
+    let digits = [d0, d1, d2];
+    out.push_str(std::str::from_utf8(&digits[..len as usize]).expect("ASCII digits"));
+}
+
+/// Second-level labels for generated domain names.
+const DOMAIN_WORDS: [&str; 10] = [
+    "example", "test", "sample", "demo", "data", "info", "site", "web", "app", "api",
+];
+
 /// Generate a batch of random domain names.
 pub fn generate_domain_names(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
     let mut domains = Vec::with_capacity(n);
@@ -17,10 +60,7 @@ pub fn generate_domain_names(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
 /// Generate a single random domain name.
 #[inline]
 pub fn generate_domain_name(rng: &mut ForgeryRng) -> String {
-    let words = [
-        "example", "test", "sample", "demo", "data", "info", "site", "web", "app", "api",
-    ];
-    let word = rng.choose(&words);
+    let word = rng.choose(&DOMAIN_WORDS);
     let tld = rng.choose(TLDS);
     format!("{}.{}", word, tld)
 }
@@ -37,7 +77,8 @@ pub fn generate_urls(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
 /// Generate a single random URL.
 #[inline]
 pub fn generate_url(rng: &mut ForgeryRng) -> String {
-    let domain = generate_domain_name(rng);
+    let word = rng.choose(&DOMAIN_WORDS);
+    let tld = rng.choose(TLDS);
     let paths = [
         "",
         "/about",
@@ -49,7 +90,15 @@ pub fn generate_url(rng: &mut ForgeryRng) -> String {
         "/docs",
     ];
     let path = rng.choose(&paths);
-    format!("https://{}{}", domain, path)
+
+    // Same draws as generate_domain_name, written into one buffer
+    let mut url = String::with_capacity(9 + word.len() + tld.len() + path.len());
+    url.push_str("https://");
+    url.push_str(word);
+    url.push('.');
+    url.push_str(tld);
+    url.push_str(path);
+    url
 }
 
 /// Generate a batch of random IPv4 addresses.
@@ -64,57 +113,182 @@ pub fn generate_ipv4s(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
 /// Generate a single random IPv4 address.
 #[inline]
 pub fn generate_ipv4(rng: &mut ForgeryRng) -> String {
-    let a: u8 = rng.gen_range(1, 255);
-    let b: u8 = rng.gen_range(0, 255);
-    let c: u8 = rng.gen_range(0, 255);
-    let d: u8 = rng.gen_range(1, 254);
-    format!("{}.{}.{}.{}", a, b, c, d)
+    // The two middle octets span the full byte range, so they share one draw
+    let a = 1 + rng.bounded_u32(255) as u8;
+    let [b, c, _, _] = rng.next_u32().to_le_bytes();
+    let d = 1 + rng.bounded_u32(254) as u8;
+
+    // Longest form is "255.255.255.255"
+    let mut ip = String::with_capacity(15);
+    push_octet(&mut ip, a);
+    ip.push('.');
+    push_octet(&mut ip, b);
+    ip.push('.');
+    push_octet(&mut ip, c);
+    ip.push('.');
+    push_octet(&mut ip, d);
+    ip
 }
 
 /// Generate a batch of random IPv6 addresses.
+///
+/// Each address is exactly four RNG words, so large batches go through the
+/// same slab-filled, multi-threaded path as UUIDs.
 pub fn generate_ipv6s(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-    let mut ips = Vec::with_capacity(n);
-    for _ in 0..n {
-        ips.push(generate_ipv6(rng));
-    }
-    ips
+    generate_fixed_width(rng, n, |bytes: &mut [u8; 16]| format_ipv6(bytes))
+}
+
+/// Generate a batch of random IPv6 addresses into a [`FixedWidthArena`].
+///
+/// Produces the same addresses as [`generate_ipv6s`] for the same RNG state.
+pub fn generate_ipv6s_arena(rng: &mut ForgeryRng, n: usize) -> FixedWidthArena {
+    generate_fixed_width_arena(rng, n, |bytes: &mut [u8; 16], out: &mut [u8; 39]| {
+        encode_ipv6(bytes, out)
+    })
 }
 
 /// Generate a single random IPv6 address.
 #[inline]
 pub fn generate_ipv6(rng: &mut ForgeryRng) -> String {
-    let mut groups = Vec::with_capacity(8);
-    for _ in 0..8 {
-        let group: u16 = rng.gen_range(0, 65535);
-        groups.push(format!("{:04x}", group));
+    // Every group spans the full u16 range, so fill all 128 bits directly
+    let mut bytes = [0u8; 16];
+    rng.fill_bytes(&mut bytes);
+    format_ipv6(&bytes)
+}
+
+/// Format 16 bytes as eight colon-separated groups of four hex digits.
+fn format_ipv6(bytes: &[u8; 16]) -> String {
+    // 8 groups of 4 hex digits + 7 colons = 39
+    let mut out = [0u8; 39];
+    encode_ipv6(bytes, &mut out);
+    String::from_utf8(out.to_vec()).expect("hex digits are ASCII")
+}
+
+/// Write 16 bytes as eight colon-separated groups of four hex digits.
+#[inline]
+fn encode_ipv6(bytes: &[u8; 16], out: &mut [u8; 39]) {
+    let hex = encode_hex_16(bytes);
+    for (i, group) in hex.chunks_exact(4).enumerate() {
+        out[i * 5..i * 5 + 4].copy_from_slice(group);
+        if i < 7 {
+            out[i * 5 + 4] = b':';
+        }
     }
-    groups.join(":")
 }
 
 /// Generate a batch of random MAC addresses.
+///
+/// Each address is exactly two RNG words, so large batches go through the
+/// same slab-filled, multi-threaded path as UUIDs.
 pub fn generate_mac_addresses(rng: &mut ForgeryRng, n: usize) -> Vec<String> {
-    let mut macs = Vec::with_capacity(n);
-    for _ in 0..n {
-        macs.push(generate_mac_address(rng));
-    }
-    macs
+    generate_fixed_width(rng, n, |bytes: &mut [u8; 8]| format_mac(bytes))
+}
+
+/// Generate a batch of random MAC addresses into a [`FixedWidthArena`].
+///
+/// Produces the same addresses as [`generate_mac_addresses`] for the same
+/// RNG state.
+pub fn generate_mac_addresses_arena(rng: &mut ForgeryRng, n: usize) -> FixedWidthArena {
+    generate_fixed_width_arena(rng, n, |bytes: &mut [u8; 8], out: &mut [u8; 17]| {
+        encode_mac(bytes, out)
+    })
 }
 
 /// Generate a single random MAC address.
 #[inline]
 pub fn generate_mac_address(rng: &mut ForgeryRng) -> String {
-    let mut bytes = [0u8; 6];
+    // Drawing 6 bytes consumes two whole RNG words either way; take all 8
+    // so singles and batches read the stream identically
+    let mut bytes = [0u8; 8];
     rng.fill_bytes(&mut bytes);
-    format!(
-        "{:02x}:{:02x}:{:02x}:{:02x}:{:02x}:{:02x}",
-        bytes[0], bytes[1], bytes[2], bytes[3], bytes[4], bytes[5]
-    )
+    format_mac(&bytes)
+}
+
+/// Format the first 6 of `bytes` as colon-separated hex pairs.
+fn format_mac(bytes: &[u8; 8]) -> String {
+    // 6 bytes as 2 hex digits + 5 colons = 17
+    let mut out = [0u8; 17];
+    encode_mac(bytes, &mut out);
+    String::from_utf8(out.to_vec()).expect("hex digits are ASCII")
+}
+
+/// Write the first 6 of `bytes` as colon-separated hex pairs.
+#[inline]
+fn encode_mac(bytes: &[u8; 8], out: &mut [u8; 17]) {
+    for (i, &byte) in bytes[..6].iter().enumerate() {
+        out[i * 3..i * 3 + 2].copy_from_slice(&hex_byte(byte));
+        if i < 5 {
+            out[i * 3 + 2] = b':';
+        }
+    }
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_octet_digits_match_display() {
+        for value in 0..=255u8 {
+            let mut out = String::new();
+            push_octet(&mut out, value);
+            assert_eq!(out, value.to_string());
+        }
+    }
+
+    #[test]
+    fn test_ipv6_and_mac_match_format_macros() {
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(7);
+        reference.seed(7);
+
+        for _ in 0..100 {
+            let mut bytes = [0u8; 16];
+            reference.fill_bytes(&mut bytes);
+            let groups: Vec<String> = bytes
+                .chunks_exact(2)
+                .map(|pair| format!("{:02x}{:02x}", pair[0], pair[1]))
+                .collect();
+            assert_eq!(generate_ipv6(&mut rng), groups.join(":"));
+
+            let mut bytes = [0u8; 6];
+            reference.fill_bytes(&mut bytes);
+            let expected: Vec<String> = bytes.iter().map(|b| format!("{:02x}", b)).collect();
+            assert_eq!(generate_mac_address(&mut rng), expected.join(":"));
+        }
+    }
+
+    #[test]
+    fn test_ipv6_and_mac_batches_match_singles() {
+        // Large enough to take the multi-threaded path on multi-core machines
+        let n = 140_000;
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(3);
+        reference.seed(3);
+
+        let ipv6s = generate_ipv6s(&mut rng, n);
+        let expected: Vec<String> = (0..n).map(|_| generate_ipv6(&mut reference)).collect();
+        assert_eq!(ipv6s, expected);
+
+        let macs = generate_mac_addresses(&mut rng, n);
+        let expected: Vec<String> = (0..n)
+            .map(|_| generate_mac_address(&mut reference))
+            .collect();
+        assert_eq!(macs, expected);
+        assert_eq!(rng.next_u64(), reference.next_u64());
+
+        let ipv6s = generate_ipv6s_arena(&mut rng, n);
+        let expected = generate_ipv6s(&mut reference, n);
+        assert_eq!(ipv6s.to_vec(), expected);
+
+        let macs = generate_mac_addresses_arena(&mut rng, n);
+        let expected = generate_mac_addresses(&mut reference, n);
+        assert_eq!(macs.to_vec(), expected);
+        assert_eq!(rng.next_u64(), reference.next_u64());
+    }
+
     // Domain name tests
     #[test]
     fn test_generate_domain_names_count() {
@@ -187,6 +361,22 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_ipv4_first_and_last_octet_ranges() {
+        let mut rng = ForgeryRng::new();
+        rng.seed(42);
+
+        for ip in generate_ipv4s(&mut rng, 2000) {
+            let octets: Vec<u8> = ip.split('.').map(|p| p.parse().unwrap()).collect();
+            assert_ne!(octets[0], 0, "First octet should be 1-255: {}", ip);
+            assert!(
+                (1..=254).contains(&octets[3]),
+                "Last octet should be 1-254: {}",
+                ip
+            );
+        }
+    }
+
     // IPv6 tests
     #[test]
     fn test_generate_ipv6s_count() {
@@ -2,6 +2,7 @@
 //!
 //! Generates integers, floats, and other numeric values.
 
+use crate::providers::identifiers::generate_fixed_width;
 use crate::rng::ForgeryRng;
 
 /// Error type for integer range generation.
@@ -68,6 +69,78 @@ impl std::fmt::Display for FloatRangeError {
 
 impl std::error::Error for FloatRangeError {}
 
+/// Uniform sampler for an inclusive `i64` range, specialized once per range.
+///
+/// Choosing the strategy up front keeps the per-element loop free of range
+/// arithmetic: a single-value range draws nothing, power-of-two spans are a
+/// single masked draw (a `u32` draw when the span fits in 32 bits), other
+/// spans that fit in 32 bits use
+/// Lemire's multiply-shift with a precomputed rejection threshold (one `u32`
+/// draw, no division), and wider spans defer to `gen_range`.
+#[derive(Debug, Clone, Copy)]
+enum IntSampler {
+    /// `min == max`; no randomness is consumed.
+    Constant { value: i64 },
+    /// Span is a power of two no wider than 2^32.
+    Mask32 { min: i64, mask: u32 },
+    /// Span is a wider power of two (including the full `i64` range).
+    Mask { min: i64, mask: u64 },
+    /// Span fits in a `u32`; draws with `low < threshold` are rejected.
+    Lemire { min: i64, span: u32, threshold: u32 },
+    /// Any other span.
+    General { min: i64, max: i64 },
+}
+
+impl IntSampler {
+    /// Build a sampler for `min..=max`. Requires `min <= max`.
+    fn new(min: i64, max: i64) -> Self {
+        let span = (i128::from(max) - i128::from(min) + 1) as u128;
+        if span == 1 {
+            IntSampler::Constant { value: min }
+        } else if span.is_power_of_two() && span <= 1 << 32 {
+            IntSampler::Mask32 {
+                min,
+                mask: (span - 1) as u32,
+            }
+        } else if span.is_power_of_two() {
+            IntSampler::Mask {
+                min,
+                mask: (span - 1) as u64,
+            }
+        } else if span < 1 << 32 {
+            let span = span as u32;
+            IntSampler::Lemire {
+                min,
+                span,
+                threshold: span.wrapping_neg() % span,
+            }
+        } else {
+            IntSampler::General { min, max }
+        }
+    }
+
+    /// Draw one value.
+    #[inline]
+    fn sample(&self, rng: &mut ForgeryRng) -> i64 {
+        match *self {
+            IntSampler::Constant { value } => value,
+            IntSampler::Mask32 { min, mask } => min + i64::from(rng.next_u32() & mask),
+            IntSampler::Mask { min, mask } => min.wrapping_add((rng.next_u64() & mask) as i64),
+            IntSampler::Lemire {
+                min,
+                span,
+                threshold,
+            } => loop {
+                let m = u64::from(rng.next_u32()) * u64::from(span);
+                if (m as u32) >= threshold {
+                    return min + (m >> 32) as i64;
+                }
+            },
+            IntSampler::General { min, max } => rng.gen_range(min, max),
+        }
+    }
+}
+
 /// Generate a batch of random integers within a range.
 ///
 /// # Arguments
@@ -90,11 +163,18 @@ pub fn generate_integers(
         return Err(RangeError { min, max });
     }
 
-    let mut integers = Vec::with_capacity(n);
-    for _ in 0..n {
-        integers.push(rng.gen_range(min, max));
-    }
-    Ok(integers)
+    // Masked samplers use a fixed number of RNG words per value, so large
+    // batches can be split across threads with the same output
+    Ok(match IntSampler::new(min, max) {
+        IntSampler::Constant { value } => vec![value; n],
+        IntSampler::Mask32 { min, mask } => generate_fixed_width(rng, n, |bytes: &mut [u8; 4]| {
+            min + i64::from(u32::from_le_bytes(*bytes) & mask)
+        }),
+        IntSampler::Mask { min, mask } => generate_fixed_width(rng, n, |bytes: &mut [u8; 8]| {
+            min.wrapping_add((u64::from_le_bytes(*bytes) & mask) as i64)
+        }),
+        sampler => (0..n).map(|_| sampler.sample(rng)).collect(),
+    })
 }
 
 /// Generate a single random integer within a range.
@@ -109,7 +189,13 @@ pub fn generate_integer(rng: &mut ForgeryRng, min: i64, max: i64) -> Result<i64,
     if min > max {
         return Err(RangeError { min, max });
     }
-    Ok(rng.gen_range(min, max))
+    let span = i128::from(max) - i128::from(min) + 1;
+    if span < 1 << 32 && !(span as u64).is_power_of_two() {
+        // Same draws as the Lemire sampler, but the rejection threshold (a
+        // division) is only computed when the first draw lands near the bias zone
+        return Ok(min + i64::from(rng.bounded_u32(span as u32)));
+    }
+    Ok(IntSampler::new(min, max).sample(rng))
 }
 
 /// Generate a batch of random floats within a range.
@@ -224,6 +310,12 @@ mod tests {
         for i in &ints {
             assert_eq!(*i, 42);
         }
+
+        // A single-value range consumes no randomness
+        let mut reference = ForgeryRng::new();
+        reference.seed(42);
+        assert_eq!(generate_integer(&mut rng, 7, 7), Ok(7));
+        assert_eq!(rng.next_u64(), reference.next_u64());
     }
 
     #[test]
@@ -265,6 +357,108 @@ mod tests {
         assert_eq!(ints1, ints2);
     }
 
+    #[test]
+    fn test_int_sampler_strategy_selection() {
+        assert!(matches!(
+            IntSampler::new(-4, -4),
+            IntSampler::Constant { value: -4 }
+        ));
+        assert!(matches!(
+            IntSampler::new(0, 255),
+            IntSampler::Mask32 { mask: 255, .. }
+        ));
+        assert!(matches!(
+            IntSampler::new(0, u32::MAX as i64),
+            IntSampler::Mask32 { mask: u32::MAX, .. }
+        ));
+        assert!(matches!(
+            IntSampler::new(0, 1 << 32),
+            IntSampler::General { .. }
+        ));
+        assert!(matches!(
+            IntSampler::new(0, (1 << 33) - 1),
+            IntSampler::Mask {
+                mask: 0x1_ffff_ffff,
+                ..
+            }
+        ));
+        assert!(matches!(
+            IntSampler::new(i64::MIN, i64::MAX),
+            IntSampler::Mask { mask: u64::MAX, .. }
+        ));
+        assert!(matches!(
+            IntSampler::new(0, 100),
+            IntSampler::Lemire { span: 101, .. }
+        ));
+        assert!(matches!(
+            IntSampler::new(0, 1 << 40),
+            IntSampler::General { .. }
+        ));
+    }
+
+    #[test]
+    fn test_single_integer_matches_sampler() {
+        let mut rng = ForgeryRng::new();
+        let mut reference = ForgeryRng::new();
+        rng.seed(42);
+        reference.seed(42);
+
+        for (min, max) in [
+            (0, 100),
+            (-3, 3),
+            (0, 255),
+            (0, u32::MAX as i64 - 1),
+            (5, 5),
+        ] {
+            let sampler = IntSampler::new(min, max);
+            for _ in 0..1000 {
+                assert_eq!(
+                    generate_integer(&mut rng, min, max).unwrap(),
+                    sampler.sample(&mut reference)
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_masked_batches_match_sampler() {
+        // Large enough for the batch to be split across threads
+        let n = 140_000;
+        for (min, max) in [(0, 255), (-8, 7), (i64::MIN, i64::MAX)] {
+            let mut rng = ForgeryRng::new();
+            let mut reference = ForgeryRng::new();
+            rng.seed(42);
+            reference.seed(42);
+
+            let sampler = IntSampler::new(min, max);
+            let batch = generate_integers(&mut rng, n, min, max).unwrap();
+            let singles: Vec<i64> = (0..n).map(|_| sampler.sample(&mut reference)).collect();
+            assert_eq!(batch, singles);
+            assert_eq!(rng.next_u64(), reference.next_u64());
+        }
+    }
+
+    #[test]
+    fn test_int_sampler_covers_small_ranges() {
+        let mut rng = ForgeryRng::new();
+        rng.seed(42);
+
+        // Power-of-two span (mask) and odd span (Lemire)
+        for (min, max) in [(-8i64, 7i64), (10, 16)] {
+            let ints = generate_integers(&mut rng, 2000, min, max).unwrap();
+            for value in min..=max {
+                assert!(
+                    ints.contains(&value),
+                    "missing {} in {}..={}",
+                    value,
+                    min,
+                    max
+                );
+            }
+            assert!(ints.iter().all(|&v| v >= min && v <= max));
+        }
+    }
+
     #[test]
     fn test_empty_batch() {
         let mut rng = ForgeryRng::new();
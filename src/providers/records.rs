@@ -12,7 +12,7 @@ use crate::providers::{
     phone, text,
 };
 use crate::rng::ForgeryRng;
-use std::collections::{BTreeMap, HashMap, HashSet};
+use std::collections::{BTreeMap, HashMap};
 use std::fmt;
 
 /// Error type for schema-related errors.
@@ -166,71 +166,79 @@ impl Value {
 
 /// Parse a simple type name into a FieldSpec.
 pub fn parse_simple_type(type_name: &str) -> Result<FieldSpec, SchemaError> {
-    match type_name {
-        "name" => Ok(FieldSpec::Name),
-        "first_name" => Ok(FieldSpec::FirstName),
-        "last_name" => Ok(FieldSpec::LastName),
-        "email" => Ok(FieldSpec::Email),
-        "safe_email" => Ok(FieldSpec::SafeEmail),
-        "free_email" => Ok(FieldSpec::FreeEmail),
-        "uuid" => Ok(FieldSpec::Uuid),
-        "int" => Ok(FieldSpec::Int),
-        "float" => Ok(FieldSpec::Float),
-        "phone" => Ok(FieldSpec::Phone),
-        "address" => Ok(FieldSpec::Address),
-        "street_address" => Ok(FieldSpec::StreetAddress),
-        "city" => Ok(FieldSpec::City),
-        "state" => Ok(FieldSpec::State),
-        "country" => Ok(FieldSpec::Country),
-        "zip_code" => Ok(FieldSpec::ZipCode),
-        "company" => Ok(FieldSpec::Company),
-        "job" => Ok(FieldSpec::Job),
-        "catch_phrase" => Ok(FieldSpec::CatchPhrase),
-        "url" => Ok(FieldSpec::Url),
-        "domain_name" => Ok(FieldSpec::DomainName),
-        "ipv4" => Ok(FieldSpec::Ipv4),
-        "ipv6" => Ok(FieldSpec::Ipv6),
-        "mac_address" => Ok(FieldSpec::MacAddress),
-        "color" => Ok(FieldSpec::Color),
-        "hex_color" => Ok(FieldSpec::HexColor),
-        "rgb_color" => Ok(FieldSpec::RgbColor),
-        "credit_card" => Ok(FieldSpec::CreditCard),
-        "iban" => Ok(FieldSpec::Iban),
-        "date" => Ok(FieldSpec::Date),
-        "datetime" => Ok(FieldSpec::DateTime),
-        "md5" => Ok(FieldSpec::Md5),
-        "sha256" => Ok(FieldSpec::Sha256),
-        "sentence" => Ok(FieldSpec::Sentence),
-        "paragraph" => Ok(FieldSpec::Paragraph),
-        "text" => Ok(FieldSpec::Simple("text".to_string())),
-        _ => Err(SchemaError {
-            message: format!("Unknown type: {}", type_name),
-        }),
-    }
+    builtin_field_spec(type_name).ok_or_else(|| SchemaError {
+        message: format!("Unknown type: {}", type_name),
+    })
+}
+
+/// Look up a built-in simple type, without building an error on a miss.
+///
+/// Custom provider names always miss here, so schema parsing checks this
+/// first and only formats an "Unknown type" error once the custom registry
+/// has missed too.
+fn builtin_field_spec(type_name: &str) -> Option<FieldSpec> {
+    let spec = match type_name {
+        "name" => FieldSpec::Name,
+        "first_name" => FieldSpec::FirstName,
+        "last_name" => FieldSpec::LastName,
+        "email" => FieldSpec::Email,
+        "safe_email" => FieldSpec::SafeEmail,
+        "free_email" => FieldSpec::FreeEmail,
+        "uuid" => FieldSpec::Uuid,
+        "int" => FieldSpec::Int,
+        "float" => FieldSpec::Float,
+        "phone" => FieldSpec::Phone,
+        "address" => FieldSpec::Address,
+        "street_address" => FieldSpec::StreetAddress,
+        "city" => FieldSpec::City,
+        "state" => FieldSpec::State,
+        "country" => FieldSpec::Country,
+        "zip_code" => FieldSpec::ZipCode,
+        "company" => FieldSpec::Company,
+        "job" => FieldSpec::Job,
+        "catch_phrase" => FieldSpec::CatchPhrase,
+        "url" => FieldSpec::Url,
+        "domain_name" => FieldSpec::DomainName,
+        "ipv4" => FieldSpec::Ipv4,
+        "ipv6" => FieldSpec::Ipv6,
+        "mac_address" => FieldSpec::MacAddress,
+        "color" => FieldSpec::Color,
+        "hex_color" => FieldSpec::HexColor,
+        "rgb_color" => FieldSpec::RgbColor,
+        "credit_card" => FieldSpec::CreditCard,
+        "iban" => FieldSpec::Iban,
+        "date" => FieldSpec::Date,
+        "datetime" => FieldSpec::DateTime,
+        "md5" => FieldSpec::Md5,
+        "sha256" => FieldSpec::Sha256,
+        "sentence" => FieldSpec::Sentence,
+        "paragraph" => FieldSpec::Paragraph,
+        "text" => FieldSpec::Simple("text".to_string()),
+        _ => return None,
+    };
+    Some(spec)
 }
 
 /// Parse a simple type name into a FieldSpec, with custom provider awareness.
 ///
 /// If the type name matches a built-in type, returns the corresponding FieldSpec.
-/// If the type name is in the custom_provider_names set, returns FieldSpec::Custom.
+/// If the type name is a key of custom_providers, returns FieldSpec::Custom.
 /// Otherwise, returns an error.
 pub fn parse_simple_type_with_custom(
     type_name: &str,
-    custom_provider_names: &HashSet<String>,
+    custom_providers: &HashMap<String, CustomProvider>,
 ) -> Result<FieldSpec, SchemaError> {
     // First try to parse as a built-in type
-    match parse_simple_type(type_name) {
-        Ok(spec) => Ok(spec),
-        Err(_) => {
-            // Check if it's a custom provider
-            if custom_provider_names.contains(type_name) {
-                Ok(FieldSpec::Custom(type_name.to_string()))
-            } else {
-                Err(SchemaError {
-                    message: format!("Unknown type: {}", type_name),
-                })
-            }
-        }
+    if let Some(spec) = builtin_field_spec(type_name) {
+        return Ok(spec);
+    }
+    // Check if it's a custom provider
+    if custom_providers.contains_key(type_name) {
+        Ok(FieldSpec::Custom(type_name.to_string()))
+    } else {
+        Err(SchemaError {
+            message: format!("Unknown type: {}", type_name),
+        })
     }
 }
 
@@ -472,16 +480,75 @@ pub fn generate_value_with_custom(
     spec: &FieldSpec,
     custom_providers: &HashMap<String, CustomProvider>,
 ) -> Result<Value, SchemaError> {
-    if let FieldSpec::Custom(name) = spec {
-        let provider = custom_providers.get(name).ok_or_else(|| SchemaError {
-            message: format!("Custom provider '{}' not found", name),
-        })?;
-        Ok(Value::String(provider.generate(rng)))
-    } else {
-        generate_value(rng, locale, spec)
+    resolve_field(spec, custom_providers)?.generate(rng, locale)
+}
+
+/// A field spec with its custom provider (if any) already looked up.
+///
+/// Record generators resolve every field once per call, so the per-row loop
+/// never hashes a provider name.
+#[derive(Clone, Copy)]
+pub(crate) enum ResolvedField<'a> {
+    /// A built-in generator.
+    Builtin(&'a FieldSpec),
+    /// A registered custom provider.
+    Custom(&'a CustomProvider),
+}
+
+impl ResolvedField<'_> {
+    /// Generate one value for this field.
+    #[inline]
+    pub(crate) fn generate(
+        self,
+        rng: &mut ForgeryRng,
+        locale: Locale,
+    ) -> Result<Value, SchemaError> {
+        match self {
+            Self::Builtin(spec) => generate_value(rng, locale, spec),
+            Self::Custom(provider) => Ok(Value::String(provider.generate(rng))),
+        }
     }
 }
 
+/// Look up the custom provider behind `spec`, if it names one.
+pub(crate) fn resolve_field<'a>(
+    spec: &'a FieldSpec,
+    custom_providers: &'a HashMap<String, CustomProvider>,
+) -> Result<ResolvedField<'a>, SchemaError> {
+    match spec {
+        FieldSpec::Custom(name) => custom_providers
+            .get(name)
+            .map(ResolvedField::Custom)
+            .ok_or_else(|| SchemaError {
+                message: format!("Custom provider '{}' not found", name),
+            }),
+        _ => Ok(ResolvedField::Builtin(spec)),
+    }
+}
+
+/// Resolve every field of `schema`, keeping the schema's key order.
+pub(crate) fn resolve_schema<'a>(
+    schema: &'a BTreeMap<String, FieldSpec>,
+    custom_providers: &'a HashMap<String, CustomProvider>,
+) -> Result<Vec<(&'a String, ResolvedField<'a>)>, SchemaError> {
+    schema
+        .iter()
+        .map(|(name, spec)| Ok((name, resolve_field(spec, custom_providers)?)))
+        .collect()
+}
+
+/// Resolve the specs of `field_order` (see [`resolve_field_order`]).
+pub(crate) fn resolve_tuple_fields<'a>(
+    schema: &'a BTreeMap<String, FieldSpec>,
+    field_order: &[String],
+    custom_providers: &'a HashMap<String, CustomProvider>,
+) -> Result<Vec<ResolvedField<'a>>, SchemaError> {
+    resolve_field_order(schema, field_order)?
+        .into_iter()
+        .map(|spec| resolve_field(spec, custom_providers))
+        .collect()
+}
+
 /// Generate a value for a simple type.
 fn generate_simple_value(
     rng: &mut ForgeryRng,
@@ -629,13 +696,13 @@ pub fn generate_records_with_custom(
     // Validate schema upfront (even when n=0), including custom provider existence
     validate_schema_with_custom(schema, custom_providers)?;
 
+    let fields = resolve_schema(schema, custom_providers)?;
     let mut records = Vec::with_capacity(n);
 
     for _ in 0..n {
         let mut record = BTreeMap::new();
-        for (field_name, spec) in schema {
-            let value = generate_value_with_custom(rng, locale, spec, custom_providers)?;
-            record.insert(field_name.clone(), value);
+        for &(field_name, field) in &fields {
+            record.insert(field_name.clone(), field.generate(rng, locale)?);
         }
         records.push(record);
     }
@@ -657,6 +724,29 @@ pub fn generate_records_tuples_with_custom(
     // Validate schema upfront (even when n=0), including custom provider existence
     validate_schema_with_custom(schema, custom_providers)?;
 
+    let fields = resolve_tuple_fields(schema, field_order, custom_providers)?;
+
+    let mut records = Vec::with_capacity(n);
+
+    for _ in 0..n {
+        let mut record = Vec::with_capacity(fields.len());
+        for &field in &fields {
+            record.push(field.generate(rng, locale)?);
+        }
+        records.push(record);
+    }
+
+    Ok(records)
+}
+
+/// Validate `field_order` against `schema` and look up each field's spec.
+///
+/// Tuple generation resolves the specs once per call, so the per-row loop
+/// walks a slice instead of doing a map lookup for every field of every row.
+pub(crate) fn resolve_field_order<'a>(
+    schema: &'a BTreeMap<String, FieldSpec>,
+    field_order: &[String],
+) -> Result<Vec<&'a FieldSpec>, SchemaError> {
     // Validate field_order: check for duplicates
     let mut seen = std::collections::HashSet::new();
     for field in field_order {
@@ -668,11 +758,15 @@ pub fn generate_records_tuples_with_custom(
     }
 
     // Validate field_order: all fields must exist in schema
+    let mut specs = Vec::with_capacity(field_order.len());
     for field in field_order {
-        if !schema.contains_key(field) {
-            return Err(SchemaError {
-                message: format!("Field '{}' not in schema", field),
-            });
+        match schema.get(field) {
+            Some(spec) => specs.push(spec),
+            None => {
+                return Err(SchemaError {
+                    message: format!("Field '{}' not in schema", field),
+                })
+            }
         }
     }
 
@@ -687,22 +781,7 @@ pub fn generate_records_tuples_with_custom(
         });
     }
 
-    let mut records = Vec::with_capacity(n);
-
-    for _ in 0..n {
-        let mut record = Vec::with_capacity(field_order.len());
-        for field_name in field_order {
-            // Field existence is validated at the start of this function
-            let spec = schema
-                .get(field_name)
-                .expect("field_name was validated to exist in schema");
-            let value = generate_value_with_custom(rng, locale, spec, custom_providers)?;
-            record.push(value);
-        }
-        records.push(record);
-    }
-
-    Ok(records)
+    Ok(specs)
 }
 
 // ============================================================================
@@ -888,11 +967,9 @@ fn generate_arrow_column(
 
         // All other types produce string arrays
         _ => {
+            let field = resolve_field(spec, custom_providers)?;
             let values: Result<Vec<String>, SchemaError> = (0..n)
-                .map(|_| {
-                    generate_value_with_custom(rng, locale, spec, custom_providers)
-                        .map(|v| v.as_string())
-                })
+                .map(|_| field.generate(rng, locale).map(|v| v.as_string()))
                 .collect();
             Ok(Arc::new(StringArray::from(values?)))
         }
@@ -1495,6 +1572,39 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_resolved_records_match_per_field_lookup() {
+        let mut custom_providers = HashMap::new();
+        custom_providers.insert(
+            "fruit".to_string(),
+            CustomProvider::Uniform(vec!["apple".to_string(), "banana".to_string()]),
+        );
+
+        let mut schema = BTreeMap::new();
+        schema.insert("fruit".to_string(), FieldSpec::Custom("fruit".to_string()));
+        schema.insert("name".to_string(), FieldSpec::Name);
+
+        let mut rng1 = ForgeryRng::new();
+        let mut rng2 = ForgeryRng::new();
+        rng1.seed(42);
+        rng2.seed(42);
+
+        let records =
+            generate_records_with_custom(&mut rng1, Locale::EnUS, 20, &schema, &custom_providers)
+                .unwrap();
+        for record in records {
+            for (field_name, spec) in &schema {
+                let expected =
+                    generate_value_with_custom(&mut rng2, Locale::EnUS, spec, &custom_providers)
+                        .unwrap();
+                assert_eq!(record[field_name].as_string(), expected.as_string());
+            }
+        }
+
+        let missing = FieldSpec::Custom("missing".to_string());
+        assert!(resolve_field(&missing, &custom_providers).is_err());
+    }
+
     #[test]
     fn test_generate_arrow_with_custom_provider() {
         let mut rng = ForgeryRng::new();
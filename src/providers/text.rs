@@ -2,6 +2,7 @@
 //!
 //! Generates sentences, paragraphs, and text blocks.
 
+use crate::arena::StringArena;
 use crate::data::get_locale_data;
 use crate::locale::Locale;
 use crate::rng::ForgeryRng;
@@ -26,6 +27,28 @@ pub fn generate_sentences(
     sentences
 }
 
+/// Generate a batch of random sentences into a [`StringArena`].
+///
+/// Produces the same sentences as [`generate_sentences`] for the same RNG
+/// state, without allocating a separate `String` per sentence.
+pub fn generate_sentences_arena(
+    rng: &mut ForgeryRng,
+    locale: Locale,
+    n: usize,
+    word_count: usize,
+) -> StringArena {
+    let lorem_words = get_locale_data(locale).text_words().unwrap_or(&[]);
+    let mut arena = StringArena::with_capacity(n, word_count * 8);
+    for _ in 0..n {
+        arena.push_with(|out| {
+            if word_count > 0 {
+                push_sentence(rng, lorem_words, word_count, out);
+            }
+        });
+    }
+    arena
+}
+
 /// Generate a single random sentence.
 ///
 /// The sentence starts with a capital letter and ends with a period.
@@ -35,35 +58,33 @@ pub fn generate_sentence(rng: &mut ForgeryRng, locale: Locale, word_count: usize
         return String::new();
     }
 
-    let data = get_locale_data(locale);
-    let lorem_words = data.text_words().unwrap_or(&[]);
-    if lorem_words.is_empty() {
-        return "Lorem ipsum.".to_string();
-    }
+    let lorem_words = get_locale_data(locale).text_words().unwrap_or(&[]);
+    let mut sentence = String::with_capacity(word_count * 8);
+    push_sentence(rng, lorem_words, word_count, &mut sentence);
+    sentence
+}
 
-    let mut words = Vec::with_capacity(word_count);
-    for _ in 0..word_count {
-        words.push(*rng.choose(lorem_words));
+/// Append a sentence of `word_count` words drawn from `words` to `out`.
+///
+/// Words are written straight into `out`, so sentences and paragraphs are
+/// built without an intermediate word list or per-sentence strings.
+fn push_sentence(rng: &mut ForgeryRng, words: &[&str], word_count: usize, out: &mut String) {
+    if words.is_empty() {
+        out.push_str("Lorem ipsum.");
+        return;
     }
 
-    // Capitalize first word
-    let mut sentence = String::new();
-    if let Some(first) = words.first() {
-        let mut chars = first.chars();
-        if let Some(c) = chars.next() {
-            sentence.push(c.to_uppercase().next().unwrap_or(c));
-            sentence.push_str(chars.as_str());
+    for i in 0..word_count {
+        let word = *rng.choose(words);
+        if i == 0 {
+            // Capitalize first word
+            push_capitalized(out, word);
+        } else {
+            out.push(' ');
+            out.push_str(word);
         }
     }
-
-    // Add remaining words
-    for word in words.iter().skip(1) {
-        sentence.push(' ');
-        sentence.push_str(word);
-    }
-
-    sentence.push('.');
-    sentence
+    out.push('.');
 }
 
 /// Generate a batch of random paragraphs.
@@ -80,6 +101,24 @@ pub fn generate_paragraphs(
     paragraphs
 }
 
+/// Generate a batch of random paragraphs into a [`StringArena`].
+///
+/// Produces the same paragraphs as [`generate_paragraphs`] for the same RNG
+/// state.
+pub fn generate_paragraphs_arena(
+    rng: &mut ForgeryRng,
+    locale: Locale,
+    n: usize,
+    sentence_count: usize,
+) -> StringArena {
+    let lorem_words = get_locale_data(locale).text_words().unwrap_or(&[]);
+    let mut arena = StringArena::with_capacity(n, sentence_count * 80);
+    for _ in 0..n {
+        arena.push_with(|out| push_paragraph(rng, lorem_words, sentence_count, out));
+    }
+    arena
+}
+
 /// Generate a single random paragraph.
 ///
 /// Each paragraph contains the specified number of sentences.
@@ -89,13 +128,21 @@ pub fn generate_paragraph(rng: &mut ForgeryRng, locale: Locale, sentence_count:
         return String::new();
     }
 
-    let mut sentences = Vec::with_capacity(sentence_count);
-    for _ in 0..sentence_count {
+    let lorem_words = get_locale_data(locale).text_words().unwrap_or(&[]);
+    let mut paragraph = String::with_capacity(sentence_count * 80);
+    push_paragraph(rng, lorem_words, sentence_count, &mut paragraph);
+    paragraph
+}
+
+/// Append a paragraph of `sentence_count` sentences to `out`.
+fn push_paragraph(rng: &mut ForgeryRng, words: &[&str], sentence_count: usize, out: &mut String) {
+    for i in 0..sentence_count {
         let word_count: usize = rng.gen_range(MIN_WORDS_PER_SENTENCE, MAX_WORDS_PER_SENTENCE);
-        sentences.push(generate_sentence(rng, locale, word_count));
+        if i > 0 {
+            out.push(' ');
+        }
+        push_sentence(rng, words, word_count, out);
     }
-
-    sentences.join(" ")
 }
 
 /// Generate a batch of random text blocks with character limits.
@@ -113,33 +160,50 @@ pub fn generate_texts(
     texts
 }
 
-/// Capitalize the first character of a word.
+/// Generate a batch of random text blocks into a [`StringArena`].
+///
+/// Produces the same text blocks as [`generate_texts`] for the same RNG
+/// state.
+pub fn generate_texts_arena(
+    rng: &mut ForgeryRng,
+    locale: Locale,
+    n: usize,
+    min_chars: usize,
+    max_chars: usize,
+) -> StringArena {
+    let lorem_words = get_locale_data(locale).text_words().unwrap_or(&[]);
+    let avg_len = min_chars / 2 + max_chars / 2;
+    let mut arena = StringArena::with_capacity(n, avg_len);
+    for _ in 0..n {
+        arena.push_with(|out| push_text(rng, lorem_words, min_chars, max_chars, out));
+    }
+    arena
+}
+
+/// Append `word` to `out` with its first character capitalized.
 #[inline]
-fn capitalize_word(word: &str) -> String {
+fn push_capitalized(out: &mut String, word: &str) {
     let mut chars = word.chars();
-    match chars.next() {
-        Some(c) => {
-            let upper = c.to_uppercase().next().unwrap_or(c);
-            format!("{}{}", upper, chars.as_str())
-        }
-        None => String::new(),
+    if let Some(c) = chars.next() {
+        out.push(c.to_uppercase().next().unwrap_or(c));
+        out.push_str(chars.as_str());
     }
 }
 
-/// Truncate a string to max_chars, respecting UTF-8 character boundaries.
+/// Truncate the text after `start` to max_chars, respecting UTF-8 character boundaries.
 #[inline]
-fn truncate_to_char_boundary(text: &mut String, max_chars: usize) {
-    if text.len() <= max_chars {
+fn truncate_to_char_boundary(text: &mut String, start: usize, max_chars: usize) {
+    if text.len() - start <= max_chars {
         return;
     }
     // Find the last valid character boundary before max_chars
-    let truncate_at = text
+    let truncate_at = text[start..]
         .char_indices()
         .take_while(|(i, _)| *i <= max_chars)
         .last()
         .map(|(i, _)| i)
         .unwrap_or(0);
-    text.truncate(truncate_at);
+    text.truncate(start + truncate_at);
 }
 
 /// Generate a single random text block with character limits.
@@ -152,14 +216,26 @@ pub fn generate_text(
     min_chars: usize,
     max_chars: usize,
 ) -> String {
+    let lorem_words = get_locale_data(locale).text_words().unwrap_or(&[]);
+    let mut text = String::new();
+    push_text(rng, lorem_words, min_chars, max_chars, &mut text);
+    text
+}
+
+/// Append a text block of between min_chars and max_chars to `out`.
+fn push_text(
+    rng: &mut ForgeryRng,
+    words: &[&str],
+    min_chars: usize,
+    max_chars: usize,
+    out: &mut String,
+) {
     if max_chars == 0 {
-        return String::new();
+        return;
     }
-
-    let data = get_locale_data(locale);
-    let lorem_words = data.text_words().unwrap_or(&[]);
-    if lorem_words.is_empty() {
-        return "Lorem".to_string();
+    if words.is_empty() {
+        out.push_str("Lorem");
+        return;
     }
 
     let target_len = if min_chars >= max_chars {
@@ -167,22 +243,22 @@ pub fn generate_text(
     } else {
         rng.gen_range(min_chars, max_chars)
     };
-
-    let mut text = String::new();
+    let start = out.len();
+    // Room for the longest word past target_len avoids a final regrow
+    out.reserve(target_len + 16);
 
     // First word - capitalize it
-    let first_word = *rng.choose(lorem_words);
-    text.push_str(&capitalize_word(first_word));
+    let first_word = *rng.choose(words);
+    push_capitalized(out, first_word);
 
     // Remaining words
-    while text.len() < target_len {
-        text.push(' ');
-        let word = rng.choose(lorem_words);
-        text.push_str(word);
+    while out.len() - start < target_len {
+        out.push(' ');
+        let word = rng.choose(words);
+        out.push_str(word);
     }
 
-    truncate_to_char_boundary(&mut text, max_chars);
-    text
+    truncate_to_char_boundary(out, start, max_chars);
 }
 
 #[cfg(test)]
@@ -450,6 +526,32 @@ mod tests {
             );
         }
     }
+
+    #[test]
+    fn test_arena_batches_match_vec() {
+        for locale in [Locale::EnUS, Locale::JaJP] {
+            let mut rng1 = ForgeryRng::new();
+            let mut rng2 = ForgeryRng::new();
+            rng1.seed(42);
+            rng2.seed(42);
+
+            for word_count in [0, 1, 10] {
+                let arena = generate_sentences_arena(&mut rng1, locale, 100, word_count);
+                let sentences = generate_sentences(&mut rng2, locale, 100, word_count);
+                assert_eq!(arena.to_vec(), sentences);
+            }
+            for sentence_count in [0, 3] {
+                let arena = generate_paragraphs_arena(&mut rng1, locale, 50, sentence_count);
+                let paragraphs = generate_paragraphs(&mut rng2, locale, 50, sentence_count);
+                assert_eq!(arena.to_vec(), paragraphs);
+            }
+            for (min_chars, max_chars) in [(0, 0), (10, 10), (50, 200)] {
+                let arena = generate_texts_arena(&mut rng1, locale, 100, min_chars, max_chars);
+                let texts = generate_texts(&mut rng2, locale, 100, min_chars, max_chars);
+                assert_eq!(arena.to_vec(), texts);
+            }
+        }
+    }
 }
 
 #[cfg(test)]
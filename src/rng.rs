@@ -3,9 +3,14 @@
 //! Provides a seedable RNG wrapper using ChaCha8 for deterministic generation.
 //! Each `ForgeryRng` instance maintains its own state, enabling per-Faker seeding.
 
-use rand::{Rng, SeedableRng};
+use rand::{Rng, RngCore, SeedableRng};
 use rand_chacha::ChaCha8Rng;
 
+/// Length in bytes of a serialized [`ForgeryRng`] state.
+///
+/// 32 bytes of key, 8 bytes of stream id and 16 bytes of word position.
+pub const STATE_LEN: usize = 56;
+
 /// A seedable random number generator for forgery.
 ///
 /// Uses ChaCha8 for a good balance of speed and quality.
@@ -21,9 +26,13 @@ pub struct ForgeryRng {
 
 impl ForgeryRng {
     /// Create a new RNG with a random seed.
+    ///
+    /// The seed is drawn from rand's thread-local generator, which is seeded
+    /// from the OS once per thread, so creating many instances does not cost
+    /// an OS entropy call each.
     pub fn new() -> Self {
         Self {
-            rng: ChaCha8Rng::from_os_rng(),
+            rng: ChaCha8Rng::from_rng(&mut rand::rng()),
         }
     }
 
@@ -35,6 +44,33 @@ impl ForgeryRng {
         self.rng = ChaCha8Rng::seed_from_u64(value);
     }
 
+    /// Snapshot the current RNG state.
+    ///
+    /// Restoring the snapshot with [`ForgeryRng::set_state`] replays the
+    /// same sequence from this point, regardless of how the state was reached.
+    pub fn state(&self) -> [u8; STATE_LEN] {
+        let mut state = [0u8; STATE_LEN];
+        state[..32].copy_from_slice(&self.rng.get_seed());
+        state[32..40].copy_from_slice(&self.rng.get_stream().to_le_bytes());
+        state[40..].copy_from_slice(&self.rng.get_word_pos().to_le_bytes());
+        state
+    }
+
+    /// Restore a state previously returned by [`ForgeryRng::state`].
+    pub fn set_state(&mut self, state: &[u8; STATE_LEN]) {
+        let mut seed = [0u8; 32];
+        seed.copy_from_slice(&state[..32]);
+        let mut stream = [0u8; 8];
+        stream.copy_from_slice(&state[32..40]);
+        let mut word_pos = [0u8; 16];
+        word_pos.copy_from_slice(&state[40..]);
+
+        let mut rng = ChaCha8Rng::from_seed(seed);
+        rng.set_stream(u64::from_le_bytes(stream));
+        rng.set_word_pos(u128::from_le_bytes(word_pos));
+        self.rng = rng;
+    }
+
     /// Generate a random value within a range (inclusive).
     #[inline]
     pub fn gen_range<T>(&mut self, min: T, max: T) -> T
@@ -52,8 +88,56 @@ impl ForgeryRng {
     #[inline]
     pub fn choose<'a, T>(&mut self, slice: &'a [T]) -> &'a T {
         assert!(!slice.is_empty(), "cannot choose from an empty slice");
-        let idx = self.rng.random_range(0..slice.len());
-        &slice[idx]
+        &slice[self.choose_index(slice.len())]
+    }
+
+    /// Choose a random index into a slice of length `len`.
+    ///
+    /// Consumes the RNG exactly like [`ForgeryRng::choose`].
+    ///
+    /// # Panics
+    ///
+    /// Panics if `len` is zero.
+    #[inline]
+    pub fn choose_index(&mut self, len: usize) -> usize {
+        match u32::try_from(len) {
+            Ok(len) => self.bounded_u32(len) as usize,
+            Err(_) => self.rng.random_range(0..len),
+        }
+    }
+
+    /// Generate a uniformly random value in `0..bound`.
+    ///
+    /// Lemire's nearly-divisionless method: one `u32` draw and a widening
+    /// multiply, with the modulo for the rejection threshold only computed
+    /// in the rare case the draw lands in the biased zone.
+    ///
+    /// # Panics
+    ///
+    /// Panics if `bound` is zero.
+    #[inline]
+    pub fn bounded_u32(&mut self, bound: u32) -> u32 {
+        assert!(bound > 0, "cannot sample from an empty range");
+        let mut m = u64::from(self.next_u32()) * u64::from(bound);
+        if (m as u32) < bound {
+            let threshold = bound.wrapping_neg() % bound;
+            while (m as u32) < threshold {
+                m = u64::from(self.next_u32()) * u64::from(bound);
+            }
+        }
+        (m >> 32) as u32
+    }
+
+    /// Generate a uniformly random `u32`.
+    #[inline]
+    pub fn next_u32(&mut self) -> u32 {
+        self.rng.next_u32()
+    }
+
+    /// Generate a uniformly random `u64`.
+    #[inline]
+    pub fn next_u64(&mut self) -> u64 {
+        self.rng.next_u64()
     }
 
     /// Generate random bytes to fill the given buffer.
@@ -61,6 +145,22 @@ impl ForgeryRng {
     pub fn fill_bytes(&mut self, dest: &mut [u8]) {
         self.rng.fill(dest);
     }
+
+    /// Current position in the output stream, in 32-bit words.
+    ///
+    /// Together with [`ForgeryRng::set_word_pos`] this lets fixed-width
+    /// generators split a batch across threads while consuming exactly the
+    /// same part of the stream as a sequential loop would.
+    #[inline]
+    pub fn word_pos(&self) -> u128 {
+        self.rng.get_word_pos()
+    }
+
+    /// Jump to an absolute position in the output stream, in 32-bit words.
+    #[inline]
+    pub fn set_word_pos(&mut self, word_offset: u128) {
+        self.rng.set_word_pos(word_offset);
+    }
 }
 
 impl Default for ForgeryRng {
@@ -120,6 +220,17 @@ mod tests {
         rng.choose(empty);
     }
 
+    #[test]
+    fn test_unseeded_instances_are_independent() {
+        let mut rng1 = ForgeryRng::new();
+        let mut rng2 = ForgeryRng::new();
+
+        let values1: Vec<u64> = (0..8).map(|_| rng1.next_u64()).collect();
+        let values2: Vec<u64> = (0..8).map(|_| rng2.next_u64()).collect();
+
+        assert_ne!(values1, values2);
+    }
+
     // Edge case tests
     #[test]
     fn test_default_trait() {
@@ -177,6 +288,23 @@ mod tests {
         assert_eq!(values1, values2);
     }
 
+    #[test]
+    fn test_state_round_trip() {
+        let mut rng = ForgeryRng::new();
+        rng.seed(42);
+        rng.next_u32(); // Leave the position mid-block
+
+        let state = rng.state();
+        let values1: Vec<u64> = (0..50).map(|_| rng.next_u64()).collect();
+
+        let mut restored = ForgeryRng::new();
+        restored.set_state(&state);
+        let values2: Vec<u64> = (0..50).map(|_| restored.next_u64()).collect();
+
+        assert_eq!(values1, values2);
+        assert_eq!(restored.state(), rng.state());
+    }
+
     #[test]
     fn test_gen_range_single_value() {
         let mut rng = ForgeryRng::new();
@@ -259,6 +387,30 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_bounded_u32_in_range_and_covers_all_values() {
+        let mut rng = ForgeryRng::new();
+        rng.seed(42);
+
+        let mut seen = [false; 7];
+        for _ in 0..1000 {
+            let value = rng.bounded_u32(7);
+            assert!(value < 7);
+            seen[value as usize] = true;
+        }
+        assert!(seen.iter().all(|&s| s));
+
+        // A bound of 1 always yields 0
+        assert_eq!(rng.bounded_u32(1), 0);
+    }
+
+    #[test]
+    #[should_panic(expected = "cannot sample from an empty range")]
+    fn test_bounded_u32_zero_panics() {
+        let mut rng = ForgeryRng::new();
+        rng.bounded_u32(0);
+    }
+
     #[test]
     fn test_fill_bytes_various_sizes() {
         let mut rng = ForgeryRng::new();
@@ -300,6 +452,27 @@ mod tests {
         assert_eq!(buf1, buf2);
     }
 
+    #[test]
+    fn test_set_word_pos_matches_sequential_fill() {
+        let mut sequential = ForgeryRng::new();
+        sequential.seed(42);
+        let start = sequential.word_pos();
+
+        let mut first = [0u8; 16];
+        let mut second = [0u8; 16];
+        sequential.fill_bytes(&mut first);
+        sequential.fill_bytes(&mut second);
+        assert_eq!(sequential.word_pos(), start + 8);
+
+        let mut jumped = ForgeryRng::new();
+        jumped.seed(42);
+        jumped.set_word_pos(start + 4);
+        let mut buf = [0u8; 16];
+        jumped.fill_bytes(&mut buf);
+
+        assert_eq!(buf, second);
+    }
+
     #[test]
     fn test_gen_range_with_floats() {
         let mut rng = ForgeryRng::new();
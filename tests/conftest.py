@@ -7,7 +7,12 @@ from forgery import Faker, seed
 
 @pytest.fixture(autouse=True)
 def reset_seed() -> None:
-    """Reset the module-level seed before each test."""
+    """Reset the module-level seed before each test.
+
+    Module-level functions all share the default ``fake`` instance, so this
+    stays per-test rather than per-module to keep one test's draws from
+    shifting the next test's output. Reseeding is a single ChaCha re-key.
+    """
     seed(0)
 
 
@@ -17,3 +22,15 @@ def faker() -> Faker:
     fake = Faker()
     fake.seed(42)
     return fake
+
+
+@pytest.fixture(scope="session")
+def uuids_100k() -> list[str]:
+    """Generate 100,000 UUIDs from seed 42 once per test session.
+
+    Uses its own Faker so building the batch never touches the module-level
+    RNG state. Callers must not mutate the returned list.
+    """
+    fake = Faker()
+    fake.seed(42)
+    return fake.uuids(100_000)
@@ -17,13 +17,9 @@ from forgery import (
 class TestRecordsAsync:
     """Tests for records_async() function."""
 
-    @pytest.mark.asyncio
-    async def test_basic_generation(self) -> None:
+    async def test_basic_generation(self, faker: Faker) -> None:
         """Test basic async record generation."""
-        fake = Faker()
-        fake.seed(42)
-
-        records = await fake.records_async(100, {"name": "name", "email": "email"})
+        records = await faker.records_async(100, {"name": "name", "email": "email"})
 
         assert len(records) == 100
         for record in records:
@@ -32,7 +28,6 @@ class TestRecordsAsync:
             assert isinstance(record["name"], str)
             assert isinstance(record["email"], str)
 
-    @pytest.mark.asyncio
     async def test_determinism(self) -> None:
         """Test that async generation is deterministic with same seed."""
         fake1 = Faker()
@@ -45,7 +40,6 @@ class TestRecordsAsync:
 
         assert records1 == records2
 
-    @pytest.mark.asyncio
     async def test_same_as_sync(self) -> None:
         """Test that async produces same results as sync with same seed."""
         fake1 = Faker()
@@ -58,7 +52,6 @@ class TestRecordsAsync:
 
         assert sync_records == async_records
 
-    @pytest.mark.asyncio
     async def test_empty_generation(self) -> None:
         """Test generating zero records."""
         fake = Faker()
@@ -67,18 +60,13 @@ class TestRecordsAsync:
 
         assert records == []
 
-    @pytest.mark.asyncio
-    async def test_custom_chunk_size(self) -> None:
+    async def test_custom_chunk_size(self, faker: Faker) -> None:
         """Test generation with custom chunk size."""
-        fake = Faker()
-        fake.seed(42)
-
         # Small chunk size to test chunking behavior
-        records = await fake.records_async(100, {"name": "name"}, chunk_size=10)
+        records = await faker.records_async(100, {"name": "name"}, chunk_size=10)
 
         assert len(records) == 100
 
-    @pytest.mark.asyncio
     async def test_module_level_function(self) -> None:
         """Test module-level records_async function."""
         seed(42)
@@ -90,34 +78,32 @@ class TestRecordsAsync:
             assert "name" in record
             assert "uuid" in record
 
-    @pytest.mark.asyncio
-    async def test_allows_concurrent_tasks(self) -> None:
+    async def test_allows_concurrent_tasks(self, faker: Faker) -> None:
         """Test that async generation allows other tasks to run."""
-        fake = Faker()
-        fake.seed(42)
+        n = 100_000
         other_task_ran = False
+        generation_pending = False
+
+        # Start generation first, then run another task; it should get to run
+        # while the batch is still in flight, not only after it completes.
+        # Using small chunk size to ensure yielding
+        pending = asyncio.ensure_future(faker.records_async(n, {"name": "name"}, chunk_size=100))
 
         async def other_task() -> None:
-            nonlocal other_task_ran
+            nonlocal other_task_ran, generation_pending
             await asyncio.sleep(0)  # Yield control
             other_task_ran = True
+            generation_pending = not pending.done()
 
-        # Run generation and other task concurrently
-        # Using small chunk size to ensure yielding
-        results, _ = await asyncio.gather(
-            fake.records_async(1000, {"name": "name"}, chunk_size=100),
-            other_task(),
-        )
+        await other_task()
+        results = await pending
 
         assert other_task_ran
-        assert len(results) == 1000
+        assert generation_pending, "other task only ran after generation finished"
+        assert len(results) == n
 
-    @pytest.mark.asyncio
-    async def test_with_all_field_types(self) -> None:
+    async def test_with_all_field_types(self, faker: Faker) -> None:
         """Test async generation with various field types."""
-        fake = Faker()
-        fake.seed(42)
-
         schema = {
             "name": "name",
             "email": "email",
@@ -127,7 +113,7 @@ class TestRecordsAsync:
             "bio": ("text", 10, 50),
         }
 
-        records = await fake.records_async(10, schema)
+        records = await faker.records_async(10, schema)
 
         assert len(records) == 10
         for record in records:
@@ -142,13 +128,9 @@ class TestRecordsAsync:
 class TestRecordsTuplesAsync:
     """Tests for records_tuples_async() function."""
 
-    @pytest.mark.asyncio
-    async def test_basic_generation(self) -> None:
+    async def test_basic_generation(self, faker: Faker) -> None:
         """Test basic async tuple generation."""
-        fake = Faker()
-        fake.seed(42)
-
-        records = await fake.records_tuples_async(100, {"age": ("int", 18, 65), "name": "name"})
+        records = await faker.records_tuples_async(100, {"age": ("int", 18, 65), "name": "name"})
 
         assert len(records) == 100
         for record in records:
@@ -157,7 +139,6 @@ class TestRecordsTuplesAsync:
             assert isinstance(record[0], int)  # age
             assert isinstance(record[1], str)  # name
 
-    @pytest.mark.asyncio
     async def test_determinism(self) -> None:
         """Test that async tuple generation is deterministic."""
         fake1 = Faker()
@@ -170,7 +151,6 @@ class TestRecordsTuplesAsync:
 
         assert records1 == records2
 
-    @pytest.mark.asyncio
     async def test_same_as_sync(self) -> None:
         """Test that async produces same results as sync."""
         fake1 = Faker()
@@ -183,7 +163,6 @@ class TestRecordsTuplesAsync:
 
         assert sync_records == async_records
 
-    @pytest.mark.asyncio
     async def test_module_level_function(self) -> None:
         """Test module-level records_tuples_async function."""
         seed(42)
@@ -196,19 +175,14 @@ class TestRecordsTuplesAsync:
 class TestRecordsArrowAsync:
     """Tests for records_arrow_async() function."""
 
-    @pytest.mark.asyncio
-    async def test_basic_generation(self) -> None:
+    async def test_basic_generation(self, faker: Faker) -> None:
         """Test basic async Arrow generation."""
-        fake = Faker()
-        fake.seed(42)
-
-        batch = await fake.records_arrow_async(100, {"name": "name", "age": ("int", 18, 65)})
+        batch = await faker.records_arrow_async(100, {"name": "name", "age": ("int", 18, 65)})
 
         assert isinstance(batch, pa.RecordBatch)
         assert batch.num_rows == 100
         assert batch.num_columns == 2
 
-    @pytest.mark.asyncio
     async def test_determinism(self) -> None:
         """Test that async Arrow generation is deterministic."""
         fake1 = Faker()
@@ -221,7 +195,6 @@ class TestRecordsArrowAsync:
 
         assert batch1.equals(batch2)
 
-    @pytest.mark.asyncio
     async def test_same_as_sync_when_n_less_than_chunk_size(self) -> None:
         """Test that async produces same results as sync when n <= chunk_size.
 
@@ -240,18 +213,13 @@ class TestRecordsArrowAsync:
 
         assert sync_batch.equals(async_batch)
 
-    @pytest.mark.asyncio
-    async def test_chunked_generation(self) -> None:
+    async def test_chunked_generation(self, faker: Faker) -> None:
         """Test Arrow generation with chunking."""
-        fake = Faker()
-        fake.seed(42)
-
         # Generate more records than chunk size
-        batch = await fake.records_arrow_async(1000, {"name": "name"}, chunk_size=100)
+        batch = await faker.records_arrow_async(1000, {"name": "name"}, chunk_size=100)
 
         assert batch.num_rows == 1000
 
-    @pytest.mark.asyncio
     async def test_arrow_chunked_differs_from_sync(self) -> None:
         """Document that Arrow async with n > chunk_size differs from sync.
 
@@ -275,7 +243,6 @@ class TestRecordsArrowAsync:
         # But the data is different due to column-major RNG consumption per chunk
         assert not sync_batch.equals(async_batch)
 
-    @pytest.mark.asyncio
     async def test_arrow_chunk_size_affects_output(self) -> None:
         """Document that different chunk_size values produce different output.
 
@@ -298,7 +265,6 @@ class TestRecordsArrowAsync:
         # Different chunking produces different data due to column-major interleaving
         assert not batch1.equals(batch2)
 
-    @pytest.mark.asyncio
     async def test_arrow_large_chunk_matches_sync(self) -> None:
         """Verify that setting chunk_size >= n produces sync-identical results."""
         fake1 = Faker()
@@ -316,7 +282,6 @@ class TestRecordsArrowAsync:
         # With chunk_size >= n, async matches sync exactly
         assert sync_batch.equals(async_batch)
 
-    @pytest.mark.asyncio
     async def test_module_level_function(self) -> None:
         """Test module-level records_arrow_async function."""
         seed(42)
@@ -327,19 +292,15 @@ class TestRecordsArrowAsync:
         assert batch.num_rows == 50
         assert batch.num_columns == 2
 
-    @pytest.mark.asyncio
-    async def test_column_types(self) -> None:
+    async def test_column_types(self, faker: Faker) -> None:
         """Test that Arrow columns have correct types."""
-        fake = Faker()
-        fake.seed(42)
-
         schema = {
             "age": ("int", 18, 65),
             "name": "name",
             "salary": ("float", 30000.0, 150000.0),
         }
 
-        batch = await fake.records_arrow_async(10, schema)
+        batch = await faker.records_arrow_async(10, schema)
 
         # Columns are in alphabetical order
         assert batch.schema.field(0).name == "age"
@@ -353,39 +314,31 @@ class TestRecordsArrowAsync:
 class TestAsyncWithCustomProviders:
     """Tests for async generation with custom providers."""
 
-    @pytest.mark.asyncio
-    async def test_records_async_with_custom_provider(self) -> None:
+    async def test_records_async_with_custom_provider(self, faker: Faker) -> None:
         """Test async records with custom provider."""
-        fake = Faker()
-        fake.seed(42)
-        fake.add_provider("department", ["Engineering", "Sales", "HR"])
+        faker.add_provider("department", ["Engineering", "Sales", "HR"])
 
-        records = await fake.records_async(100, {"name": "name", "dept": "department"})
+        records = await faker.records_async(100, {"name": "name", "dept": "department"})
 
         assert len(records) == 100
         for record in records:
             assert record["dept"] in ["Engineering", "Sales", "HR"]
 
-    @pytest.mark.asyncio
-    async def test_records_arrow_async_with_custom_provider(self) -> None:
+    async def test_records_arrow_async_with_custom_provider(self, faker: Faker) -> None:
         """Test async Arrow with custom provider."""
-        fake = Faker()
-        fake.seed(42)
-        fake.add_provider("status", ["active", "inactive"])
+        faker.add_provider("status", ["active", "inactive"])
 
-        batch = await fake.records_arrow_async(100, {"name": "name", "status": "status"})
+        batch = await faker.records_arrow_async(100, {"name": "name", "status": "status"})
 
         assert batch.num_rows == 100
         # Verify custom provider values
-        status_array = batch.column("status")
-        for i in range(batch.num_rows):
-            assert status_array[i].as_py() in ["active", "inactive"]
+        statuses = batch.column("status").to_pylist()
+        assert set(statuses) <= {"active", "inactive"}
 
 
 class TestAsyncErrorHandling:
     """Tests for async error handling."""
 
-    @pytest.mark.asyncio
     async def test_invalid_schema(self) -> None:
         """Test that invalid schema raises error."""
         fake = Faker()
@@ -393,7 +346,6 @@ class TestAsyncErrorHandling:
         with pytest.raises(ValueError):
             await fake.records_async(10, {"name": "invalid_type"})
 
-    @pytest.mark.asyncio
     async def test_batch_size_limit(self) -> None:
         """Test that batch size limit is enforced."""
         fake = Faker()
@@ -1,7 +1,19 @@
 """Tests for batch generation consistency."""
 
+import threading
+
+import pytest
+
 from forgery import Faker, seed
 
+# Check if pyarrow is available for arrow tests
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 class TestBatchSingleConsistency:
     """Tests that batch and single-value generation are consistent."""
@@ -84,6 +96,32 @@ class TestBatchSingleConsistency:
 
         assert batch == singles
 
+    def test_closed_set_batches_match_singles(self) -> None:
+        """Interned closed-set batches should match sequential single calls."""
+        for locale in ("en_US", "ja_JP"):
+            fake1 = Faker(locale)
+            fake2 = Faker(locale)
+
+            fake1.seed(42)
+            fake2.seed(42)
+
+            assert fake1.colors(20) == [fake2.color() for _ in range(20)]
+            assert fake1.cities(20) == [fake2.city() for _ in range(20)]
+            assert fake1.states(20) == [fake2.state() for _ in range(20)]
+            assert fake1.countries(20) == [fake2.country() for _ in range(20)]
+            assert fake1.jobs(20) == [fake2.job() for _ in range(20)]
+            assert fake1.bank_names(20) == [fake2.bank_name() for _ in range(20)]
+
+    def test_closed_set_batches_share_string_objects(self) -> None:
+        """Repeated values in a closed-set batch should be the same object."""
+        fake = Faker()
+        fake.seed(42)
+
+        colors = fake.colors(1000)
+        by_value: dict[str, str] = {}
+        for color in colors:
+            assert by_value.setdefault(color, color) is color
+
 
 class TestBatchPerformance:
     """Tests that batch operations are efficient."""
@@ -104,3 +142,222 @@ class TestBatchPerformance:
         assert emails(0) == []
         assert integers(0, 0, 100) == []
         assert uuids(0) == []
+
+    @pytest.mark.parametrize("n", [1, 3, 63, 64, 500])
+    def test_small_and_large_batches_match_singles(self, n: int) -> None:
+        """Small-batch and bulk code paths should produce the same values."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        assert fake1.names(n) == [fake2.name() for _ in range(n)]
+        assert fake1.emails(n) == [fake2.email() for _ in range(n)]
+        assert fake1.sentences(n, 6) == [fake2.sentence(6) for _ in range(n)]
+        assert fake1.paragraphs(n, 2) == [fake2.paragraph(2) for _ in range(n)]
+        assert fake1.texts(n, 20, 80) == [fake2.text(20, 80) for _ in range(n)]
+        assert fake1.uuids(n) == [fake2.uuid() for _ in range(n)]
+        assert fake1.md5s(n) == [fake2.md5() for _ in range(n)]
+        assert fake1.sha256s(n) == [fake2.sha256() for _ in range(n)]
+        assert fake1.ipv6s(n) == [fake2.ipv6() for _ in range(n)]
+        assert fake1.mac_addresses(n) == [fake2.mac_address() for _ in range(n)]
+        assert fake1.hex_colors(n) == [fake2.hex_color() for _ in range(n)]
+
+    def test_names_workers_reproducible(self) -> None:
+        """Sharded names should be reproducible for a given seed and worker count."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        assert fake1.names(1000, workers=4) == fake2.names(1000, workers=4)
+        fake1.seed(42)
+        fake2.seed(42)
+        assert fake1.names(10, workers=1) == fake2.names(10)
+
+        with pytest.raises(ValueError, match="workers"):
+            fake1.names(10, workers=0)
+
+    def test_names_workers_clamped_to_batch_size(self) -> None:
+        """Worker counts above n should be clamped to n."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        assert fake1.names(10, workers=256) == fake2.names(10, workers=10)
+        assert fake1.names(0, workers=256) == []
+
+    def test_names_workers_out_of_range(self) -> None:
+        """Worker counts above the cap should be rejected, not allocated."""
+        fake = Faker()
+        for workers in (257, 10**9, 2**63):
+            with pytest.raises(ValueError, match="between 1 and 256"):
+                fake.names(10, workers=workers)
+
+    def test_names_workers_with_unique_rejected(self) -> None:
+        """Sharding cannot guarantee uniqueness across streams."""
+        fake = Faker()
+        with pytest.raises(ValueError, match="unique"):
+            fake.names(10, unique=True, workers=2)
+        assert len(fake.names(10, unique=True, workers=1)) == 10
+
+    def test_names_into_matches_names(self) -> None:
+        """names_into should fill the list with the same names as names()."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        out: list[str] = []
+        fake1.names_into(10, out)
+        assert out == fake2.names(10)
+
+    def test_names_into_reuses_and_resizes_list(self) -> None:
+        """names_into should overwrite in place and resize to exactly n."""
+        fake = Faker()
+        fake.seed(42)
+
+        out = ["stale"] * 20
+        original = out
+        fake.names_into(5, out)
+        assert out is original
+        assert len(out) == 5
+        assert "stale" not in out
+
+        fake.names_into(8, out)
+        assert len(out) == 8
+        fake.names_into(0, out)
+        assert out == []
+
+
+class TestSharedInstanceContention:
+    """Tests for calling one Faker from two threads at once."""
+
+    def test_concurrent_calls_on_shared_instance_both_finish(self) -> None:
+        """Threads sharing an instance should wait for each other, not raise."""
+        fake = Faker()
+        fake.seed(42)
+        start = threading.Barrier(2)
+        results: dict[str, list[int]] = {}
+        errors: list[BaseException] = []
+
+        def run(label: str) -> None:
+            try:
+                start.wait()
+                lengths = []
+                for _ in range(5):
+                    lengths.append(len(fake.names(200_000)))
+                    lengths.append(len(fake.integers(200_000)))
+                    fake.name()
+                results[label] = lengths
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=run, args=(label,)) for label in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert results == {"a": [200_000] * 10, "b": [200_000] * 10}
+        # The instance is usable again once both threads have finished
+        assert isinstance(fake.name(), str)
+
+
+class TestIntegersArray:
+    """Tests for integers_array()."""
+
+    def test_matches_list_batch(self) -> None:
+        """integers_array should produce the same values as integers."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        values = fake1.integers_array(100, -50, 50)
+        assert values.typecode == "q"
+        assert values.tolist() == fake2.integers(100, -50, 50)
+
+    def test_empty_and_invalid(self) -> None:
+        """Empty batches are empty arrays; invalid ranges are rejected."""
+        from forgery import integers_array
+
+        assert len(integers_array(0)) == 0
+        with pytest.raises(ValueError):
+            integers_array(10, 100, 0)
+
+
+class TestIntegersIter:
+    """Tests for chunked integer streaming."""
+
+    def test_chunks_concatenate_to_batch(self) -> None:
+        """Concatenated chunks should equal a single integers() batch."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        chunks = list(fake1.integers_iter(1000, -5, 5, chunk=300))
+        assert [len(c) for c in chunks] == [300, 300, 300, 100]
+        assert [v for c in chunks for v in c] == fake2.integers(1000, -5, 5)
+
+    def test_empty_iter(self) -> None:
+        """n=0 should yield no chunks."""
+        from forgery import integers_iter
+
+        assert list(integers_iter(0)) == []
+
+    def test_invalid_arguments(self) -> None:
+        """Invalid ranges and chunk sizes should be rejected up front."""
+        from forgery import integers_iter
+
+        with pytest.raises(ValueError):
+            integers_iter(10, 100, 0)
+        with pytest.raises(ValueError):
+            integers_iter(10, chunk=0)
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+class TestNumericArrowBatches:
+    """Tests for integers_arrow() and floats_arrow()."""
+
+    def test_integers_arrow_matches_list_batch(self) -> None:
+        """integers_arrow should produce the same values as integers."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        array = fake1.integers_arrow(100, -50, 50)
+        assert array.type == pa.int64()
+        assert array.null_count == 0
+        assert array.to_pylist() == fake2.integers(100, -50, 50)
+
+    def test_floats_arrow_matches_list_batch(self) -> None:
+        """floats_arrow should produce the same values as floats."""
+        fake1 = Faker()
+        fake2 = Faker()
+        fake1.seed(42)
+        fake2.seed(42)
+
+        array = fake1.floats_arrow(100, 1.5, 2.5)
+        assert array.type == pa.float64()
+        assert array.to_pylist() == fake2.floats(100, 1.5, 2.5)
+
+    def test_empty_arrow_batches(self) -> None:
+        """Empty arrow batches should have length zero."""
+        from forgery import floats_arrow, integers_arrow
+
+        assert len(integers_arrow(0)) == 0
+        assert len(floats_arrow(0)) == 0
+
+    def test_arrow_batches_validate_arguments(self) -> None:
+        """Arrow batches should reject the same arguments as list batches."""
+        from forgery import floats_arrow, integers_arrow
+
+        with pytest.raises(ValueError):
+            integers_arrow(10, 100, 0)
+        with pytest.raises(ValueError):
+            floats_arrow(10, 1.0, 0.0)
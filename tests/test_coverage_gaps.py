@@ -5,6 +5,7 @@ This file contains tests to fill coverage gaps identified in the codebase analys
 """
 
 import re
+import string
 
 import pytest
 
@@ -306,22 +307,20 @@ class TestPhase2BatchSizeLimits:
 class TestCreditCardValidation:
     """Test credit card format and Luhn checksum validation from Python."""
 
+    # Map ASCII digits to their value, and to their Luhn value after doubling
+    DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+    LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
     def _validate_luhn(self, number: str) -> bool:
         """Validate a credit card number using the Luhn algorithm."""
-        digits = [int(c) for c in number if c.isdigit()]
-        if not digits:
+        if not (number.isascii() and number.isdigit()):
             return False
 
-        total = 0
-        double = False
-        for digit in reversed(digits):
-            if double:
-                digit *= 2
-                if digit > 9:
-                    digit -= 9
-            total += digit
-            double = not double
-
+        # Every second digit from the right is doubled
+        digits = number.encode()
+        total = sum(digits[-1::-2].translate(self.DIGIT_VALUES)) + sum(
+            digits[-2::-2].translate(self.LUHN_DOUBLED)
+        )
         return total % 10 == 0
 
     def test_credit_card_luhn_valid(self):
@@ -369,6 +368,10 @@ class TestCreditCardValidation:
 class TestIBANValidation:
     """Test IBAN format and checksum validation from Python."""
 
+    LETTER_DIGITS = str.maketrans(
+        {letter: str(value) for value, letter in enumerate(string.ascii_uppercase, 10)}
+    )
+
     def _validate_iban(self, iban: str) -> bool:
         """Validate an IBAN using ISO 7064 Mod 97-10."""
         clean = iban.replace(" ", "").upper()
@@ -377,19 +380,11 @@ class TestIBANValidation:
 
         # Move first 4 characters to end
         rearranged = clean[4:] + clean[:4]
+        if not (rearranged.isascii() and rearranged.isalnum()):
+            return False
 
-        # Convert letters to numbers
-        numeric = ""
-        for c in rearranged:
-            if c.isdigit():
-                numeric += c
-            elif c.isalpha():
-                numeric += str(ord(c) - ord("A") + 10)
-            else:
-                return False
-
-        # Calculate mod 97
-        remainder = int(numeric) % 97
+        # Convert letters to numbers (A=10, ..., Z=35) and calculate mod 97
+        remainder = int(rearranged.translate(self.LETTER_DIGITS)) % 97
         return remainder == 1
 
     def test_iban_checksum_valid(self):
@@ -465,14 +460,16 @@ class TestTextEdgeCases:
 class TestNetworkFormatValidation:
     """Test network-related format validation."""
 
+    IPV4_PATTERN = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
+    MAC_PATTERN = re.compile(r"^([0-9a-f]{2}:){5}[0-9a-f]{2}$")
+
     def test_ipv4_format_valid(self):
         """Test IPv4 addresses have correct format."""
         f = Faker()
         f.seed(42)
-        ipv4_pattern = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")
         for _ in range(100):
             ip = f.ipv4()
-            assert ipv4_pattern.match(ip), f"Invalid IPv4 format: {ip}"
+            assert self.IPV4_PATTERN.match(ip), f"Invalid IPv4 format: {ip}"
             octets = [int(o) for o in ip.split(".")]
             for octet in octets:
                 assert 0 <= octet <= 255, f"Octet out of range: {ip}"
@@ -493,10 +490,9 @@ class TestNetworkFormatValidation:
         """Test MAC addresses have correct format."""
         f = Faker()
         f.seed(42)
-        mac_pattern = re.compile(r"^([0-9a-f]{2}:){5}[0-9a-f]{2}$")
         for _ in range(100):
             mac = f.mac_address()
-            assert mac_pattern.match(mac), f"Invalid MAC format: {mac}"
+            assert self.MAC_PATTERN.match(mac), f"Invalid MAC format: {mac}"
 
     def test_url_format_valid(self):
         """Test URLs have correct format."""
@@ -511,14 +507,15 @@ class TestNetworkFormatValidation:
 class TestColorFormatValidation:
     """Test color format validation."""
 
+    HEX_PATTERN = re.compile(r"^#[0-9a-f]{6}$")
+
     def test_hex_color_format(self):
         """Test hex colors have correct format #RRGGBB."""
         f = Faker()
         f.seed(42)
-        hex_pattern = re.compile(r"^#[0-9a-f]{6}$")
         for _ in range(100):
             color = f.hex_color()
-            assert hex_pattern.match(color), f"Invalid hex color: {color}"
+            assert self.HEX_PATTERN.match(color), f"Invalid hex color: {color}"
 
     def test_rgb_color_values(self):
         """Test RGB color values are in range 0-255."""
@@ -623,3 +620,19 @@ class TestEmptyBatchesAllProviders:
         assert f.free_emails(0) == []
         assert f.credit_cards(0) == []
         assert f.ibans(0) == []
+
+
+class TestModuleLevelDispatch:
+    """Module-level functions should dispatch straight into the extension."""
+
+    def test_module_functions_are_bound_methods(self):
+        """Every exported function should be a bound method of forgery.fake."""
+        for name in forgery.__all__:
+            if name in ("Faker", "fake"):
+                continue
+            func = getattr(forgery, name)
+            assert func.__self__ is forgery.fake, name
+
+    def test_faker_has_no_instance_dict(self):
+        """Faker instances should not carry a __dict__ to search on method lookup."""
+        assert not hasattr(Faker(), "__dict__")
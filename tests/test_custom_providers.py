@@ -1,5 +1,7 @@
 """Tests for custom providers API (Phase 3.2)."""
 
+from collections import Counter
+
 import pytest
 
 from forgery import (
@@ -109,17 +111,40 @@ class TestCustomProviderGeneration:
 
         assert v1 == v2
 
+    @pytest.mark.parametrize("n", [2, 500])
+    def test_generate_batch_matches_singles(self, n: int) -> None:
+        """Batches should match sequential generate() calls."""
+        f1 = Faker()
+        f2 = Faker()
+        for f in (f1, f2):
+            f.add_provider("dept", ["a", "b", "c"])
+            f.add_weighted_provider("status", [("active", 3), ("inactive", 1)])
+            f.seed(42)
+
+        assert f1.generate_batch("dept", n) == [f2.generate("dept") for _ in range(n)]
+        assert f1.generate_batch("status", n) == [f2.generate("status") for _ in range(n)]
+
+    def test_generate_batch_shares_string_objects(self) -> None:
+        """Repeated values in a batch should be the same object."""
+        f = Faker()
+        f.seed(42)
+        f.add_provider("dept", ["Engineering", "Sales", "HR"])
+
+        by_value: dict[str, str] = {}
+        for value in f.generate_batch("dept", 1000):
+            assert by_value.setdefault(value, value) is value
+
     def test_weighted_distribution(self) -> None:
         """Weighted provider should follow distribution."""
         f = Faker()
         f.seed(42)
         f.add_weighted_provider("status", [("active", 90), ("inactive", 10)])
 
-        values = f.generate_batch("status", 10000)
-        active_count = values.count("active")
+        counts = Counter(f.generate_batch("status", 10000))
+        assert set(counts) <= {"active", "inactive"}
 
         # Should be roughly 90% (9000), allow some variance
-        assert 8500 < active_count < 9500
+        assert 8500 < counts["active"] < 9500
 
 
 class TestCustomProvidersInRecords:
@@ -169,6 +194,21 @@ class TestCustomProvidersInRecords:
         with pytest.raises(ValueError, match="Unknown type"):
             f.records(1, {"field": "nonexistent_provider"})
 
+    def test_records_sees_registry_changes(self) -> None:
+        """Reusing a schema should pick up added and removed providers."""
+        f = Faker()
+        schema = {"dept": "department"}
+
+        f.add_provider("department", ["Eng"])
+        assert f.records(2, schema) == [{"dept": "Eng"}] * 2
+
+        f.add_provider("department", ["Sales"])
+        assert f.records(2, schema) == [{"dept": "Sales"}] * 2
+
+        f.remove_provider("department")
+        with pytest.raises(ValueError, match="Unknown type"):
+            f.records(1, schema)
+
     def test_records_with_mixed_providers(self) -> None:
         """Mix of built-in and custom providers should work."""
         f = Faker()
@@ -226,10 +266,10 @@ class TestModuleLevelConvenience:
         add_weighted_provider("test_status", [("yes", 90), ("no", 10)])
         assert has_provider("test_status")
 
-        values = generate_batch("test_status", 1000)
-        yes_count = values.count("yes")
+        counts = Counter(generate_batch("test_status", 1000))
+        assert set(counts) <= {"yes", "no"}
         # Should be roughly 90% (900)
-        assert 800 < yes_count < 1000
+        assert 800 < counts["yes"] < 1000
 
         # Clean up
         remove_provider("test_status")
@@ -283,6 +323,13 @@ class TestModuleLevelConvenience:
         with pytest.raises(ValueError, match="must be non-negative"):
             add_weighted_provider("bad_provider", [("good", 10), ("bad", -5)])
 
+    def test_instance_negative_weight_fails(self) -> None:
+        """Faker.add_weighted_provider should raise ValueError, not OverflowError."""
+        fake = Faker()
+        with pytest.raises(ValueError, match="must be non-negative"):
+            fake.add_weighted_provider("bad_provider", [("good", 10), ("bad", -5)])
+        assert not fake.has_provider("bad_provider")
+
 
 class TestEdgeCases:
     """Edge case tests."""
@@ -198,6 +198,19 @@ class TestBoundaryConditions:
         assert integers(0, 0, 100) == []
         assert uuids(0) == []
 
+    def test_zero_batch_size_still_validates(self) -> None:
+        """Empty batches should reject invalid arguments like any other size."""
+        with pytest.raises(ValueError):
+            integers(0, 100, 0)
+        with pytest.raises(ValueError, match="not found"):
+            Faker().generate_batch("missing", 0)
+
+    def test_zero_batch_closed_set(self) -> None:
+        """Closed-set generators should return an empty list for n=0."""
+        fake = Faker()
+        assert fake.colors(0) == []
+        assert fake.countries(0) == []
+
     def test_one_item_batch(self) -> None:
         """Single item batch should work."""
         assert len(names(1)) == 1
@@ -57,10 +57,10 @@ class TestCrossLanguageConsistency:
 
         seed(42)
         result_uuids = uuids(100)
-        for u in result_uuids:
-            # Should be parseable by Python's uuid module
-            parsed = uuid_module.UUID(u)
-            assert str(parsed) == u
+        # Should be parseable by Python's uuid module and round-trip exactly
+        parsed = list(map(uuid_module.UUID, result_uuids))
+        assert list(map(str, parsed)) == result_uuids
+        assert all(p.version == 4 and p.variant == uuid_module.RFC_4122 for p in parsed)
 
     def test_integer_types(self) -> None:
         """Integers should be Python int type."""
@@ -309,24 +309,23 @@ class TestEdgeCasesIntegration:
 class TestDataQuality:
     """Tests for quality of generated data."""
 
+    # Output is ASCII-only, so match with ASCII semantics (\d is [0-9])
     UUID_PATTERN = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+        r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}", re.ASCII
     )
-    EMAIL_PATTERN = re.compile(r"^[a-z]+\d{3}@[a-z]+\.[a-z]+$")
+    EMAIL_PATTERN = re.compile(r"[a-z]+\d{3}@[a-z]+\.[a-z]+", re.ASCII)
 
-    def test_uuid_version_4_compliance(self) -> None:
+    def test_uuid_version_4_compliance(self, uuids_100k: list[str]) -> None:
         """All UUIDs should be valid version 4."""
-        seed(42)
-        result_uuids = uuids(1000)
-        for u in result_uuids:
-            assert self.UUID_PATTERN.match(u), f"Invalid UUID: {u}"
+        for u in uuids_100k:
+            assert self.UUID_PATTERN.fullmatch(u), f"Invalid UUID: {u}"
 
     def test_email_format_compliance(self) -> None:
         """All emails should match expected format."""
         seed(42)
         result_emails = emails(1000)
         for e in result_emails:
-            assert self.EMAIL_PATTERN.match(e), f"Invalid email format: {e}"
+            assert self.EMAIL_PATTERN.fullmatch(e), f"Invalid email format: {e}"
 
     def test_name_format_compliance(self) -> None:
         """All names should be 'FirstName LastName' format."""
@@ -338,12 +337,10 @@ class TestDataQuality:
             assert parts[0][0].isupper(), f"First name should be capitalized: {n}"
             assert parts[1][0].isupper(), f"Last name should be capitalized: {n}"
 
-    def test_uuid_uniqueness_large_batch(self) -> None:
+    def test_uuid_uniqueness_large_batch(self, uuids_100k: list[str]) -> None:
         """UUIDs in a large batch should all be unique."""
-        seed(42)
-        result_uuids = uuids(100_000)
-        unique = set(result_uuids)
-        assert len(unique) == len(result_uuids), "UUIDs should be unique"
+        unique = set(uuids_100k)
+        assert len(unique) == len(uuids_100k), "UUIDs should be unique"
 
 
 class TestModuleLevelAPI:
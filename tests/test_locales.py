@@ -7,6 +7,12 @@ from forgery import Faker
 SUPPORTED_LOCALES = ["en_US", "en_GB", "de_DE", "fr_FR", "es_ES", "it_IT", "ja_JP"]
 
 
+@pytest.fixture(scope="module", params=SUPPORTED_LOCALES)
+def locale_fake(request: pytest.FixtureRequest) -> Faker:
+    """Provide one unseeded Faker per locale, shared by the smoke tests."""
+    return Faker(request.param)
+
+
 class TestLocaleInstantiation:
     """Test that Faker can be created with all supported locales."""
 
@@ -30,28 +36,22 @@ class TestLocaleInstantiation:
 class TestLocaleNames:
     """Test name generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_names_generation(self, locale: str) -> None:
+    def test_names_generation(self, locale_fake: Faker) -> None:
         """Names should be generated for all locales."""
-        fake = Faker(locale)
-        names = fake.names(10)
+        names = locale_fake.names(10)
         assert len(names) == 10
         assert all(isinstance(n, str) for n in names)
         assert all(len(n) > 0 for n in names)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_first_names_generation(self, locale: str) -> None:
+    def test_first_names_generation(self, locale_fake: Faker) -> None:
         """First names should be generated for all locales."""
-        fake = Faker(locale)
-        names = fake.first_names(10)
+        names = locale_fake.first_names(10)
         assert len(names) == 10
         assert all(isinstance(n, str) for n in names)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_last_names_generation(self, locale: str) -> None:
+    def test_last_names_generation(self, locale_fake: Faker) -> None:
         """Last names should be generated for all locales."""
-        fake = Faker(locale)
-        names = fake.last_names(10)
+        names = locale_fake.last_names(10)
         assert len(names) == 10
         assert all(isinstance(n, str) for n in names)
 
@@ -68,36 +68,28 @@ class TestLocaleNames:
 class TestLocaleAddresses:
     """Test address generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_addresses_generation(self, locale: str) -> None:
+    def test_addresses_generation(self, locale_fake: Faker) -> None:
         """Addresses should be generated for all locales."""
-        fake = Faker(locale)
-        addresses = fake.addresses(10)
+        addresses = locale_fake.addresses(10)
         assert len(addresses) == 10
         assert all(isinstance(a, str) for a in addresses)
         assert all(len(a) > 0 for a in addresses)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_cities_generation(self, locale: str) -> None:
+    def test_cities_generation(self, locale_fake: Faker) -> None:
         """Cities should be generated for all locales."""
-        fake = Faker(locale)
-        cities = fake.cities(10)
+        cities = locale_fake.cities(10)
         assert len(cities) == 10
         assert all(isinstance(c, str) for c in cities)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_states_generation(self, locale: str) -> None:
+    def test_states_generation(self, locale_fake: Faker) -> None:
         """States/regions should be generated for all locales."""
-        fake = Faker(locale)
-        states = fake.states(10)
+        states = locale_fake.states(10)
         assert len(states) == 10
         assert all(isinstance(s, str) for s in states)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_zip_codes_generation(self, locale: str) -> None:
+    def test_zip_codes_generation(self, locale_fake: Faker) -> None:
         """Zip/postal codes should be generated for all locales."""
-        fake = Faker(locale)
-        zips = fake.zip_codes(10)
+        zips = locale_fake.zip_codes(10)
         assert len(zips) == 10
         assert all(isinstance(z, str) for z in zips)
         assert all(len(z) > 0 for z in zips)
@@ -144,11 +136,9 @@ class TestLocalePostalCodeFormats:
 class TestLocalePhoneNumbers:
     """Test phone number generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_phone_numbers_generation(self, locale: str) -> None:
+    def test_phone_numbers_generation(self, locale_fake: Faker) -> None:
         """Phone numbers should be generated for all locales."""
-        fake = Faker(locale)
-        phones = fake.phone_numbers(10)
+        phones = locale_fake.phone_numbers(10)
         assert len(phones) == 10
         assert all(isinstance(p, str) for p in phones)
         assert all(len(p) > 0 for p in phones)
@@ -160,19 +150,15 @@ class TestLocalePhoneNumbers:
 class TestLocaleCompanies:
     """Test company generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_companies_generation(self, locale: str) -> None:
+    def test_companies_generation(self, locale_fake: Faker) -> None:
         """Companies should be generated for all locales."""
-        fake = Faker(locale)
-        companies = fake.companies(10)
+        companies = locale_fake.companies(10)
         assert len(companies) == 10
         assert all(isinstance(c, str) for c in companies)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_jobs_generation(self, locale: str) -> None:
+    def test_jobs_generation(self, locale_fake: Faker) -> None:
         """Job titles should be generated for all locales."""
-        fake = Faker(locale)
-        jobs = fake.jobs(10)
+        jobs = locale_fake.jobs(10)
         assert len(jobs) == 10
         assert all(isinstance(j, str) for j in jobs)
 
@@ -180,11 +166,9 @@ class TestLocaleCompanies:
 class TestLocaleEmails:
     """Test email generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_emails_generation(self, locale: str) -> None:
+    def test_emails_generation(self, locale_fake: Faker) -> None:
         """Emails should be generated for all locales."""
-        fake = Faker(locale)
-        emails = fake.emails(10)
+        emails = locale_fake.emails(10)
         assert len(emails) == 10
         assert all(isinstance(e, str) for e in emails)
         # All should have @ symbol
@@ -192,11 +176,9 @@ class TestLocaleEmails:
         # All should be lowercase
         assert all(e == e.lower() for e in emails)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_emails_are_ascii(self, locale: str) -> None:
+    def test_emails_are_ascii(self, locale_fake: Faker) -> None:
         """Emails should use ASCII-only characters."""
-        fake = Faker(locale)
-        emails = fake.emails(100)
+        emails = locale_fake.emails(100)
         for email in emails:
             assert email.isascii(), f"Non-ASCII email: {email}"
 
@@ -204,11 +186,9 @@ class TestLocaleEmails:
 class TestLocaleColors:
     """Test color generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_colors_generation(self, locale: str) -> None:
+    def test_colors_generation(self, locale_fake: Faker) -> None:
         """Color names should be generated for all locales."""
-        fake = Faker(locale)
-        colors = fake.colors(10)
+        colors = locale_fake.colors(10)
         assert len(colors) == 10
         assert all(isinstance(c, str) for c in colors)
 
@@ -216,21 +196,17 @@ class TestLocaleColors:
 class TestLocaleText:
     """Test text generation for all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_sentences_generation(self, locale: str) -> None:
+    def test_sentences_generation(self, locale_fake: Faker) -> None:
         """Sentences should be generated for all locales."""
-        fake = Faker(locale)
-        sentences = fake.sentences(10)
+        sentences = locale_fake.sentences(10)
         assert len(sentences) == 10
         assert all(isinstance(s, str) for s in sentences)
         # All should end with period
         assert all(s.endswith(".") for s in sentences)
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_paragraphs_generation(self, locale: str) -> None:
+    def test_paragraphs_generation(self, locale_fake: Faker) -> None:
         """Paragraphs should be generated for all locales."""
-        fake = Faker(locale)
-        paragraphs = fake.paragraphs(5)
+        paragraphs = locale_fake.paragraphs(5)
         assert len(paragraphs) == 5
         assert all(isinstance(p, str) for p in paragraphs)
 
@@ -378,17 +354,15 @@ class TestLocaleAddressFormats:
 class TestLocaleRecords:
     """Test record generation works with all locales."""
 
-    @pytest.mark.parametrize("locale", SUPPORTED_LOCALES)
-    def test_records_generation(self, locale: str) -> None:
+    def test_records_generation(self, locale_fake: Faker) -> None:
         """Records should work with all locales."""
-        fake = Faker(locale)
         schema = {
             "name": "name",
             "email": "email",
             "city": "city",
             "company": "company",
         }
-        records = fake.records(5, schema)
+        records = locale_fake.records(5, schema)
         assert len(records) == 5
         for record in records:
             assert "name" in record
@@ -1,6 +1,7 @@
 """Tests for Phase 2 providers."""
 
 import re
+import string
 
 import forgery
 from forgery import Faker
@@ -528,23 +529,30 @@ class TestDeterminism:
         assert fake1.iban() == fake2.iban()
 
 
+# Map ASCII digits to their value, and to their Luhn value after doubling
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+
+
 def validate_luhn(number: str) -> bool:
     """Validate a credit card number using the Luhn algorithm."""
-    digits = [int(d) for d in number if d.isdigit()]
-    if not digits:
+    if not (number.isascii() and number.isdigit()):
         return False
 
-    checksum = 0
-    for i, d in enumerate(reversed(digits)):
-        if i % 2 == 1:
-            d *= 2
-            if d > 9:
-                d -= 9
-        checksum += d
-
+    # Every second digit from the right is doubled
+    digits = number.encode()
+    checksum = sum(digits[-1::-2].translate(DIGIT_VALUES)) + sum(
+        digits[-2::-2].translate(LUHN_DOUBLED)
+    )
     return checksum % 10 == 0
 
 
+# Translation table replacing each IBAN letter with its two-digit value
+IBAN_LETTER_DIGITS = str.maketrans(
+    {letter: str(value) for value, letter in enumerate(string.ascii_uppercase, 10)}
+)
+
+
 def validate_iban(iban: str) -> bool:
     """Validate an IBAN using ISO 7064 Mod 97-10."""
     # Remove spaces and convert to uppercase
@@ -554,16 +562,8 @@ def validate_iban(iban: str) -> bool:
 
     # Move first 4 chars to end
     rearranged = clean[4:] + clean[:4]
+    if not (rearranged.isascii() and rearranged.isalnum()):
+        return False
 
-    # Convert letters to numbers
-    numeric = ""
-    for c in rearranged:
-        if c.isdigit():
-            numeric += c
-        elif c.isalpha():
-            numeric += str(ord(c) - ord("A") + 10)
-        else:
-            return False
-
-    # Check mod 97
-    return int(numeric) % 97 == 1
+    # Convert letters to numbers (A=10, ..., Z=35) and check mod 97
+    return int(rearranged.translate(IBAN_LETTER_DIGITS)) % 97 == 1
@@ -1,5 +1,7 @@
 """Tests for deterministic seeding."""
 
+import pytest
+
 from forgery import Faker, emails, integers, names, seed, uuids
 
 
@@ -134,6 +136,46 @@ class TestFakerInstanceSeeding:
         assert names1 == names3  # Same seed
         assert names1 != names2  # Different seed
 
+    def test_seeded_batches_match_seed_then_batch(self) -> None:
+        """*_seeded(n, s) should equal seed(s) followed by the plain batch."""
+        fake1 = Faker()
+        fake2 = Faker()
+
+        fake2.seed(42)
+        assert fake1.names_seeded(50, 42) == fake2.names(50)
+        fake2.seed(7)
+        assert fake1.emails_seeded(50, 7) == fake2.emails(50)
+        fake2.seed(7)
+        assert fake1.integers_seeded(50, 7, -10, 10) == fake2.integers(50, -10, 10)
+        fake2.seed(7)
+        assert fake1.uuids_seeded(50, 7) == fake2.uuids(50)
+
+        # The RNG continues from the seeded state afterwards
+        assert fake1.uuids(5) == fake2.uuids(5)
+
+    def test_set_state_replays_sequence(self) -> None:
+        """Restoring a saved state should replay the same sequence."""
+        fake1 = Faker()
+        fake1.seed(42)
+        fake1.names(7)  # Advance past the seed point
+
+        state = fake1.get_state()
+        names1 = fake1.names(50)
+        emails1 = fake1.emails(50)
+
+        fake2 = Faker()
+        fake2.set_state(state)
+        assert fake2.names(50) == names1
+        assert fake2.emails(50) == emails1
+        assert fake2.get_state() == fake1.get_state()
+
+    def test_set_state_rejects_invalid_state(self) -> None:
+        """set_state should reject bytes that are not a state snapshot."""
+        fake = Faker()
+
+        with pytest.raises(ValueError, match="state must be"):
+            fake.set_state(b"not a state")
+
 
 class TestSeedEdgeCases:
     """Tests for seeding edge cases."""